@@ -0,0 +1,216 @@
+#******************************************************************************
+# Benchmarks.py                                     Author: Curtis Smith
+# Written in Python 3.2
+#
+# Times pyker's hot paths with fixed seeds and writes the results as JSON.
+# A saved run can be used as a baseline to flag slowdowns:
+#     python benchmarks/Benchmarks.py --output baseline.json
+#     python benchmarks/Benchmarks.py --compare baseline.json
+#******************************************************************************
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "pyker"))
+
+import BlindLevel
+import GameEngine
+import HandDistribution
+import HandRanking
+import Levels
+import PlayingCards
+import PokerPlayer
+import PokerTable
+
+SEED = 20121 # Every benchmark builds its inputs from this seed.
+HANDS = 200  # Inputs per benchmark call.
+
+#------------------------------------------------------------------------------
+# Benchmarks. Each takes a seeded Random and returns a function to time and
+# the number of operations one call of that function performs.
+#------------------------------------------------------------------------------
+
+def dealtHands(rng, size):
+    ''' Returns HANDS random hands of size Card objects. '''
+    deck = PlayingCards.Deck().deck
+    return [[deck[i] for i in rng.sample(range(52), size)]
+            for n in range(HANDS)]
+
+def rankHandHiBench(size):
+    def bench(rng):
+        hands = dealtHands(rng, size)
+        def run():
+            for cards in hands:
+                HandRanking.rankHandHi(cards[:2], cards[2:])
+        return run, HANDS
+    return bench
+
+def scoreHandHiBench(size):
+    def bench(rng):
+        hands = [rng.sample(range(52), size) for n in range(HANDS)]
+        def run():
+            for cards in hands:
+                HandRanking.scoreHandHi(cards[:2], cards[2:])
+        return run, HANDS
+    return bench
+
+def deckShuffleBench(rng):
+    deck = PlayingCards.Deck(seed = rng.random())
+    def run():
+        deck.shuffle()
+    return run, 1
+
+def deckNewBench(rng):
+    def run():
+        PlayingCards.Deck()
+    return run, 1
+
+def deckDealBench(lazy):
+    def bench(rng):
+        deck = PlayingCards.Deck(seed = rng.random(), lazy = lazy)
+        def run():
+            deck.shuffle()
+            cards = deck.deal(23) # A 9-handed hold'em hand.
+            deck.deck += cards
+        return run, 1
+    return bench
+
+def rankedHands(rng):
+    return [HandRanking.rankHandHi(cards[:2], cards[2:])
+            for cards in dealtHands(rng, 7)]
+
+def handRankCompareBench(rng):
+    ranks = rankedHands(rng)
+    pairs = list(zip(ranks, ranks[1:]))
+    def run():
+        for a, b in pairs:
+            a < b
+            a == b
+    return run, len(pairs)
+
+def handRankSortBench(rng):
+    ranks = rankedHands(rng)
+    def run():
+        sorted(ranks)
+    return run, 1
+
+def showdownBench(rng):
+    ''' Deals a 9-handed hold'em hand, ranks every player and finds the
+        winners, all from Card objects. '''
+    deck = PlayingCards.Deck(seed = rng.random(), lazy = True)
+    def run():
+        cards = deck.deal(23)
+        board = cards[18:]
+        ranks = [HandRanking.rankHandHi(cards[i:i + 2], board)
+                for i in range(0, 18, 2)]
+        best = max(ranks)
+        [r for r in ranks if r == best]
+        deck.deck += cards
+    return run, 1
+
+def gameEngineBench(players):
+    ''' Plays hands between random policies with deep stacks. '''
+    def bench(rng):
+        table = PokerTable.Table(players)
+        for seat in table.seats:
+            seat.addPlayer(PokerPlayer.PokerPlayer("bot"), 10 ** 9)
+        levels = Levels.Levels(20, True)
+        levels.addLevel(BlindLevel.BlindLevel(2, 1, 0, 0))
+        policies = [GameEngine.randomPolicy(rng.random())
+                    for i in range(players)]
+        engine = GameEngine.GameEngine(table, levels, policies, rng.random())
+        def run():
+            engine.playHands(HANDS)
+        return run, HANDS
+    return bench
+
+def handDistributionBench(rng):
+    ''' Counts the hand categories of every combo on a random flop. '''
+    board = rng.sample(range(PlayingCards.DECKSIZE), 3)
+    def run():
+        HandDistribution.HandDistribution(board)
+    return run, 1
+
+BENCHMARKS = [  ("rankHandHi.5", rankHandHiBench(5)),
+                ("rankHandHi.6", rankHandHiBench(6)),
+                ("rankHandHi.7", rankHandHiBench(7)),
+                ("scoreHandHi.7", scoreHandHiBench(7)),
+                ("Deck.new", deckNewBench),
+                ("Deck.shuffle", deckShuffleBench),
+                ("Deck.deal.9handed", deckDealBench(False)),
+                ("Deck.deal.9handed.lazy", deckDealBench(True)),
+                ("HandRank.compare", handRankCompareBench),
+                ("HandRank.sort", handRankSortBench),
+                ("showdown.9handed", showdownBench),
+                ("GameEngine.2handed", gameEngineBench(2)),
+                ("GameEngine.6handed", gameEngineBench(6)),
+                ("HandDistribution.flop", handDistributionBench)    ]
+
+#------------------------------------------------------------------------------
+# Running and comparing.
+#------------------------------------------------------------------------------
+
+def runBenchmarks(names = None, repeat = 5, minTime = 0.2):
+    ''' Runs the benchmarks (all of them, or those named) and returns a dict
+        of name -> best seconds per operation over repeat timings. '''
+    results = {}
+    for name, bench in BENCHMARKS:
+        if names and name not in names:
+            continue
+        run, ops = bench(random.Random(SEED))
+        number = 1
+        while timeit.timeit(run, number = number) < minTime:
+            number *= 2
+        best = min(timeit.repeat(run, number = number, repeat = repeat))
+        results[name] = best / number / ops
+    return results
+
+def compareResults(results, baseline, threshold):
+    ''' Returns a list of (name, baseline, current, ratio) for every benchmark
+        more than threshold (ie. 0.1 for 10%) slower than the baseline. '''
+    slower = []
+    for name in sorted(results):
+        if name in baseline:
+            ratio = results[name] / baseline[name]
+            if ratio > 1 + threshold:
+                slower.append((name, baseline[name], results[name], ratio))
+    return slower
+
+def main():
+    parser = argparse.ArgumentParser(description = "pyker benchmarks.")
+    parser.add_argument("names", nargs = "*", help = "benchmarks to run")
+    parser.add_argument("--output", help = "write the results to this file")
+    parser.add_argument("--compare", help = "baseline results to compare to")
+    parser.add_argument("--threshold", type = float, default = 0.1,
+                        help = "slowdown ratio to flag (default 0.1 = 10%%)")
+    parser.add_argument("--repeat", type = int, default = 5)
+    args = parser.parse_args()
+    results = runBenchmarks(args.names, args.repeat)
+    report = {  "python": platform.python_version(),
+                "machine": platform.machine(),
+                "seed": SEED,
+                "seconds_per_op": results   }
+    text = json.dumps(report, indent = 2, sort_keys = True)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["seconds_per_op"]
+        slower = compareResults(results, baseline, args.threshold)
+        for name, old, new, ratio in slower:
+            sys.stderr.write("SLOWER %s: %.3gs -> %.3gs (%.2fx)\n" %
+                            (name, old, new, ratio))
+        if slower:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+#******************************************************************************
+# ObjectModelBenchmark.py                           Author: Curtis Smith
+# Written in Python 3.2
+#
+# Measures the memory and construction time of decks, hands and hand ranks
+# against the old object model, where every Deck built 52 new cards (each
+# with its own Rank and Suit) and every object carried a __dict__.
+# Run from anywhere: python benchmarks/ObjectModelBenchmark.py
+#******************************************************************************
+
+import argparse
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "pyker"))
+
+import HandRanks
+import PlayingCards
+import PokerTable
+
+#------------------------------------------------------------------------------
+# The old object model. The dict versions of Hand and HandRank are subclasses
+# that don't declare __slots__, so they get a __dict__ back.
+#------------------------------------------------------------------------------
+
+class OldRank:
+    def __init__(self, rank):
+        self.rank = rank
+
+class OldSuit:
+    def __init__(self, suit):
+        self.suit = suit
+
+class OldCard:
+    def __init__(self, rank, suit):
+        self.rank = OldRank(rank)
+        self.suit = OldSuit(suit)
+
+def oldDeck():
+    return [OldCard(j, i) for i in range(1, 5) for j in range(2, 15)]
+
+def newDeck():
+    return PlayingCards.Deck().deck
+
+class DictHand(PokerTable.Hand):
+    pass
+
+class DictPair(HandRanks.Pair):
+    pass
+
+CARDS = [PlayingCards.Card.fromInt(c) for c in (0, 13, 5, 7, 40)]
+
+def oldHandRank():
+    return DictPair(CARDS)
+
+def newHandRank():
+    return HandRanks.Pair(CARDS)
+
+CASES = [   ("Deck", oldDeck, newDeck),
+            ("Hand", DictHand, PokerTable.Hand),
+            ("HandRank", oldHandRank, newHandRank)  ]
+
+#------------------------------------------------------------------------------
+# Measuring.
+#------------------------------------------------------------------------------
+
+def memoryUsed(make, count):
+    ''' Returns the bytes allocated per object to keep count objects from
+        make() alive. '''
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [make() for i in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+    return used / count
+
+def timeUsed(make, count):
+    ''' Returns the best seconds per call of make() over a few timings. '''
+    return min(timeit.repeat(make, number = count, repeat = 5)) / count
+
+def main():
+    parser = argparse.ArgumentParser(description = "Object model benchmark.")
+    parser.add_argument("--count", type = int, default = 10000,
+                        help = "objects built per measurement")
+    args = parser.parse_args()
+    print("object\told bytes\tnew bytes\tsaved\told us\tnew us\tspeedup")
+    for name, old, new in CASES:
+        oldBytes = memoryUsed(old, args.count)
+        newBytes = memoryUsed(new, args.count)
+        oldTime = timeUsed(old, args.count)
+        newTime = timeUsed(new, args.count)
+        print("%s\t%.0f\t%.0f\t%.0f%%\t%.2f\t%.2f\t%.1fx" % (name, oldBytes,
+                newBytes, 100 * (1 - newBytes / oldBytes), oldTime * 1e6,
+                newTime * 1e6, oldTime / newTime))
+
+if __name__ == '__main__':
+    main()
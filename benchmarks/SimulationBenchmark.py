@@ -0,0 +1,58 @@
+#******************************************************************************
+# SimulationBenchmark.py                            Author: Curtis Smith
+# Written in Python 3.2
+#
+# Measures how SimulationRunner throughput scales with the number of worker
+# processes. Run from anywhere: python benchmarks/SimulationBenchmark.py
+#******************************************************************************
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "pyker"))
+
+import HandEvaluator
+import Simulation
+
+def workerCounts(maximum):
+    ''' Returns 1, 2, 4, ... up to and including maximum. '''
+    counts = []
+    n = 1
+    while n < maximum:
+        counts.append(n)
+        n *= 2
+    counts.append(maximum)
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description = "SimulationRunner scaling.")
+    parser.add_argument("--iterations", type = int, default = 400000,
+                        help = "equity trials per run")
+    parser.add_argument("--max-workers", type = int,
+                        default = multiprocessing.cpu_count())
+    parser.add_argument("--seed", type = int, default = 1)
+    args = parser.parse_args()
+    ranges = [[[12, 25]], [[11, 24]]] # AcAs vs KcKs
+    # Build the evaluator tables first, so the in-process 1 worker run
+    # doesn't pay for them while the forked workers inherit them.
+    HandEvaluator.buildTables()
+    base = None
+    print("workers\tseconds\ttrials/s\tspeedup\tefficiency")
+    for workers in workerCounts(args.max_workers):
+        # Several chunks per worker keeps every process busy to the end.
+        runner = Simulation.SimulationRunner(workers, args.seed, workers * 4)
+        start = time.perf_counter()
+        runner.equity(ranges, args.iterations)
+        elapsed = time.perf_counter() - start
+        rate = args.iterations / elapsed
+        if base is None:
+            base = rate
+        print("%d\t%.2f\t%.0f\t%.2f\t%.2f" % (workers, elapsed, rate,
+                rate / base, rate / base / workers))
+
+if __name__ == '__main__':
+    main()
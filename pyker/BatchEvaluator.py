@@ -0,0 +1,68 @@
+#******************************************************************************
+# BatchEvaluator.py                                 Author: Curtis Smith
+# Written in Python 3.2
+#
+# Vectorized version of HandEvaluator that scores whole NumPy arrays of hands
+# at once. Requires NumPy.
+#******************************************************************************
+
+import numpy
+
+import HandEvaluator
+
+#------------------------------------------------------------------------------
+# The flush table is the same 8192 entry table HandEvaluator uses. The
+# rank-product dictionary can't be indexed by an array, so the non-flush
+# table is stored as a sorted array of rank-count keys (sum of 5 ** rank over
+# the cards, unique because no rank appears more than 4 times) searched with
+# numpy.searchsorted, alongside the matching scores.
+#------------------------------------------------------------------------------
+
+RANK_KEYS = numpy.array([5 ** (i % 13) for i in range(52)], dtype = numpy.int64)
+CARD_SUITS = numpy.array([i // 13 for i in range(52)], dtype = numpy.int64)
+CARD_BITS = numpy.array([1 << (i % 13) for i in range(52)], dtype = numpy.int64)
+
+FLUSH_TABLE = None  # numpy copy of HandEvaluator.FLUSH_TABLE
+COUNT_KEYS = None   # Sorted rank-count keys for every 5-7 card rank multiset.
+COUNT_SCORES = None # Score for the key at the same position in COUNT_KEYS.
+
+def evaluate(cards):
+    ''' Scores an N x 5, N x 6 or N x 7 array of compact card ints. Returns
+        a tuple of two length N arrays: the scores (comparable exactly like
+        HandEvaluator.evaluate scores) and their HandRank rankValues. '''
+    if COUNT_KEYS is None:
+        buildTables()
+    cards = numpy.asarray(cards, dtype = numpy.int64)
+    if cards.ndim != 2 or not 5 <= cards.shape[1] <= 7:
+        raise ValueError("Cards must be an N x 5, 6 or 7 array.")
+    keys = RANK_KEYS[cards].sum(axis = 1)
+    scores = COUNT_SCORES[numpy.searchsorted(COUNT_KEYS, keys)]
+    suits = CARD_SUITS[cards]
+    bits = CARD_BITS[cards]
+    for suit in range(4):
+        # Ranks within a suit never repeat, so summing the bits ORs them.
+        mask = numpy.where(suits == suit, bits, 0).sum(axis = 1)
+        flush = FLUSH_TABLE[mask]
+        scores = numpy.where(flush > 0, flush, scores)
+    return scores, scores >> HandEvaluator.CATEGORY_SHIFT
+
+def buildTables():
+    ''' Builds the array tables from the HandEvaluator tables. '''
+    global FLUSH_TABLE, COUNT_KEYS, COUNT_SCORES
+    if HandEvaluator.RANK_TABLE is None:
+        HandEvaluator.buildTables()
+    keys = []
+    scores = []
+    for size in (5, 6, 7):
+        for counts in HandEvaluator.rankCounts(size):
+            key = 0
+            product = 1
+            for r in range(13):
+                key += counts[r] * 5 ** r
+                product *= HandEvaluator.PRIMES[r] ** counts[r]
+            keys.append(key)
+            scores.append(HandEvaluator.RANK_TABLE[product])
+    order = numpy.argsort(keys)
+    FLUSH_TABLE = numpy.array(HandEvaluator.FLUSH_TABLE, dtype = numpy.int64)
+    COUNT_KEYS = numpy.array(keys, dtype = numpy.int64)[order]
+    COUNT_SCORES = numpy.array(scores, dtype = numpy.int64)[order]
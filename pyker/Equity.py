@@ -0,0 +1,441 @@
+#******************************************************************************
+# Equity.py                                         Author: Curtis Smith
+# Written in Python 3.2
+#
+# Monte Carlo win/tie/lose equity for hole-card ranges against a board.
+#******************************************************************************
+
+import itertools
+import math
+import random
+import time
+
+import HandEvaluator
+import HandRange
+import HandRanking
+import PlayingCards
+
+BOARDSIZE = 5 # The number of community cards in a complete board.
+MAXATTEMPTS = 10000 # Collisions allowed when picking a trial's hole cards.
+
+toInt = PlayingCards.toInt # Accepts Card objects or compact card ints.
+
+class EquityResult:
+    ''' Holds the tallies of an equity run. For each player (in the order the
+        ranges were given):
+            wins : (int[]) trials won outright.
+            ties : (int[]) trials where the pot was split.
+            losses : (int[]) trials lost.
+            equity : (float[]) share of the pot won on average, ties split.
+            stdErr : (float[]) standard error of the equity estimate.
+        trials : (int) the number of trials run. '''
+    def __init__(self, players, exact = False):
+        self.trials = 0
+        self.exact = exact  # True if every runout was counted.
+        self.wins = [0] * players
+        self.ties = [0] * players
+        self.losses = [0] * players
+        self.shares = [0.0] * players   # Sum of pot shares won.
+        self.squares = [0.0] * players  # Sum of squared pot shares.
+
+    @property
+    def equity(self):
+        if not self.trials:
+            return [0.0] * len(self.shares)
+        return [s / self.trials for s in self.shares]
+
+    @property
+    def stdErr(self):
+        n = self.trials
+        if self.exact:
+            return [0.0] * len(self.shares)
+        if n < 2:
+            return [float("inf")] * len(self.shares)
+        errors = []
+        for s, sq in zip(self.shares, self.squares):
+            variance = max(sq - s * s / n, 0.0) / (n - 1)
+            errors.append(math.sqrt(variance / n))
+        return errors
+
+    def merge(self, other):
+        ''' Adds the tallies of another result for the same players. '''
+        self.trials += other.trials
+        for i in range(len(self.shares)):
+            self.wins[i] += other.wins[i]
+            self.ties[i] += other.ties[i]
+            self.losses[i] += other.losses[i]
+            self.shares[i] += other.shares[i]
+            self.squares[i] += other.squares[i]
+
+class EquityCalculator:
+    ''' Estimates each player's equity by dealing random runouts. Each player
+        has a range - a list of two-card hole card combos (Card objects or
+        compact card ints). A fixed hand is a range with a single combo. '''
+    def __init__(self, ranges, board = [], dead = [], seed = None):
+        ''' Takes the players' ranges, any known board cards, and any other
+            dead cards. seed seeds the calculator's own random generator. '''
+        if len(board) > BOARDSIZE:
+            raise ValueError("Board can't have more than 5 cards.")
+        self.board = [toInt(c) for c in board]
+        known = PlayingCards.cardMask(self.board + [toInt(c) for c in dead])
+        self.ranges = []
+        for combos in ranges:
+            live = []
+            for combo in combos:
+                combo = [toInt(c) for c in combo]
+                if not known & PlayingCards.cardMask(combo):
+                    live.append((combo, PlayingCards.cardMask(combo)))
+            if not live:
+                raise ValueError("A range has no combos left after removing "
+                                "dead cards.")
+            self.ranges.append(live)
+        deck = PlayingCards.Deck(compact = True)
+        deck.remove(self.board + [toInt(c) for c in dead])
+        self.stock = deck.deck
+        self.rng = random.Random(seed)
+        # Buffers reused by every trial: each player's 7 cards and score.
+        self.hands = [[0] * (2 + BOARDSIZE) for r in self.ranges]
+        for hand in self.hands:
+            hand[2:2 + len(self.board)] = self.board
+        self.scores = [0] * len(self.ranges)
+
+    def run(self, iterations = None, timeLimit = None, targetError = None,
+            checkEvery = 1000):
+        ''' Runs trials until iterations trials have run, timeLimit seconds
+            have passed, or the largest standard error falls to targetError,
+            whichever comes first (at least one must be given). The time and
+            error limits are checked every checkEvery trials. Returns an
+            EquityResult. '''
+        if iterations is None and timeLimit is None and targetError is None:
+            raise ValueError("Give an iteration count, time or error limit.")
+        result = EquityResult(len(self.ranges))
+        if timeLimit is not None:
+            deadline = time.time() + timeLimit
+        while iterations is None or result.trials < iterations:
+            batch = checkEvery
+            if iterations is not None:
+                batch = min(batch, iterations - result.trials)
+            self.runTrials(batch, result)
+            if timeLimit is not None and time.time() >= deadline:
+                break
+            if targetError is not None and max(result.stdErr) <= targetError:
+                break
+        return result
+
+    def runTrials(self, count, result):
+        ''' Runs count trials, adding their tallies to result. '''
+        rng = self.rng
+        randrange = rng.randrange
+        ranges = self.ranges
+        hands = self.hands
+        scores = self.scores
+        stock = self.stock
+        stockSize = len(stock)
+        start = 2 + len(self.board)
+        players = len(ranges)
+        evaluate = HandEvaluator.evaluate
+        wins, ties, losses = result.wins, result.ties, result.losses
+        shares, squares = result.shares, result.squares
+        for trial in range(count):
+            # Pick a hole card combo for each player that doesn't collide.
+            attempts = 0
+            used = 1
+            while used:
+                used = 0
+                for p in range(players):
+                    combo, mask = ranges[p][randrange(len(ranges[p]))]
+                    if used & mask:
+                        used = 1 # Collision; start again.
+                        break
+                    used |= mask
+                    hands[p][0] = combo[0]
+                    hands[p][1] = combo[1]
+                else:
+                    break
+                attempts += 1
+                if attempts > MAXATTEMPTS:
+                    raise ValueError("Ranges can't be dealt without sharing "
+                                    "cards.")
+            # Deal the rest of the board with a partial Fisher-Yates shuffle
+            # of the stock, skipping anything a player holds.
+            i = 0
+            slot = start
+            while slot < 2 + BOARDSIZE:
+                j = randrange(i, stockSize)
+                card = stock[j]
+                stock[j] = stock[i]
+                stock[i] = card
+                i += 1
+                if not used & (1 << card):
+                    for hand in hands:
+                        hand[slot] = card
+                    slot += 1
+            best = 0
+            winners = 0
+            for p in range(players):
+                score = evaluate(hands[p])
+                scores[p] = score
+                if score > best:
+                    best = score
+                    winners = 1
+                elif score == best:
+                    winners += 1
+            share = 1.0 / winners
+            for p in range(players):
+                if scores[p] == best:
+                    if winners == 1:
+                        wins[p] += 1
+                    else:
+                        ties[p] += 1
+                    shares[p] += share
+                    squares[p] += share * share
+                else:
+                    losses[p] += 1
+        result.trials += count
+
+def exactEquity(hands, board = [], dead = [], part = 0, parts = 1):
+    ''' Works out each player's exact equity by walking every remaining board
+        runout. Runouts that only differ by swapping suits that play the same
+        part for every hand (and the board and dead cards) always have the same
+        result, so only one runout of each such set is ranked and its tallies
+        are weighted by the size of the set. Returns an exact EquityResult
+        whose trials is the number of runouts. The work can be split by
+        giving each caller a different part out of parts; every parts-th
+        runout starting at part is walked, and the merged results of all the
+        parts equal the full result. '''
+    if len(board) > BOARDSIZE:
+        raise ValueError("Board can't have more than 5 cards.")
+    hands = [tuple(toInt(c) for c in hand) for hand in hands]
+    known = [toInt(c) for c in board] + [toInt(c) for c in dead]
+    held = [c for hand in hands for c in hand]
+    if len(set(held + known)) != len(held + known):
+        raise ValueError("Hands, board and dead cards must not share cards.")
+    deck = PlayingCards.Deck(compact = True)
+    deck.remove(held + known)
+    symmetries = suitSymmetries(hands + [known])
+    images = [[1 << (perm[c // 13] * 13 + c % 13) for c in range(52)]
+            for perm in symmetries if perm != (0, 1, 2, 3)]
+    order = len(symmetries)
+    board = tuple(toInt(c) for c in board)
+    players = len(hands)
+    result = EquityResult(players, exact = True)
+    wins, ties, losses = result.wins, result.ties, result.losses
+    shares, squares = result.shares, result.squares
+    scores = [0] * players
+    scoreHandHi = HandRanking.scoreHandHi
+    runouts = itertools.combinations(deck.deck, BOARDSIZE - len(board))
+    if parts > 1:
+        runouts = itertools.islice(runouts, part, None, parts)
+    for runout in runouts:
+        # Only rank the runout whose card mask is the smallest of its set,
+        # counting the symmetries that map it to itself to get its weight.
+        mask = 0
+        for c in runout:
+            mask |= 1 << c
+        fixed = 1
+        for image in images:
+            other = 0
+            for c in runout:
+                other |= image[c]
+            if other < mask:
+                break
+            if other == mask:
+                fixed += 1
+        else:
+            weight = order // fixed
+            cards = board + runout
+            best = 0
+            winners = 0
+            for p in range(players):
+                score = scoreHandHi(hands[p], cards)
+                scores[p] = score
+                if score > best:
+                    best = score
+                    winners = 1
+                elif score == best:
+                    winners += 1
+            share = 1.0 / winners
+            for p in range(players):
+                if scores[p] == best:
+                    if winners == 1:
+                        wins[p] += weight
+                    else:
+                        ties[p] += weight
+                    shares[p] += share * weight
+                    squares[p] += share * share * weight
+                else:
+                    losses[p] += weight
+            result.trials += weight
+    return result
+
+def suitSymmetries(cardSets):
+    ''' Returns every permutation of the 4 suits (as a tuple mapping suit
+        index to suit index) that maps each of the given sets of compact card
+        ints onto itself. '''
+    symmetries = []
+    for perm in itertools.permutations(range(4)):
+        for cards in cardSets:
+            mapped = set(perm[c // 13] * 13 + c % 13 for c in cards)
+            if mapped != set(cards):
+                break
+        else:
+            symmetries.append(perm)
+    return symmetries
+
+#------------------------------------------------------------------------------
+# Range against range. On each runout every combo in either range is scored
+# once, then each range is sorted by score and swept in step with the other:
+# the weight of the second range below (or level with) a first range combo is
+# a running total, less the weight of the combos that share a card with it,
+# which is kept per card. Each runout costs O((|A| + |B|) log n) rather than
+# a score per matchup.
+#------------------------------------------------------------------------------
+
+def rangeEquity(range1, range2, board = [], dead = [], runouts = None,
+                seed = None):
+    ''' Works out the equity of two HandRanges (or range texts) against
+        each other. Every remaining runout of the board is walked, or if
+        runouts is given that many runouts are picked at random with a
+        generator seeded with seed. Returns an EquityResult where a "trial"
+        is a matchup of a combo from each range on a runout (that doesn't use
+        their cards), counted by the product of the combos' weights, so
+        wins, ties, losses and trials are weighted counts. '''
+    if len(board) > BOARDSIZE:
+        raise ValueError("Board can't have more than 5 cards.")
+    if isinstance(range1, str):
+        range1 = HandRange.parse(range1)
+    if isinstance(range2, str):
+        range2 = HandRange.parse(range2)
+    board = [toInt(c) for c in board]
+    known = board + [toInt(c) for c in dead]
+    range1 = range1.removeDead(known)
+    range2 = range2.removeDead(known)
+    if not len(range1) or not len(range2):
+        raise ValueError("A range has no combos left after removing dead "
+                        "cards.")
+    deck = PlayingCards.Deck(compact = True)
+    deck.remove(known)
+    stock = deck.deck
+    missing = BOARDSIZE - len(board)
+    if runouts is None:
+        cardSets = itertools.combinations(stock, missing)
+    else:
+        rng = random.Random(seed)
+        cardSets = (rng.sample(stock, missing) for i in range(runouts))
+    combos = sorted(set(range1.combos) | set(range2.combos))
+    result = EquityResult(2, exact = runouts is None)
+    for runout in cardSets:
+        tallyRunout(board + list(runout), range1, range2, combos, result)
+    return result
+
+def scoreCombos(cards, combos):
+    ''' Returns a list of the score of each combo index with a board of 3
+        to 5 cards (0 for those in combos that use a board card, and those
+        not in combos). '''
+    if HandEvaluator.RANK_TABLE is None:
+        HandEvaluator.buildTables()
+    primes = HandEvaluator.CARD_PRIMES
+    suitOf = HandEvaluator.CARD_SUITS
+    bits = HandEvaluator.CARD_BITS
+    flushes = HandEvaluator.FLUSH_TABLE
+    ranks = HandEvaluator.RANK_TABLE
+    comboCards = HandRange.COMBOS
+    comboMasks = HandRange.COMBO_MASKS
+    mask = 0
+    product = 1
+    suits = [0, 0, 0, 0]
+    counts = [0, 0, 0, 0]
+    for c in cards:
+        mask |= 1 << c
+        product *= primes[c]
+        suits[suitOf[c]] |= bits[c]
+        counts[suitOf[c]] += 1
+    # Only a suit with 3 or more board cards can make a flush.
+    flushSuit = -1
+    for s in range(4):
+        if counts[s] >= 3:
+            flushSuit = s
+    scores = [0] * len(comboCards)
+    for index in combos:
+        if comboMasks[index] & mask:
+            continue
+        a, b = comboCards[index]
+        score = 0
+        if flushSuit >= 0:
+            suited = suits[flushSuit]
+            if suitOf[a] == flushSuit:
+                suited |= bits[a]
+            if suitOf[b] == flushSuit:
+                suited |= bits[b]
+            score = flushes[suited]
+        if not score:
+            score = ranks[product * primes[a] * primes[b]]
+        scores[index] = score
+    return scores
+
+def tallyRunout(cards, range1, range2, combos, result):
+    ''' Adds the weighted matchups of two ranges on a complete board to
+        result (see rangeEquity). '''
+    scores = scoreCombos(cards, combos)
+    comboCards = HandRange.COMBOS
+    hands1 = sorted((scores[c], c, w) for c, w in range1 if scores[c])
+    hands2 = sorted((scores[c], c, w) for c, w in range2 if scores[c])
+    weights2 = {}
+    total = 0.0
+    totalCard = [0.0] * 52  # Weight of range2 combos holding each card.
+    for score, c, w in hands2:
+        weights2[c] = w
+        a, b = comboCards[c]
+        total += w
+        totalCard[a] += w
+        totalCard[b] += w
+    below = 0.0             # Weight of range2 combos that score lower.
+    belowCard = [0.0] * 52
+    level = 0.0             # Weight of range2 combos that score the same.
+    levelCard = [0.0] * 52
+    levelScore = -1
+    j = 0
+    count2 = len(hands2)
+    wins, ties, losses = result.wins, result.ties, result.losses
+    shares, squares = result.shares, result.squares
+    for score, c, w in hands1:
+        if score != levelScore:
+            # Move the last level below, then gather the combos up to and
+            # including this score.
+            below += level
+            for n in range(52):
+                belowCard[n] += levelCard[n]
+                levelCard[n] = 0.0
+            level = 0.0
+            while j < count2 and hands2[j][0] < score:
+                other, c2, w2 = hands2[j]
+                a, b = comboCards[c2]
+                below += w2
+                belowCard[a] += w2
+                belowCard[b] += w2
+                j += 1
+            while j < count2 and hands2[j][0] == score:
+                other, c2, w2 = hands2[j]
+                a, b = comboCards[c2]
+                level += w2
+                levelCard[a] += w2
+                levelCard[b] += w2
+                j += 1
+            levelScore = score
+        a, b = comboCards[c]
+        same = weights2.get(c, 0.0) # The same combo is counted twice above.
+        matched = total - totalCard[a] - totalCard[b] + same
+        won = below - belowCard[a] - belowCard[b]
+        tied = level - levelCard[a] - levelCard[b] + same
+        lost = matched - won - tied
+        wins[0] += w * won
+        ties[0] += w * tied
+        losses[0] += w * lost
+        shares[0] += w * (won + tied / 2)
+        squares[0] += w * (won + tied / 4)
+        wins[1] += w * lost
+        ties[1] += w * tied
+        losses[1] += w * won
+        shares[1] += w * (lost + tied / 2)
+        squares[1] += w * (lost + tied / 4)
+        result.trials += w * matched
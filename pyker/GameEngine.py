@@ -0,0 +1,279 @@
+#******************************************************************************
+# GameEngine.py                                     Author: Curtis Smith
+# Written in Python 3.2
+#
+# Headless no-limit hand engine that plays hands at a PokerTable between
+# player policies, for bot-vs-bot simulation.
+#******************************************************************************
+
+import random
+
+import PlayingCards
+
+FOLD = -1   # Policy result: fold (a check if there is nothing to call,
+            # unless the seat is sitting out).
+CALL = 0    # Policy result: call, or check if there is nothing to call.
+            # Any larger result is the total to raise the street's bet to.
+
+STREETS = (0, 3, 1, 1) # Board cards dealt before each betting round.
+
+#------------------------------------------------------------------------------
+# Policies. A policy is called as policy(engine, seat, toCall, minRaise) when
+# the seat at index seat must act: toCall is the chips needed to call and
+# minRaise the smallest total a raise can make the street's bet. It returns
+# FOLD, CALL or the total to raise to (raises are capped at the seat's stack
+# and raised to minRaise when smaller, unless the seat is all-in). An all-in
+# raise smaller than a full raise doesn't reopen the betting: seats that have
+# already acted must call it or fold, and a raise from them counts as a call.
+# The engine (its table, street and bets) can be inspected but shouldn't be
+# changed.
+#------------------------------------------------------------------------------
+
+def callPolicy(engine, seat, toCall, minRaise):
+    ''' Checks or calls every bet. '''
+    return CALL
+
+def randomPolicy(seed = None, foldChance = 0.2, raiseChance = 0.1):
+    ''' Returns a policy that folds to a bet with probability foldChance,
+        makes the minimum raise with probability raiseChance and otherwise
+        calls, using its own random generator. '''
+    rand = random.Random(seed).random
+    def policy(engine, seat, toCall, minRaise):
+        r = rand()
+        if r < raiseChance:
+            return minRaise
+        if toCall and r < raiseChance + foldChance:
+            return FOLD
+        return CALL
+    return policy
+
+class GameEngine:
+    ''' Plays hands of no-limit hold'em at a Table: moves the button, posts
+        antes and blinds from the current BlindLevel, deals from a compact
+        lazy deck, runs the betting rounds with each seat's policy and
+        settles the pots with Table.showdown. Nothing is printed and no
+        strings are built while playing. '''
+    def __init__(self, table, levels, policies = None, seed = None,
+                secondsPerHand = 0, holeCards = 2, chipUnit = 1):
+        ''' Takes the table (with players seated), a Levels object holding at
+            least one BlindLevel, and a dict or list of policies by seat index
+            (callPolicy for any seat without one). The deck is replaced with a
+            compact lazy deck seeded with seed. The levels' clock advances
+            secondsPerHand after each hand (0 keeps the blinds fixed).
+            holeCards and chipUnit are passed on for dealing and splitting
+            pots; for games other than hold'em, set scoreHi and scoreLow to
+            the scorers Table.showdown should use. '''
+        if not levels.levels:
+            raise ValueError("Levels must have at least one BlindLevel.")
+        self.table = table
+        self.levels = levels
+        self.policies = [callPolicy] * len(table.seats)
+        if policies is not None:
+            if isinstance(policies, dict):
+                policies = policies.items()
+            else:
+                policies = enumerate(policies)
+            for i, policy in policies:
+                self.policies[i] = policy
+        table.deck = PlayingCards.Deck(compact = True, seed = seed,
+                                        lazy = True)
+        self.secondsPerHand = secondsPerHand
+        self.holeCards = holeCards
+        self.chipUnit = chipUnit
+        self.scoreHi = None
+        self.scoreLow = None
+        self.clock = 0      # Seconds of play simulated.
+        self.hands = 0      # Hands played.
+        self.street = 0     # 0 = preflop, 1 = flop, 2 = turn, 3 = river.
+        self.bets = [0] * len(table.seats) # Chips bet this street per seat.
+
+    def blindLevel(self):
+        ''' Returns the BlindLevel currently in play. '''
+        return self.levels.blindLevel()
+
+    def playHands(self, count):
+        ''' Plays count hands, stopping early if fewer than two players have
+            chips left. Returns the number of hands played. '''
+        for n in range(count):
+            if self.playHand() is None:
+                return n
+        return count
+
+    def playHand(self):
+        ''' Plays a single hand and returns the list of Pots from the
+            showdown, or None if fewer than two players have chips. Players
+            left without chips are removed from their seats. '''
+        policies = self.policies
+        steps = self.handSteps()
+        try:
+            request = next(steps)
+            while True:
+                request = steps.send(policies[request[0]](self, *request))
+        except StopIteration as done:
+            return done.value
+
+    #--------------------------------------------------------------------------
+    # A hand is played by the generator handSteps. Whenever a seat must act it
+    # yields (seat, toCall, minRaise) and expects the seat's action (as a
+    # policy would return it) to be sent back; it returns what playHand does.
+    # playHand answers with the seats' policies straight away, while other
+    # drivers (ie. TableServer) can wait for players to act.
+    #--------------------------------------------------------------------------
+
+    def handSteps(self):
+        ''' Generator that plays a single hand; see above. '''
+        table = self.table
+        seats = table.seats
+        table.moveButton()
+        table.resetState()
+        table.deck.reset()
+        total = len(seats)
+        # Seats in the hand, starting left of the button.
+        active = []
+        for n in range(1, total + 1):
+            i = (table.button + n) % total
+            seat = seats[i]
+            if seat.folded:
+                continue
+            if seat.chips <= 0:
+                seat.folded = True
+                continue
+            active.append(i)
+        if len(active) < 2:
+            return None
+        level = self.blindLevel()
+        bets = self.bets
+        for i in range(total):
+            bets[i] = 0
+        if level.ante:
+            for i in active:
+                self.post(i, level.ante)
+            for i in active:
+                bets[i] = 0 # Antes are dead money, not part of the bet.
+        if len(active) == 2:
+            # The button posts the small blind and acts first. active runs
+            # round from the left of the button, so the button (or, if it
+            # isn't dealt in, the nearest seat to its right) is last.
+            small, big, first = active[-1], active[0], 1
+        else:
+            small, big, first = active[0], active[1], 2 % len(active)
+        self.post(small, level.smallBlind)
+        self.post(big, level.bigBlind)
+        deck = table.deck
+        cards = deck.deal(self.holeCards * len(active))
+        for n in range(len(active)):
+            hand = seats[active[n]].hand
+            for c in cards[n * self.holeCards:(n + 1) * self.holeCards]:
+                hand.addCard(c)
+        board = table.board
+        for self.street in range(4):
+            if STREETS[self.street]:
+                board += deck.deal(STREETS[self.street])
+            if self.street:
+                for i in active:
+                    bets[i] = 0
+                betting = yield from self.bettingRound(active, 0, 0,
+                                                        level.bigBlind)
+            else:
+                betting = yield from self.bettingRound(active, first,
+                                            level.bigBlind, level.bigBlind)
+            if not betting:
+                break
+        for i in active:
+            # Seats that stood up without acting again (ie. all-in) fold too,
+            # as long as someone is left to win the pot.
+            if seats[i].sittingOut and not seats[i].folded and \
+                    table.playersInHand() > 1:
+                seats[i].folded = True
+        if table.playersInHand() > 1:
+            # Betting stopped with players all-in; run out the board.
+            if len(board) < 5:
+                board += deck.deal(5 - len(board))
+        pots = table.showdown(self.scoreHi, self.scoreLow, self.chipUnit)
+        for i in active:
+            if seats[i].chips <= 0:
+                seats[i].player = None
+        self.hands += 1
+        if self.secondsPerHand:
+            self.clock += self.secondsPerHand
+            self.levels.setLevel(self.clock)
+        return pots
+
+    def post(self, i, amount):
+        ''' Moves up to amount chips from seat i's stack into the pot. '''
+        seat = self.table.seats[i]
+        if amount > seat.chips:
+            amount = seat.chips
+        seat.chips -= amount
+        seat.wagered += amount
+        self.bets[i] += amount
+        self.table.pot += amount
+
+    def bettingRound(self, active, first, currentBet, minRaise):
+        ''' Generator that runs a betting round starting with active[first],
+            yielding for each action (see handSteps). currentBet is
+            the bet to match (the big blind preflop) and minRaise the size of
+            the smallest raise. Returns True if more than one player is left
+            in the hand and at least two can still bet, so the hand carries on
+            betting on later streets. '''
+        seats = self.table.seats
+        bets = self.bets
+        inHand = 0  # Seats that haven't folded.
+        canAct = 0  # Seats that haven't folded and aren't all-in.
+        for i in active:
+            seat = seats[i]
+            if not seat.folded:
+                inHand += 1
+                if seat.chips > 0:
+                    canAct += 1
+                    last = i
+        # Everyone who can act gets a turn, unless the only one left has
+        # nothing to call; a raise gives everyone else another one.
+        pending = canAct
+        if canAct == 1 and bets[last] >= currentBet:
+            pending = 0
+        fullBet = currentBet # The bet after the last full raise.
+        actedAt = {}        # Seat -> fullBet when it last acted.
+        n = first
+        count = len(active)
+        while pending and inHand > 1:
+            i = active[n]
+            n += 1
+            if n == count:
+                n = 0
+            seat = seats[i]
+            chips = seat.chips
+            if seat.folded or chips <= 0:
+                continue
+            pending -= 1
+            toCall = currentBet - bets[i]
+            if toCall > chips:
+                toCall = chips
+            action = yield (i, toCall, currentBet + minRaise)
+            if action == FOLD and (toCall > 0 or seat.sittingOut):
+                # A seat that has stood up folds even with nothing to call.
+                seat.folded = True
+                inHand -= 1
+                canAct -= 1
+                continue
+            canRaise = actedAt.get(i, -1) < fullBet
+            if action > currentBet and chips > toCall and canRaise:
+                raiseTo = action
+                if raiseTo < currentBet + minRaise:
+                    raiseTo = currentBet + minRaise
+                if raiseTo > bets[i] + chips:
+                    raiseTo = bets[i] + chips # All-in.
+                if raiseTo - currentBet >= minRaise:
+                    minRaise = raiseTo - currentBet
+                    fullBet = raiseTo
+                currentBet = raiseTo
+                self.post(i, raiseTo - bets[i])
+                pending = canAct - 1
+            elif toCall > 0:
+                self.post(i, toCall)
+            actedAt[i] = fullBet
+            if seat.chips <= 0:
+                canAct -= 1
+                if pending > canAct:
+                    pending = canAct # The all-in raiser doesn't act again.
+        return inHand > 1 and canAct > 1
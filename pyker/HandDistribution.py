@@ -0,0 +1,93 @@
+#******************************************************************************
+# HandDistribution.py                               Author: Curtis Smith
+# Written in Python 3.2
+#
+# Counts the hands (high card up to straight flush) that every hole card
+# combo makes on a board, for board texture analysis.
+#******************************************************************************
+
+import Equity
+import HandEvaluator
+import HandRange
+import Isomorphism
+import PlayingCards
+
+#------------------------------------------------------------------------------
+# Every combo is scored with the table driven evaluator (see
+# Equity.scoreCombos) and its category is the rankValue HandRanking would
+# give the hand, the top bits of the score. A flop leaves C(49,2) = 1176
+# combos and a river C(47,2) = 1081, a millisecond or two per board.
+#------------------------------------------------------------------------------
+
+CATEGORY_NAMES = dict((value, cls.__name__) for value, cls in
+                        HandEvaluator.CATEGORIES.items())
+ALLCOMBOS = range(len(HandRange.COMBOS))
+
+class HandDistribution:
+    ''' The hands the combos make on a board:
+            board : (int[]) the board as compact card ints.
+            scores : (int[1326]) each combo's score by combo index (see
+                     HandEvaluator and HandRange), 0 for combos not counted.
+            counts : (float[10]) combos making each category by rankValue (1
+                     for a high card up to 9 for a straight flush), weighted
+                     if a range was given.
+            total : (float) the combos counted. '''
+    def __init__(self, board, dead = [], hands = None):
+        ''' Takes a board of 3 to 5 Card objects or compact card ints and
+            counts every combo that doesn't use a board or dead card, or
+            only those in a HandRange (or range text) if hands is given. '''
+        if not 3 <= len(board) <= 5:
+            raise ValueError("Board must have 3 to 5 cards.")
+        self.board = [PlayingCards.toInt(c) for c in board]
+        if isinstance(hands, str):
+            hands = HandRange.parse(hands)
+        if dead:
+            if hands is None:
+                hands = HandRange.HandRange(ALLCOMBOS)
+            hands = hands.removeDead(dead)
+        combos = ALLCOMBOS if hands is None else hands.combos
+        self.scores = Equity.scoreCombos(self.board, combos)
+        counts = [0.0] * 10
+        scores = self.scores
+        shift = HandEvaluator.CATEGORY_SHIFT
+        if hands is None:
+            for score in scores:
+                if score:
+                    counts[score >> shift] += 1
+        else:
+            for c, w in hands:
+                if scores[c]:
+                    counts[scores[c] >> shift] += w
+        self.counts = counts
+        self.total = sum(counts)
+
+    def fraction(self, category):
+        ''' Returns the share of the combos counted making a category. '''
+        if not self.total:
+            return 0.0
+        return self.counts[category] / self.total
+
+    def combos(self, category):
+        ''' Returns the combo indices counted that make a category. '''
+        shift = HandEvaluator.CATEGORY_SHIFT
+        return [c for c, score in enumerate(self.scores)
+                if score and score >> shift == category]
+
+    def __str__(self):
+        lines = []
+        for category in range(9, 0, -1):
+            lines.append("%-14s%7.1f %5.1f%%" % (CATEGORY_NAMES[category],
+                        self.counts[category], 100 * self.fraction(category)))
+        return "\n".join(lines)
+
+def distributions(boards, dead = [], hands = None):
+    ''' Returns the HandDistribution of each board in a list, ie. every
+        canonical flop. '''
+    return [HandDistribution(board, dead, hands) for board in boards]
+
+def flopDistributions(dead = [], hands = None):
+    ''' Returns a list of (flop, multiplicity, HandDistribution) for every
+        canonical flop (see Isomorphism), which between them stand for all
+        22100 flops. '''
+    return [(flop, count, HandDistribution(flop, dead, hands))
+            for flop, count in Isomorphism.canonicalBoards(3)]
@@ -0,0 +1,220 @@
+#******************************************************************************
+# HandRange.py                                      Author: Curtis Smith
+# Written in Python 3.2
+#
+# Parses hole card range notation such as "QQ+, AKs, 76s-54s" into weighted
+# arrays of combo indices.
+#******************************************************************************
+
+import array
+
+import PlayingCards
+
+#------------------------------------------------------------------------------
+# Combos. Each of the 1326 two-card hole card combos has an index from 0-1325:
+# the combos (a, b) of compact card ints with a < b, in the order
+# (0, 1), (0, 2) ... (0, 51), (1, 2) ... (50, 51). COMBO_MASKS holds each
+# combo's card bitmask, so dead cards are removed from a whole range with one
+# AND per combo and no Card objects are ever built.
+#------------------------------------------------------------------------------
+
+COMBOS = [(a, b) for a in range(52) for b in range(a + 1, 52)]
+COMBO_MASKS = [(1 << a) | (1 << b) for a, b in COMBOS]
+COMBO_INDEX = [0] * (52 * 52) # a * 52 + b (either order) -> combo index.
+for index, (a, b) in enumerate(COMBOS):
+    COMBO_INDEX[a * 52 + b] = COMBO_INDEX[b * 52 + a] = index
+del index, a, b
+
+RANKS = "23456789TJQKA" # Rank characters by compact rank (card % 13).
+SUITS = "csdh"          # Suit characters by compact suit (card // 13).
+
+MAXCACHED = 4096 # Parsed ranges kept by parse before the oldest are dropped.
+CACHE = {}       # Range text -> HandRange
+
+def comboIndex(card1, card2):
+    ''' Returns the combo index of two hole cards (Card objects or compact
+        card ints, in either order). '''
+    return COMBO_INDEX[PlayingCards.toInt(card1) * 52 +
+                        PlayingCards.toInt(card2)]
+
+def comboCards(index):
+    ''' Returns the two compact card ints of a combo index, lowest first. '''
+    return COMBOS[index]
+
+def comboStr(index):
+    ''' Returns the short description of a combo, higher rank first, ie.
+        "AhKh" or "AcKs". '''
+    a, b = COMBOS[index]
+    if a % 13 > b % 13:
+        a, b = b, a
+    return PlayingCards.intStr(b) + PlayingCards.intStr(a)
+
+def classCombos(hi, lo, suited = None):
+    ''' Returns the combo indices of a hand class given its compact ranks
+        (0-12): a pair if hi == lo, otherwise the suited combos if suited is
+        True, the offsuit ones if it's False and both if it's None. '''
+    combos = []
+    for s1 in range(4):
+        for s2 in range(4):
+            if hi == lo and s1 >= s2 or hi != lo and (s1 == s2 and
+                    suited is False or s1 != s2 and suited is True):
+                continue
+            combos.append(COMBO_INDEX[(s1 * 13 + hi) * 52 + s2 * 13 + lo])
+    return combos
+
+class HandRange:
+    ''' A range of hole card combos, each with a weight (the share of the
+        combo's hands the range holds):
+            combos : (array of int) combo indices, ascending.
+            weights : (array of float) the weight of each combo.
+        Ranges from parse are shared, so methods return new ranges rather
+        than changing this one. '''
+    def __init__(self, combos = (), weights = None):
+        ''' Takes combo indices and their weights (1.0 each if not given).
+            '''
+        if weights is None:
+            weights = [1.0] * len(combos)
+        pairs = sorted(zip(combos, weights))
+        self.combos = array.array("H", [c for c, w in pairs])
+        self.weights = array.array("d", [w for c, w in pairs])
+
+    def __len__(self):
+        return len(self.combos)
+
+    def __iter__(self):
+        ''' Iterates over (combo index, weight) pairs. '''
+        return zip(self.combos, self.weights)
+
+    def total(self):
+        ''' Returns the number of combos in the range counted by weight. '''
+        return sum(self.weights)
+
+    def removeDead(self, dead):
+        ''' Returns the range without the combos that use any of the dead
+            cards (Card objects or compact card ints). '''
+        deadMask = PlayingCards.cardMask(PlayingCards.toInt(c) for c in dead)
+        masks = COMBO_MASKS
+        live = HandRange()
+        for c, w in zip(self.combos, self.weights):
+            if not masks[c] & deadMask:
+                live.combos.append(c)
+                live.weights.append(w)
+        return live
+
+    def hands(self):
+        ''' Returns the list of combos as pairs of compact card ints, ie. a
+            range for Equity.EquityCalculator. '''
+        return [COMBOS[c] for c in self.combos]
+
+    def __str__(self):
+        return ", ".join(comboStr(c) if w == 1.0 else
+                        comboStr(c) + ":" + str(w) for c, w in self)
+
+#------------------------------------------------------------------------------
+# Parsing. A range is a comma separated list of parts, each optionally
+# followed by ":weight" (a later part's weight replaces an earlier one's):
+#     QQ         a pair                 QQ+      QQ and every higher pair
+#     AKs, AKo   suited/offsuit combos  AK       both
+#     ATs+       ATs up to AKs          QQ-99    every pair from QQ to 99
+#     KTs-K8s    KTs, K9s and K8s       76s-54s  76s, 65s and 54s
+#     AhKh       a single combo
+#------------------------------------------------------------------------------
+
+def parse(text):
+    ''' Returns the HandRange for range text, reusing the range if the same
+        text has been parsed before. '''
+    hands = CACHE.get(text)
+    if hands is None:
+        hands = expand(text)
+        if len(CACHE) >= MAXCACHED:
+            del CACHE[next(iter(CACHE))] # Oldest first.
+        CACHE[text] = hands
+    return hands
+
+def expand(text):
+    ''' Parses range text into a new HandRange. Raises ValueError if the text
+        isn't valid range notation. '''
+    weights = {}
+    for part in text.replace(" ", "").split(","):
+        if not part:
+            continue
+        weight = 1.0
+        if ":" in part:
+            part, weight = part.split(":", 1)
+            try:
+                weight = float(weight)
+            except ValueError:
+                raise ValueError("Bad weight in range part: " + part)
+            if not 0.0 <= weight <= 1.0:
+                raise ValueError("Weights must be from 0 to 1: " + part)
+        for c in partCombos(part):
+            weights[c] = weight
+    combos = [c for c in weights if weights[c] > 0.0]
+    return HandRange(combos, [weights[c] for c in combos])
+
+def partCombos(part):
+    ''' Returns the combo indices of a single range part (no weight). '''
+    if len(part) == 4 and part[1] in SUITS and part[3] in SUITS:
+        cards = [cardFromStr(part[:2]), cardFromStr(part[2:])]
+        if cards[0] == cards[1]:
+            raise ValueError("A combo can't hold the same card twice: " + part)
+        return [COMBO_INDEX[cards[0] * 52 + cards[1]]]
+    if "-" in part:
+        first, last = [parseClass(p) for p in part.split("-", 1)]
+        if first[2] != last[2]:
+            raise ValueError("Both ends of a span must be the same kind: " +
+                            part)
+        if first[0] == first[1] and last[0] == last[1]:
+            steps = [(r, r) for r in spanRanks(first[0], last[0])]
+        elif first[0] == last[0] and first[0] not in (first[1], last[1]):
+            steps = [(first[0], r) for r in spanRanks(first[1], last[1])]
+        elif first[0] - first[1] == last[0] - last[1] and first[0] != first[1]:
+            gap = first[0] - first[1]
+            steps = [(r, r - gap) for r in spanRanks(first[0], last[0])]
+        else:
+            raise ValueError("Bad span in range: " + part)
+        combos = []
+        for hi, lo in steps:
+            combos += classCombos(hi, lo, first[2])
+        return combos
+    plus = part.endswith("+")
+    hi, lo, suited = parseClass(part[:-1] if plus else part)
+    if not plus:
+        return classCombos(hi, lo, suited)
+    if hi == lo:
+        steps = [(r, r) for r in range(hi, 13)]
+    else:
+        steps = [(hi, r) for r in range(lo, hi)]
+    combos = []
+    for hi, lo in steps:
+        combos += classCombos(hi, lo, suited)
+    return combos
+
+def parseClass(text):
+    ''' Returns (hi rank, lo rank, suited) for a hand class like "AKs", "T9"
+        or "22", with suited as for classCombos. '''
+    suited = None
+    if len(text) == 3 and text[2] in "so":
+        suited = text[2] == "s"
+        text = text[:2]
+    if len(text) != 2 or text[0].upper() not in RANKS or \
+            text[1].upper() not in RANKS:
+        raise ValueError("Bad hand class in range: " + text)
+    r1 = RANKS.index(text[0].upper())
+    r2 = RANKS.index(text[1].upper())
+    if r1 == r2 and suited is not None:
+        raise ValueError("A pair can't be suited or offsuit: " + text)
+    return max(r1, r2), min(r1, r2), suited
+
+def spanRanks(start, end):
+    ''' Returns the ranks from start to end inclusive, in either direction.
+        '''
+    if start < end:
+        return range(start, end + 1)
+    return range(end, start + 1)
+
+def cardFromStr(text):
+    ''' Returns the compact card int of a short description like "Ah". '''
+    if text[0].upper() not in RANKS or text[1] not in SUITS:
+        raise ValueError("Bad card in range: " + text)
+    return SUITS.index(text[1]) * 13 + RANKS.index(text[0].upper())
@@ -5,14 +5,43 @@
 # Contains methods that determine a hand's poker rank.
 #******************************************************************************
 
+import HandEvaluator
 import HandRanks
+import LowEvaluator
+import OmahaEvaluator
+import PlayingCards
+import RankCache
 
 MINSIZE = 5 # The minimum size of a valid poker hand.
 
+RANK_CACHE = None # RankCache in front of rankHandHi, if enabled.
+
+def enableCache(maxSize = 65536, policy = RankCache.LRU):
+    ''' Puts a RankCache of at most maxSize rankings in front of
+        rankHandHi, replacing any cache already there, and returns it (ie.
+        to read its hit and miss counters). Cached HandRanks are shared
+        between callers. '''
+    global RANK_CACHE
+    RANK_CACHE = RankCache.RankCache(rankCardsHi, maxSize, policy)
+    return RANK_CACHE
+
+def disableCache():
+    ''' Stops caching rankHandHi results. '''
+    global RANK_CACHE
+    RANK_CACHE = None
+
 def rankHandHi(hand, board):
     ''' Gives the hand a "High" ranking based on the rules of poker.
-        Returns a HandRank object. '''
-    cards = list(hand + board)
+        Returns a HandRank object. The cards may be Card objects or compact
+        card ints. '''
+    if RANK_CACHE is not None:
+        return RANK_CACHE.get(hand + board)
+    return rankCardsHi(hand + board)
+
+def rankCardsHi(cards):
+    ''' rankHandHi for the hand and board together, never cached. '''
+    cards = [PlayingCards.Card.fromInt(c) if isinstance(c, int) else c
+            for c in cards]
     sortHand(cards)
     checks = [  checkStraightFlush, checkQuads, checkFullHouse, checkFlush,
                 checkStraight, checkTrips, checkTwoPair, checkPair,
@@ -22,13 +51,65 @@ def rankHandHi(hand, board):
         if rank:
             return rank
 
-def rankHandLow(hand, board, straightsCount, eightOrBetter, acesLow): #NYI
+def scoreHandHi(hand, board):
+    ''' Gives a hand of compact card ints a "High" ranking without building
+        any objects. Returns an int that compares the same way as the
+        HandRank object rankHandHi would return (see HandEvaluator). '''
+    return HandEvaluator.evaluate(hand + board)
+
+def scoreHandsHi(cards):
+    ''' Batch version of scoreHandHi for an N x 5, 6 or 7 array of compact
+        card ints (hand and board together). Returns a tuple of NumPy arrays
+        holding the scores and their HandRank rankValues. Requires NumPy. '''
+    import BatchEvaluator
+    return BatchEvaluator.evaluate(cards)
+
+def rankOmahaHi(hand, board):
+    ''' Gives an Omaha hand (4 or 5 hole cards) a "High" ranking using exactly
+        two of its cards and three from the board. Returns a HandRank object.
+        The cards may be Card objects or compact card ints. '''
+    cards = OmahaEvaluator.bestHand([PlayingCards.toInt(c) for c in hand],
+                                    [PlayingCards.toInt(c) for c in board])
+    return rankHandHi(cards[:2], cards[2:])
+
+def scoreOmahaHi(hand, board):
+    ''' Omaha version of scoreHandHi for compact card ints. To settle many
+        hands on one board, use an OmahaEvaluator.OmahaBoard directly. '''
+    return OmahaEvaluator.evaluateOmaha(hand, board)
+
+def scoreOmahaLow(hand, board):
+    ''' Returns the eight-or-better (ace-to-five) low key of an Omaha hand of
+        compact card ints, or 0 if it has no qualifying low. '''
+    return OmahaEvaluator.evaluateOmahaLow(hand, board)
+
+def rankHandLow(hand, board, straightsCount, eightOrBetter, acesLow):
     ''' Gives the hand a "Low" ranking based on the rules of poker and returns
         a HandRank object. If straights count, the lowest hand possible is
         75432, and if they don't count then the lowest hand is 5432A (if
         aces are low). The eightOrBetter parameter indicates whether or not
-        a low must be no higher than an 8. '''
-    pass
+        a low must be no higher than an 8; None is returned if it doesn't
+        qualify. The cards may be Card objects or compact card ints. '''
+    cards = [PlayingCards.toInt(c) for c in hand + board]
+    key = LowEvaluator.evaluateLow(cards, straightsCount, acesLow,
+                                    eightOrBetter)
+    if not key:
+        return None
+    ranks, flushes = LowEvaluator.getTables(straightsCount, acesLow)
+    raw, best = LowEvaluator.bestSubset(cards, ranks, flushes)
+    lowCards = [PlayingCards.Card.fromInt(c, acesLow) for c in best]
+    sortHand(lowCards, True)
+    # Order pairs, trips etc. before kickers, as in the high hands.
+    counts = [sum(1 for o in lowCards if o.rank == c.rank) for c in lowCards]
+    lowCards = [c for n, i, c in sorted(((counts[i], -i, c) for i, c in
+                                        enumerate(lowCards)), reverse = True)]
+    return HandRanks.LowHand(lowCards, key, LowEvaluator.lowCategory(key))
+
+def scoreHandLow(hand, board, straightsCount, eightOrBetter, acesLow):
+    ''' Gives a hand of compact card ints a "Low" ranking without building
+        any objects. Returns the key the HandRank from rankHandLow would have
+        (larger is a better low), or 0 if there is no qualifying low. '''
+    return LowEvaluator.evaluateLow(hand + board, straightsCount, acesLow,
+                                    eightOrBetter)
 
 def checkStraightFlush(hand):
     ''' Checks to see if the passed cards make a straight and a flush.
@@ -135,7 +216,7 @@ def checkTrips(hand):
                                     hand[index-3], hand[index-4]])
         elif len(hand) - index == 2:
             return HandRanks.Trips( [hand[index], hand[index-1], hand[index-2],
-                                    hand[-1], hand[index-4]])
+                                    hand[-1], hand[index-3]])
         else:
             return HandRanks.Trips( [hand[index], hand[index-1], hand[index-2],
                                     hand[-1], hand[-2]])
@@ -208,22 +289,17 @@ def checkSize(hand):
 
 def removeDuplicates(hand):
     ''' Removes any duplicate ranks from the hand to facilitate checking for
-        straights. '''
-    i = 0
-    dups = []
-    while i < len(hand) - 1:
-        j = i + 1
-        while j < len(hand):
+        straights. Cards are removed by position because Card equality only
+        compares suits. '''
+    i = len(hand) - 1
+    while i > 0:
+        j = 0
+        while j < i:
             if hand[i].rank == hand[j].rank:
-                if hand[j] not in dups:
-                    dups.append(hand[j])
+                del hand[i]
+                break
             j += 1
-        i += 1
-    if len(dups) > 0:
-        i = len(dups) - 1
-        while i >= 0:
-            hand.remove(dups[i])
-            i -= 1
+        i -= 1
 
 def sortHand(hand, desc = False):
     ''' Uses Selection Sort on an array of card objects. Sorts in
@@ -5,95 +5,79 @@
 # Contains classes that represent the rank of a poker hand.
 #******************************************************************************
 
+import PlayingCards
+
+KEYSHIFT = 20 # Bit offset of the rankValue within a HandRank key.
+
+def packKey(rankValue, ranks):
+    ''' Packs a rankValue and up to five deciding card ranks (most important
+        first) into a single int: the rankValue above bit KEYSHIFT and the
+        ranks in 4-bit fields below it. Keys order hands exactly the way the
+        rules of poker do, so they can be compared, hashed and sorted directly.
+        '''
+    key = rankValue
+    for i in range(5):
+        key <<= 4
+        if i < len(ranks):
+            key |= ranks[i]
+    return key
+
 class HandRank:
     ''' Holds the rank of a hand that contains a rank description as well as
         the cards that make up the hand complete with methods to compare a
         hand rank to another of the same rank. '''
+    __slots__ = ('cards', 'rankValue', 'low', 'key')
+    keyCards = () # Positions in cards that break ties, most important first.
+    
     def __init__(self, cards, rankValue, low = False):
         if len(cards) != 5:		# Ensure that there are exactly 5 cards in the hand
             raise ValueError("Hand must be of length 5.")
-        self.cards = cards
+        self.cards = [PlayingCards.Card.fromInt(c) if isinstance(c, int) else c
+                    for c in cards] # Accept compact card ints as well.
         self.rankValue = rankValue
         self.low = low
+        self.key = packKey(rankValue,
+                            [self.cards[i].rank.rank for i in self.keyCards])
     
     #--------------------------------------------------------------------------
-    # Comparison operators - Compares two HandRank objects by their rankValue.
+    # Comparison operators - Compares two HandRank objects by their key, which
+    # is worked out once when the object is created.
     #--------------------------------------------------------------------------
     
     def __lt__(self, other):
-        if self.rankValue < other.rankValue:
-            return True
-        else:
-            return False
+        return self.key < other.key
     
     def __gt__(self, other):
-        if self.rankValue > other.rankValue:
-            return True
-        else:
-            return False
+        return self.key > other.key
+    
+    def __le__(self, other):
+        return self.key <= other.key
+    
+    def __ge__(self, other):
+        return self.key >= other.key
     
     def __eq__(self, other):
-        if self.rankValue == other.rankValue:
-            return True
-        else:
-            return False
+        return self.key == other.key
     
     def __ne__(self, other):
-        if self.rankValue != other.rankValue:
-            return True
-        else:
-            return False
+        return self.key != other.key
+    
+    def __hash__(self):
+        return hash(self.key)
 
 class StraightFlush(HandRank):
     ''' Represents a straight flush ranked hand inheriting from the HandRank
         class. Has methods to compare two straight flushes, as well as an
         appropriately defined __str__ method. '''
+    __slots__ = ()
+    keyCards = (4,) # The top card of the straight.
+    
     def __init__(self, cards):
         ''' Initializes the rank to have a rank value of 9 (highest possible),
             description of "Straight Flush", and initializes the cards
             involved. '''
         HandRank.__init__(self, cards, 9, False)
     
-    #--------------------------------------------------------------------------
-    # Comparison operators - Enables use of the operators >, <, !=, == for
-    # StraightFlush objects.
-    #--------------------------------------------------------------------------
-    def __lt__(self, other):
-        if HandRank.__lt__(self, other):
-            return True
-        elif HandRank.__eq__(self, other):
-            if self.cards[4] < other.cards[4]:
-                return True
-            else:
-                return False
-        else:
-            return False
-    
-    def __gt__(self, other):
-        if HandRank.__gt__(self, other):
-            return True
-        elif HandRank.__eq__(self, other):
-            if self.cards[4] > other.cards[4]:
-                return True
-            else:
-                return False
-        else:
-            return False
-    
-    def __eq__(self, other):
-        if (HandRank.__eq__(self, other) and
-            self.cards[4].rank == other.cards[4].rank):
-            return True
-        else:
-            return False
-    
-    def __ne__(self, other):
-        if (HandRank.__ne__(self, other) or
-            self.cards[4].rank != other.cards[4].rank):
-            return True
-        else:
-            return False
-    
     #--------------------------------------------------------------------------
     # String operator - Returns a string describing the hand's rank in an
     # appropriate way.
@@ -109,65 +93,16 @@ class Quads(HandRank):
     ''' Represents a four-of-a-kind ranked hand inheriting from the HandRank
         class. Has methods to compare two quad-ranked hands, as well as an
         appropriately defined __str__ method. '''
+    __slots__ = ()
+    # For comparisons to work, IT IS IMPERATIVE that the cards object is of
+    # the format RRRRK (where R = cards of same rank, and K is the kicker).
+    keyCards = (0, 4)
+    
     def __init__(self, cards):
         ''' Initializes the rank to have a rank value of 8 (second highest),
             and initializes the cards involved. '''
         HandRank.__init__(self, cards, 8, False)
     
-    #--------------------------------------------------------------------------
-    # Comparison operators - Enables use of the operators >, <, !=, == for
-    # Quad objects. For these comparisons to work, IT IS IMPERATIVE that the
-    # cards object is of the format RRRRK (where R = cards of same rank, and
-    # K is the kicker).
-    #--------------------------------------------------------------------------
-    def __lt__(self, other):
-        if HandRank.__lt__(self, other):
-            return True
-        elif HandRank.__eq__(self, other):
-            if self.cards[0] < other.cards[0]:
-                return True
-            elif self.cards[0].rank == other.cards[0].rank:
-                if self.cards[4] < other.cards[4]:
-                    return True
-                else:
-                    return False
-            else:
-                return False
-        else:
-            return False
-    
-    def __gt__(self, other):
-        if HandRank.__gt__(self, other):
-            return True
-        elif HandRank.__eq__(self, other):
-            if self.cards[0] > other.cards[0]:
-                return True
-            elif self.cards[0].rank == other.cards[0].rank:
-                if self.cards[4] > other.cards[4]:
-                    return True
-                else:
-                    return False
-            else:
-                return False
-        else:
-            return False
-    
-    def __eq__(self, other):
-        if (HandRank.__eq__(self, other) and
-            self.cards[0].rank == other.cards[0].rank and
-            self.cards[4].rank == other.cards[4].rank):
-            return True
-        else:
-            return False
-    
-    def __ne__(self, other):
-        if (HandRank.__ne__(self, other) or
-            self.cards[0].rank != other.cards[0].rank or
-            self.cards[4].rank != other.cards[4].rank):
-            return True
-        else:
-            return False
-    
     #--------------------------------------------------------------------------
     # String operator - Returns a string describing the hand's rank in an
     # appropriate way.
@@ -180,65 +115,16 @@ class FullHouse(HandRank):
     ''' Represents a full house ranked hand inheriting from the HandRank
         class. Has methods to compare two full house hands, as well as an
         appropriately defined __str__ method. '''
+    __slots__ = ()
+    # For comparisons to work, IT IS IMPERATIVE that the cards object is of
+    # the format TTTPP (where T = triple cards, and P is the pair).
+    keyCards = (0, 4)
+    
     def __init__(self, cards):
         ''' Initializes the rank to have a rank value of 7 (third highest),
             and initializes the cards involved. '''
         HandRank.__init__(self, cards, 7, False)
     
-    #--------------------------------------------------------------------------
-    # Comparison operators - Enables use of the operators >, <, !=, == for
-    # Full House objects. For these comparisons to work, IT IS IMPERATIVE that
-    # the cards object is of the format TTTPP (where T = triple cards, and
-    # P is the pair).
-    #--------------------------------------------------------------------------
-    def __lt__(self, other):
-        if HandRank.__lt__(self, other):
-            return True
-        elif HandRank.__eq__(self, other):
-            if self.cards[0] < other.cards[0]:
-                return True
-            elif self.cards[0].rank == other.cards[0].rank:
-                if self.cards[4] < other.cards[4]:
-                    return True
-                else:
-                    return False
-            else:
-                return False
-        else:
-            return False
-    
-    def __gt__(self, other):
-        if HandRank.__gt__(self, other):
-            return True
-        elif HandRank.__eq__(self, other):
-            if self.cards[0] > other.cards[0]:
-                return True
-            elif self.cards[0].rank == other.cards[0].rank:
-                if self.cards[4] > other.cards[4]:
-                    return True
-                else:
-                    return False
-            else:
-                return False
-        else:
-            return False
-    
-    def __eq__(self, other):
-        if (HandRank.__eq__(self, other) and
-            self.cards[0].rank == other.cards[0].rank and
-            self.cards[4].rank == other.cards[4].rank):
-            return True
-        else:
-            return False
-    
-    def __ne__(self, other):
-        if (HandRank.__ne__(self, other) or
-            self.cards[0].rank != other.cards[0].rank or
-            self.cards[4].rank != other.cards[4].rank):
-            return True
-        else:
-            return False
-    
     #--------------------------------------------------------------------------
     # String operator - Returns a string describing the hand's rank in an
     # appropriate way.
@@ -251,99 +137,14 @@ class Flush(HandRank):
     ''' Represents a flush ranked hand inheriting from the HandRank
         class. Has methods to compare two flushes, as well as an
         appropriately defined __str__ method. '''
+    __slots__ = ()
+    keyCards = (4, 3, 2, 1, 0) # Cards are in ascending order.
+    
     def __init__(self, cards):
         ''' Initializes the rank to have a rank value of 6, and initializes
             the cards involved. '''
         HandRank.__init__(self, cards, 6, False)
     
-    #--------------------------------------------------------------------------
-    # Comparison operators - Enables use of the operators >, <, !=, == for
-    # Straight objects.
-    #--------------------------------------------------------------------------
-    def __lt__(self, other):
-        if HandRank.__lt__(self, other):
-            return True
-        elif HandRank.__eq__(self, other):
-            if self.cards[4] < other.cards[4]:
-                return True
-            elif self.cards[4].rank == other.cards[4].rank:
-                if self.cards[3] < other.cards[3]:
-                    return True
-                elif self.cards[3].rank == other.cards[3].rank:
-                    if self.cards[2] < other.cards[2]:
-                        return True
-                    elif self.cards[2].rank == other.cards[2].rank:
-                        if self.cards[1] < other.cards[1]:
-                            return True
-                        elif self.cards[1].rank == other.cards[1].rank:
-                            if self.cards[0] < other.cards[0]:
-                                return True
-                            else:
-                                return False
-                        else:
-                            return False
-                    else:
-                        return False
-                else:
-                    return False
-            else:
-                return False
-        else:
-            return False
-    
-    def __gt__(self, other):
-        if HandRank.__gt__(self, other):
-            return True
-        elif HandRank.__eq__(self, other):
-            if self.cards[4] > other.cards[4]:
-                return True
-            elif self.cards[4].rank == other.cards[4].rank:
-                if self.cards[3] > other.cards[3]:
-                    return True
-                elif self.cards[3].rank == other.cards[3].rank:
-                    if self.cards[2] > other.cards[2]:
-                        return True
-                    elif self.cards[2].rank == other.cards[2].rank:
-                        if self.cards[1] > other.cards[1]:
-                            return True
-                        elif self.cards[1].rank == other.cards[1].rank:
-                            if self.cards[0] > other.cards[0]:
-                                return True
-                            else:
-                                return False
-                        else:
-                            return False
-                    else:
-                        return False
-                else:
-                    return False
-            else:
-                return False
-        else:
-            return False
-    
-    def __eq__(self, other):
-        if (HandRank.__eq__(self, other) and
-            self.cards[4].rank == other.cards[4].rank and
-            self.cards[3].rank == other.cards[3].rank and
-            self.cards[2].rank == other.cards[2].rank and
-            self.cards[1].rank == other.cards[1].rank and
-            self.cards[0].rank == other.cards[0].rank):
-            return True
-        else:
-            return False
-    
-    def __ne__(self, other):
-        if (HandRank.__ne__(self, other) or
-            self.cards[4].rank != other.cards[4].rank or
-            self.cards[3].rank != other.cards[3].rank or
-            self.cards[2].rank != other.cards[2].rank or
-            self.cards[1].rank != other.cards[1].rank or
-            self.cards[0].rank != other.cards[0].rank):
-            return True
-        else:
-            return False
-    
     #--------------------------------------------------------------------------
     # String operator - Returns a string describing the hand's rank in an
     # appropriate way.
@@ -357,51 +158,14 @@ class Straight(HandRank):
     ''' Represents a straight ranked hand inheriting from the HandRank
         class. Has methods to compare two straights, as well as an
         appropriately defined __str__ method. '''
+    __slots__ = ()
+    keyCards = (4,) # The top card of the straight.
+    
     def __init__(self, cards):
         ''' Initializes the rank to have a rank value of 5, and initializes
             the cards involved. '''
         HandRank.__init__(self, cards, 5, False)
     
-    #--------------------------------------------------------------------------
-    # Comparison operators - Enables use of the operators >, <, !=, == for
-    # Straight objects.
-    #--------------------------------------------------------------------------
-    def __lt__(self, other):
-        if HandRank.__lt__(self, other):
-            return True
-        elif HandRank.__eq__(self, other):
-            if self.cards[4] < other.cards[4]:
-                return True
-            else:
-                return False
-        else:
-            return False
-    
-    def __gt__(self, other):
-        if HandRank.__gt__(self, other):
-            return True
-        elif HandRank.__eq__(self, other):
-            if self.cards[4] > other.cards[4]:
-                return True
-            else:
-                return False
-        else:
-            return False
-    
-    def __eq__(self, other):
-        if (HandRank.__eq__(self, other) and
-            self.cards[4].rank == other.cards[4].rank):
-            return True
-        else:
-            return False
-    
-    def __ne__(self, other):
-        if (HandRank.__ne__(self, other) or
-            self.cards[4].rank != other.cards[4].rank):
-            return True
-        else:
-            return False
-    
     #--------------------------------------------------------------------------
     # String operator - Returns a string describing the hand's rank in an
     # appropriate way.
@@ -414,77 +178,17 @@ class Trips(HandRank):
     ''' Represents a three-of-a-kind ranked hand inheriting from the HandRank
         class. Has methods to compare two three-of-a-kinds, as well as an
         appropriately defined __str__ method. '''
+    __slots__ = ()
+    # For comparisons to work, IT IS IMPERATIVE that the cards object is of
+    # the format RRRJK (where R = cards of same rank, and J, K are kickers
+    # s.t. J > K).
+    keyCards = (0, 3, 4)
+    
     def __init__(self, cards):
         ''' Initializes the rank to have a rank value of 4 and initializes the
             cards involved. '''
         HandRank.__init__(self, cards, 4, False)
     
-    #--------------------------------------------------------------------------
-    # Comparison operators - Enables use of the operators >, <, !=, == for
-    # Trips objects. For these comparisons to work, IT IS IMPERATIVE that the
-    # cards object is of the format RRRJK (where R = cards of same rank, and
-    # J, K are kickers s.t. J > K).
-    #--------------------------------------------------------------------------
-    def __lt__(self, other):
-        if HandRank.__lt__(self, other):
-            return True
-        elif HandRank.__eq__(self, other):
-            if self.cards[0] < other.cards[0]:
-                return True
-            elif self.cards[0].rank == other.cards[0].rank:
-                if self.cards[3] < other.cards[3]:
-                    return True
-                elif self.cards[3].rank == other.cards[3].rank:
-                    if self.cards[4] < other.cards[4]:
-                        return True
-                    else:
-                        return False
-                else:
-                    return False
-            else:
-                return False
-        else:
-            return False
-    
-    def __gt__(self, other):
-        if HandRank.__gt__(self, other):
-            return True
-        elif HandRank.__eq__(self, other):
-            if self.cards[0] > other.cards[0]:
-                return True
-            elif self.cards[0].rank == other.cards[0].rank:
-                if self.cards[3] > other.cards[3]:
-                    return True
-                elif self.cards[3].rank == other.cards[3].rank:
-                    if self.cards[4] > other.cards[4]:
-                        return True
-                    else:
-                        return False
-                else:
-                    return False
-            else:
-                return False
-        else:
-            return False
-    
-    def __eq__(self, other):
-        if (HandRank.__eq__(self, other) and
-            self.cards[0].rank == other.cards[0].rank and
-            self.cards[3].rank == other.cards[3].rank and
-            self.cards[4].rank == other.cards[4].rank):
-            return True
-        else:
-            return False
-    
-    def __ne__(self, other):
-        if (HandRank.__ne__(self, other) or
-            self.cards[0].rank != other.cards[0].rank or
-            self.cards[3].rank != other.cards[3].rank or
-            self.cards[4].rank != other.cards[4].rank):
-            return True
-        else:
-            return False
-    
     #--------------------------------------------------------------------------
     # String operator - Returns a string describing the hand's rank in an
     # appropriate way.
@@ -498,77 +202,17 @@ class TwoPair(HandRank):
     ''' Represents a two-pair ranked hand inheriting from the HandRank
         class. Has methods to compare two two-pair hands, as well as an
         appropriately defined __str__ method. '''
+    __slots__ = ()
+    # For comparisons to work, IT IS IMPERATIVE that the cards object is of
+    # the format RRSSK (where R = higher pair, S = lower pair, and K is the
+    # kicker).
+    keyCards = (0, 2, 4)
+    
     def __init__(self, cards):
         ''' Initializes the rank to have a rank value of 3 and initializes the
             cards involved. '''
         HandRank.__init__(self, cards, 3, False)
     
-    #--------------------------------------------------------------------------
-    # Comparison operators - Enables use of the operators >, <, !=, == for
-    # TwoPair objects. For these comparisons to work, IT IS IMPERATIVE that the
-    # cards object is of the format RRSSK (where R = higher pair, S = lower
-    # pair, and K is the kicker.
-    #--------------------------------------------------------------------------
-    def __lt__(self, other):
-        if HandRank.__lt__(self, other):
-            return True
-        elif HandRank.__eq__(self, other):
-            if self.cards[0] < other.cards[0]:
-                return True
-            elif self.cards[0].rank == other.cards[0].rank:
-                if self.cards[2] < other.cards[2]:
-                    return True
-                elif self.cards[2].rank == other.cards[2].rank:
-                    if self.cards[4] < other.cards[4]:
-                        return True
-                    else:
-                        return False
-                else:
-                    return False
-            else:
-                return False
-        else:
-            return False
-    
-    def __gt__(self, other):
-        if HandRank.__gt__(self, other):
-            return True
-        elif HandRank.__eq__(self, other):
-            if self.cards[0] > other.cards[0]:
-                return True
-            elif self.cards[0].rank == other.cards[0].rank:
-                if self.cards[2] > other.cards[2]:
-                    return True
-                elif self.cards[2].rank == other.cards[2].rank:
-                    if self.cards[4] > other.cards[4]:
-                        return True
-                    else:
-                        return False
-                else:
-                    return False
-            else:
-                return False
-        else:
-            return False
-    
-    def __eq__(self, other):
-        if (HandRank.__eq__(self, other) and
-            self.cards[0].rank == other.cards[0].rank and
-            self.cards[2].rank == other.cards[2].rank and
-            self.cards[4].rank == other.cards[4].rank):
-            return True
-        else:
-            return False
-    
-    def __ne__(self, other):
-        if (HandRank.__ne__(self, other) or
-            self.cards[0].rank != other.cards[0].rank or
-            self.cards[2].rank != other.cards[2].rank or
-            self.cards[4].rank != other.cards[4].rank):
-            return True
-        else:
-            return False
-    
     #--------------------------------------------------------------------------
     # String operator - Returns a string describing the hand's rank in an
     # appropriate way.
@@ -582,89 +226,17 @@ class Pair(HandRank):
     ''' Represents a pair ranked hand inheriting from the HandRank
         class. Has methods to compare two pair hands, as well as an
         appropriately defined __str__ method. '''
+    __slots__ = ()
+    # For comparisons to work, IT IS IMPERATIVE that the cards object is of
+    # the format PPIJK (where P = cards of same rank, and I, J, K are kickers
+    # s.t. I > J > K).
+    keyCards = (0, 2, 3, 4)
+    
     def __init__(self, cards):
         ''' Initializes the rank to have a rank value of 2 and initializes the
             cards involved. '''
         HandRank.__init__(self, cards, 2, False)
     
-    #--------------------------------------------------------------------------
-    # Comparison operators - Enables use of the operators >, <, !=, == for
-    # Pair objects. For these comparisons to work, IT IS IMPERATIVE that the
-    # cards object is of the format PPIJK (where P = cards of same rank, and
-    # I, J, K are kickers s.t. I > J > K).
-    #--------------------------------------------------------------------------
-    def __lt__(self, other):
-        if HandRank.__lt__(self, other):
-            return True
-        elif HandRank.__eq__(self, other):
-            if self.cards[0] < other.cards[0]:
-                return True
-            elif self.cards[0].rank == other.cards[0].rank:
-                if self.cards[2] < other.cards[2]:
-                    return True
-                elif self.cards[2].rank == other.cards[2].rank:
-                    if self.cards[3] < other.cards[3]:
-                        return True
-                    elif self.cards[3].rank == other.cards[3].rank:
-                        if self.cards[4] < other.cards[4]:
-                            return True
-                        else:
-                            return False
-                    else:
-                        return False
-                else:
-                    return False
-            else:
-                return False
-        else:
-            return False
-    
-    def __gt__(self, other):
-        if HandRank.__gt__(self, other):
-            return True
-        elif HandRank.__eq__(self, other):
-            if self.cards[0] > other.cards[0]:
-                return True
-            elif self.cards[0].rank == other.cards[0].rank:
-                if self.cards[2] > other.cards[2]:
-                    return True
-                elif self.cards[2].rank == other.cards[2].rank:
-                    if self.cards[3] > other.cards[3]:
-                        return True
-                    elif self.cards[3].rank == other.cards[3].rank:
-                        if self.cards[4] > other.cards[4]:
-                            return True
-                        else:
-                            return False
-                    else:
-                        return False
-                else:
-                    return False
-            else:
-                return False
-        else:
-            return False
-    
-    def __eq__(self, other):
-        if (HandRank.__eq__(self, other) and
-            self.cards[0].rank == other.cards[0].rank and
-            self.cards[2].rank == other.cards[2].rank and
-            self.cards[3].rank == other.cards[3].rank and
-            self.cards[4].rank == other.cards[4].rank):
-            return True
-        else:
-            return False
-    
-    def __ne__(self, other):
-        if (HandRank.__ne__(self, other) or
-            self.cards[0].rank != other.cards[0].rank or
-            self.cards[2].rank != other.cards[2].rank or
-            self.cards[3].rank != other.cards[3].rank or
-            self.cards[4].rank != other.cards[4].rank):
-            return True
-        else:
-            return False
-    
     #--------------------------------------------------------------------------
     # String operator - Returns a string describing the hand's rank in an
     # appropriate way.
@@ -678,104 +250,45 @@ class HighCard(HandRank):
     ''' Represents a high-card ranked hand inheriting from the HandRank
         class. Has methods to compare two high-card hands, as well as an
         appropriately defined __str__ method. '''
+    __slots__ = ()
+    keyCards = (4, 3, 2, 1, 0) # Cards are in ascending order.
+    
     def __init__(self, cards):
         ''' Initializes the rank to have a rank value of 1, and initializes
             the cards involved. '''
         HandRank.__init__(self, cards, 1, False)
     
     #--------------------------------------------------------------------------
-    # Comparison operators - Enables use of the operators >, <, !=, == for
-    # HighCard objects.
+    # String operator - Returns a string describing the hand's rank in an
+    # appropriate way.
     #--------------------------------------------------------------------------
-    def __lt__(self, other):
-        if HandRank.__lt__(self, other):
-            return True
-        elif HandRank.__eq__(self, other):
-            if self.cards[4] < other.cards[4]:
-                return True
-            elif self.cards[4].rank == other.cards[4].rank:
-                if self.cards[3] < other.cards[3]:
-                    return True
-                elif self.cards[3].rank == other.cards[3].rank:
-                    if self.cards[2] < other.cards[2]:
-                        return True
-                    elif self.cards[2].rank == other.cards[2].rank:
-                        if self.cards[1] < other.cards[1]:
-                            return True
-                        elif self.cards[1].rank == other.cards[1].rank:
-                            if self.cards[0] < other.cards[0]:
-                                return True
-                            else:
-                                return False
-                        else:
-                            return False
-                    else:
-                        return False
-                else:
-                    return False
-            else:
-                return False
-        else:
-            return False
-    
-    def __gt__(self, other):
-        if HandRank.__gt__(self, other):
-            return True
-        elif HandRank.__eq__(self, other):
-            if self.cards[4] > other.cards[4]:
-                return True
-            elif self.cards[4].rank == other.cards[4].rank:
-                if self.cards[3] > other.cards[3]:
-                    return True
-                elif self.cards[3].rank == other.cards[3].rank:
-                    if self.cards[2] > other.cards[2]:
-                        return True
-                    elif self.cards[2].rank == other.cards[2].rank:
-                        if self.cards[1] > other.cards[1]:
-                            return True
-                        elif self.cards[1].rank == other.cards[1].rank:
-                            if self.cards[0] > other.cards[0]:
-                                return True
-                            else:
-                                return False
-                        else:
-                            return False
-                    else:
-                        return False
-                else:
-                    return False
-            else:
-                return False
-        else:
-            return False
-    
-    def __eq__(self, other):
-        if (HandRank.__eq__(self, other) and
-            self.cards[4].rank == other.cards[4].rank and
-            self.cards[3].rank == other.cards[3].rank and
-            self.cards[2].rank == other.cards[2].rank and
-            self.cards[1].rank == other.cards[1].rank and
-            self.cards[0].rank == other.cards[0].rank):
-            return True
-        else:
-            return False
-    
-    def __ne__(self, other):
-        if (HandRank.__ne__(self, other) or
-            self.cards[4].rank != other.cards[4].rank or
-            self.cards[3].rank != other.cards[3].rank or
-            self.cards[2].rank != other.cards[2].rank or
-            self.cards[1].rank != other.cards[1].rank or
-            self.cards[0].rank != other.cards[0].rank):
-            return True
-        else:
-            return False
+    def __str__(self):
+        return  ("High card " + str(self.cards[4].rank) + ", " + 
+                str(self.cards[3].rank) + "+" + str(self.cards[2].rank) + "+" +
+                str(self.cards[1].rank) + "+" + str(self.cards[0].rank) + " kickers.")
+
+class LowHand(HandRank):
+    ''' Represents a "Low" ranked hand inheriting from the HandRank class. The
+        key is worked out by LowEvaluator for the game's low rules and is
+        larger for better lows, so lows compare and sort the same way as high
+        hands do. '''
+    __slots__ = ()
+    descs = {   1: "", 2: "Paired ", 3: "Two Pair ", 4: "Trips ",
+                5: "Straight ", 6: "Flush ", 7: "Full House ", 8: "Quads ",
+                9: "Straight Flush "    }
+    
+    def __init__(self, cards, key, rankValue):
+        ''' Initializes the low with its cards (highest card first), the key
+            from LowEvaluator and the rankValue of the hand under the low
+            rules (1 for an unpaired low). '''
+        HandRank.__init__(self, cards, rankValue, True)
+        self.key = key
     
     #--------------------------------------------------------------------------
     # String operator - Returns a string describing the hand's rank in an
     # appropriate way.
     #--------------------------------------------------------------------------
     def __str__(self):
-        return  ("High card " + str(self.cards[4].rank) + ", " + 
-                str(self.cards[3].rank) + "+" + str(self.cards[2].rank) + "+" +
-                str(self.cards[1].rank) + "+" + str(self.cards[0].rank) + " kickers.")
\ No newline at end of file
+        return  (self.descs[self.rankValue] + "-".join(
+                PlayingCards.Card.rank_descs[c.rank.rank] for c in self.cards) +
+                " low.")
@@ -0,0 +1,127 @@
+#******************************************************************************
+# Isomorphism.py                                    Author: Curtis Smith
+# Written in Python 3.2
+#
+# Maps boards (and boards with hole cards) that only differ by a relabelling
+# of the suits to a single canonical board, and indexes the canonical boards
+# of each street.
+#******************************************************************************
+
+import PlayingCards
+
+#------------------------------------------------------------------------------
+# Two boards are isomorphic if some permutation of the suits maps one onto
+# the other. Each suit is described by the 13-bit mask of its ranks on the
+# board (and then in the hole, if there are hole cards); sorting the suits by
+# that description, highest first, and renaming them clubs, spades, diamonds
+# and hearts in that order gives the same cards for every board in a class.
+# Suits with the same description can be swapped without changing anything,
+# so a class holds 24 / (the product of the factorials of the sizes of the
+# groups of such suits) boards.
+#
+# Canonical boards are sorted compact card ints. Of the C(52,3) = 22100
+# flops, C(52,4) turns and C(52,5) rivers there are 1755, 16432 and 134459
+# classes; boardIndex numbers them by street in ascending order of their card
+# bitmasks.
+#------------------------------------------------------------------------------
+
+BOARDS = {}  # Board size -> list of (canonical board, multiplicity)
+INDEXES = {} # Board size -> {canonical board bitmask: index}
+
+def suitMasks(cards):
+    ''' Returns the 13-bit rank mask of each suit in a list of compact card
+        ints. '''
+    masks = [0, 0, 0, 0]
+    for c in cards:
+        masks[c // 13] |= 1 << (c % 13)
+    return masks
+
+def suitOrder(board, hole = ()):
+    ''' Returns the canonical suit (0-3) for each suit, and the multiplicity
+        of the class. '''
+    boardMasks = suitMasks(board)
+    holeMasks = suitMasks(hole)
+    keys = [(boardMasks[s], holeMasks[s]) for s in range(4)]
+    order = sorted(range(4), key = lambda s: keys[s], reverse = True)
+    mapping = [0] * 4
+    for n, s in enumerate(order):
+        mapping[s] = n
+    automorphisms = 1
+    run = 1
+    for n in range(1, 4):
+        if keys[order[n]] == keys[order[n - 1]]:
+            run += 1
+            automorphisms *= run
+        else:
+            run = 1
+    return mapping, 24 // automorphisms
+
+def canonical(board, hole = None):
+    ''' Returns the canonical form of a board (Card objects or compact card
+        ints) as a sorted tuple of compact card ints. If hole cards are given,
+        the board and hole cards are canonicalized together and a tuple of
+        (canonical board, canonical hole cards) is returned. '''
+    board = [PlayingCards.toInt(c) for c in board]
+    cards = [] if hole is None else [PlayingCards.toInt(c) for c in hole]
+    mapping = suitOrder(board, cards)[0]
+    board = tuple(sorted(mapping[c // 13] * 13 + c % 13 for c in board))
+    if hole is None:
+        return board
+    return board, tuple(sorted(mapping[c // 13] * 13 + c % 13
+                                for c in cards))
+
+def multiplicity(board, hole = None):
+    ''' Returns the number of boards (or boards with hole cards) isomorphic
+        to the one given, counting it. '''
+    board = [PlayingCards.toInt(c) for c in board]
+    cards = [] if hole is None else [PlayingCards.toInt(c) for c in hole]
+    return suitOrder(board, cards)[1]
+
+def canonicalKey(board, hole = ()):
+    ''' Returns an int identifying the class of a board and hole cards, ie.
+        for caching results by class: the canonical board's card bitmask,
+        with the canonical hole cards' bitmask above it. '''
+    board, hole = canonical(board, hole)
+    return PlayingCards.cardMask(board) | PlayingCards.cardMask(hole) << 52
+
+#------------------------------------------------------------------------------
+# Listing and indexing. The classes of each street are found by adding every
+# card to each class of the street before and canonicalizing, rather than
+# canonicalizing every board.
+#------------------------------------------------------------------------------
+
+def canonicalBoards(size):
+    ''' Returns a list of (canonical board, multiplicity) for every class of
+        boards of size cards (1-5), in index order. The list is built the
+        first time it's asked for and shared after that. '''
+    boards = BOARDS.get(size)
+    if boards is None:
+        if not 1 <= size <= 5:
+            raise ValueError("Boards have 1 to 5 cards.")
+        if size == 1:
+            shorter = [()]
+        else:
+            shorter = [b for b, m in canonicalBoards(size - 1)]
+        found = {}
+        for board in shorter:
+            for c in range(PlayingCards.DECKSIZE):
+                if c not in board:
+                    longer = canonical(board + (c,))
+                    found[PlayingCards.cardMask(longer)] = longer
+        boards = [(found[mask], multiplicity(found[mask]))
+                    for mask in sorted(found)]
+        BOARDS[size] = boards
+        INDEXES[size] = dict((mask, n) for n, mask in enumerate(sorted(found)))
+    return boards
+
+def boardIndex(board):
+    ''' Returns the index of a board's class among the canonical boards of its
+        street (see canonicalBoards) and the class's multiplicity. '''
+    board = [PlayingCards.toInt(c) for c in board]
+    if len(board) not in INDEXES:
+        canonicalBoards(len(board))
+    mapping, count = suitOrder(board)
+    mask = 0
+    for c in board:
+        mask |= 1 << (mapping[c // 13] * 13 + c % 13)
+    return INDEXES[len(board)][mask], count
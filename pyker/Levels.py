@@ -5,10 +5,15 @@
 # Represents the blind levels of a poker game.
 #******************************************************************************
 
+import asyncio
+import bisect
+import time
+
 class Levels:
 	''' Holds an array of BlindLevel objects and keeps track of the current
-		level. Also contains a method that takes the time elapsed and 
-		increments the level if sufficient time has elapsed. '''
+		level. The start time of every level and break is worked out once
+		(when the schedule changes), so the level in play at any time is
+		found by bisecting the start times. '''
 		
 	def __init__(self, levelTime, cashGame):
 		''' Prepares the level array, takes the time of each level, sets the
@@ -18,13 +23,227 @@ class Levels:
 		self.levelTime = levelTime
 		self.currentLevel = 0
 		self.cashGame = cashGame
+		self.levelTimes = []    # Minutes each level lasts.
+		self.breaks = {}        # Levels played before a break -> minutes.
+		self.starts = None      # Start of each level and break, in seconds.
+		self.periods = None     # (level index, on break) for each start.
 		
 	def setLevel(self, timeElapsed):
-		''' Converts the time elapsed to minutes, then divides by the
-			length of a blind level to see if it's time for a new level. '''
-		if int((timeElapsed / 60) / self.levelTime) > self.currentLevel:
-			currentLevel += 1
-	
-	def addLevel(self, newLevel):
-		''' Appends the passed level to the level array. '''
-		self.levels.append(newLevel)
\ No newline at end of file
+		''' Sets the current level to the one in play timeElapsed seconds
+			into the game. '''
+		self.currentLevel = self.levelAt(timeElapsed)
+	
+	def addLevel(self, newLevel, levelTime = None):
+		''' Appends the passed level to the level array. The level lasts
+			levelTime minutes, or the default level time if not given. '''
+		self.levels.append(newLevel)
+		if levelTime is None:
+			levelTime = self.levelTime
+		self.levelTimes.append(levelTime)
+		self.starts = None
+	
+	def addBreak(self, minutes):
+		''' Adds a break of the given minutes after the last level added.
+			Raises ValueError if no level has been added yet. If no level is
+			added after it, the last level resumes after the break. '''
+		if not self.levels:
+			raise ValueError("A break must follow a level.")
+		self.breaks[len(self.levels)] = minutes
+		self.starts = None
+	
+	#--------------------------------------------------------------------------
+	# Schedule lookups. Times are seconds of play since the first level
+	# started; the clock keeps running through breaks, and the last level
+	# lasts forever (picking up again after a break added after it).
+	#--------------------------------------------------------------------------
+	
+	def buildSchedule(self):
+		''' Works out the start time of every level and break. '''
+		self.starts = []
+		self.periods = []
+		start = 0
+		last = len(self.levels) - 1
+		for i in range(len(self.levels)):
+			if i in self.breaks:
+				self.starts.append(start)
+				self.periods.append((i, True))
+				start += self.breaks[i] * 60
+			self.starts.append(start)
+			self.periods.append((i, False))
+			start += self.levelTimes[i] * 60
+		if last + 1 in self.breaks:
+			self.starts.append(start)
+			self.periods.append((last, True))
+			start += self.breaks[last + 1] * 60
+			self.starts.append(start)
+			self.periods.append((last, False))
+	
+	def periodAt(self, timeElapsed):
+		''' Returns the index (into starts and periods) of the level or
+			break in play at timeElapsed seconds. '''
+		if self.starts is None:
+			self.buildSchedule()
+		return max(bisect.bisect_right(self.starts, timeElapsed) - 1, 0)
+	
+	def levelAt(self, timeElapsed):
+		''' Returns the index of the level in play timeElapsed seconds into
+			the game. During a break, it's the level that follows it. '''
+		if not self.levels:
+			return 0
+		period = self.periodAt(timeElapsed)
+		return self.periods[period][0]
+	
+	def onBreak(self, timeElapsed):
+		''' Returns True if timeElapsed seconds falls within a break. '''
+		if not self.levels:
+			return False
+		period = self.periodAt(timeElapsed)
+		return self.periods[period][1]
+	
+	def blindLevel(self, timeElapsed = None):
+		''' Returns the BlindLevel in play at timeElapsed seconds, or the
+			current level if no time is given. '''
+		if timeElapsed is None:
+			level = self.currentLevel
+		else:
+			level = self.levelAt(timeElapsed)
+		return self.levels[min(level, len(self.levels) - 1)]
+	
+	def nextChange(self, timeElapsed):
+		''' Returns the time (in seconds) at which the next level or break
+			after timeElapsed starts, or None if the last level is in play.
+			'''
+		if self.starts is None:
+			self.buildSchedule()
+		i = bisect.bisect_right(self.starts, timeElapsed)
+		if i < len(self.starts):
+			return self.starts[i]
+		return None
+
+class TournamentClock:
+	''' Runs a Levels schedule in real time. The clock can be paused and
+		resumed (time spent paused doesn't count), and calls listeners when
+		the level changes or a break starts. Listener calls are scheduled on
+		an asyncio event loop with call_at, so nothing polls the clock; a
+		loop can run the clocks of any number of tournaments. '''
+	def __init__(self, levels, timer = time.monotonic):
+		''' Takes the Levels to run and the function giving the current
+			time in seconds (the event loop's clock is used once the clock
+			is scheduled on a loop). '''
+		self.levels = levels
+		self.timer = timer
+		self.started = None     # Timer value when play started.
+		self.pausedAt = None    # Timer value when paused, if paused.
+		self.pausedFor = 0      # Seconds spent paused before pausedAt.
+		self.listeners = []
+		self.period = 0         # The level or break listeners last heard of.
+		self.loop = None
+		self.handle = None      # The loop's handle for the next change.
+	
+	def elapsed(self):
+		''' Returns the seconds of play so far, not counting pauses. '''
+		if self.started is None:
+			return 0
+		now = self.pausedAt if self.pausedAt is not None else self.timer()
+		return now - self.started - self.pausedFor
+	
+	def blindLevel(self):
+		''' Returns the BlindLevel in play now. '''
+		return self.levels.blindLevel(self.elapsed())
+	
+	def onBreak(self):
+		''' Returns True if the tournament is on a break. '''
+		return self.levels.onBreak(self.elapsed())
+	
+	def timeLeft(self):
+		''' Returns the seconds until the next level or break, or None if the
+			last level is in play. '''
+		elapsed = self.elapsed()
+		change = self.levels.nextChange(elapsed)
+		if change is None:
+			return None
+		return change - elapsed
+	
+	def addListener(self, callback):
+		''' Registers callback(clock, level, onBreak) to be called with the
+			new level index when each level or break starts. '''
+		self.listeners.append(callback)
+	
+	def schedule(self, loop = None):
+		''' Runs the clock's callbacks on an event loop (the running loop if
+			none is given), timing the clock by the loop's time from now on.
+			'''
+		if loop is None:
+			loop = asyncio.get_running_loop()
+		if self.loop is not None:
+			self.cancel()
+		elapsed = self.elapsed()
+		self.loop = loop
+		self.timer = loop.time
+		if self.started is not None:
+			# Carry the play so far over to the loop's clock.
+			now = loop.time()
+			self.started = now - elapsed - self.pausedFor
+			if self.pausedAt is not None:
+				self.pausedAt = now
+		self.arm()
+	
+	def cancel(self):
+		''' Stops the clock's callbacks. '''
+		if self.handle is not None:
+			self.handle.cancel()
+			self.handle = None
+		self.loop = None
+	
+	def arm(self):
+		''' Schedules the next change on the loop, if the clock is running.
+			'''
+		if self.handle is not None:
+			self.handle.cancel()
+			self.handle = None
+		if self.loop is None or self.started is None or \
+				self.pausedAt is not None:
+			return
+		left = self.timeLeft()
+		if left is not None:
+			self.handle = self.loop.call_at(self.loop.time() + left,
+											self.change)
+	
+	def change(self):
+		''' Called by the loop when a level or break starts. '''
+		self.handle = None
+		elapsed = self.elapsed()
+		period = self.levels.periodAt(elapsed)
+		if period != self.period: # The loop can wake a little early.
+			self.period = period
+			self.levels.setLevel(elapsed)
+			onBreak = self.levels.onBreak(elapsed)
+			for callback in self.listeners:
+				callback(self, self.levels.currentLevel, onBreak)
+		self.arm()
+	
+	#--------------------------------------------------------------------------
+	# Starting and pausing.
+	#--------------------------------------------------------------------------
+	
+	def start(self):
+		''' Starts the clock at the first level. '''
+		self.started = self.timer()
+		self.pausedAt = None
+		self.pausedFor = 0
+		self.period = 0
+		self.levels.setLevel(0)
+		self.arm()
+	
+	def pause(self):
+		''' Stops the clock until resume is called. '''
+		if self.started is not None and self.pausedAt is None:
+			self.pausedAt = self.timer()
+			self.arm()
+	
+	def resume(self):
+		''' Restarts a paused clock where it left off. '''
+		if self.pausedAt is not None:
+			self.pausedFor += self.timer() - self.pausedAt
+			self.pausedAt = None
+			self.arm()
@@ -0,0 +1,155 @@
+#******************************************************************************
+# LowEvaluator.py                                   Author: Curtis Smith
+# Written in Python 3.2
+#
+# Table driven "Low" hand evaluator for ace-to-five, deuce-to-seven and
+# ace-to-six lowball, with an optional eight-or-better qualifier.
+#******************************************************************************
+
+import itertools
+
+import HandEvaluator
+import HandRanks
+
+#------------------------------------------------------------------------------
+# A low variant is described by two flags:
+#     straightsCount - straights and flushes count against a low hand.
+#     acesLow - an ace is the lowest card (otherwise it is the highest).
+# Ace-to-five (razz, hi/lo split games) doesn't count straights and plays aces
+# low, deuce-to-seven counts straights and plays aces high, and ace-to-six
+# counts straights and plays aces low.
+#
+# Within a variant a hand's raw value is the HandRanks key it would have as a
+# high hand under that variant's rules (so straights and flushes are plain
+# high-card hands when they don't count), packed with all five ranks for
+# straights. The best low is the 5-card hand with the smallest raw value. Low
+# keys are LOWBASE - raw so that, like high keys, a better low has a larger
+# key; a key of 0 means there is no (qualifying) low.
+#------------------------------------------------------------------------------
+
+LOWBASE = 1 << 24   # Larger than any raw value.
+QUALIFIER = 8       # Highest card allowed in an eight-or-better low.
+
+TABLES = {} # (straightsCount, acesLow) -> (rank table, flush table)
+
+def evaluateLow(cards, straightsCount, acesLow, eightOrBetter = False):
+    ''' Returns the low key of the best 5-card low in a list of 5 to 7
+        compact card ints, or 0 if eightOrBetter is set and the hand doesn't
+        qualify. '''
+    ranks, flushes = getTables(straightsCount, acesLow)
+    product = 1
+    for c in cards:
+        product *= HandEvaluator.CARD_PRIMES[c]
+    raw = ranks[product]
+    if straightsCount and len(cards) >= 5:
+        suits = [0, 0, 0, 0]
+        for c in cards:
+            suits[HandEvaluator.CARD_SUITS[c]] += 1
+        if max(suits) >= 5:
+            # Some 5-card sets are flushes, so the best rank set may not be
+            # playable without one; check every set.
+            raw = bestSubset(cards, ranks, flushes)[0]
+    return lowKey(raw, eightOrBetter)
+
+def bestSubset(cards, ranks, flushes):
+    ''' Returns the smallest raw value among the 5-card sets of cards (using
+        the 5-card tables) and the set that makes it. '''
+    best = None
+    for subset in itertools.combinations(cards, 5):
+        product = 1
+        suits = 0
+        mask = 0
+        for c in subset:
+            product *= HandEvaluator.CARD_PRIMES[c]
+            suits |= 1 << HandEvaluator.CARD_SUITS[c]
+            mask |= HandEvaluator.CARD_BITS[c]
+        raw = ranks[product]
+        if flushes is not None and suits & (suits - 1) == 0:
+            raw = flushes[mask]
+        if best is None or raw < best[0]:
+            best = (raw, subset)
+    return best
+
+def lowKey(raw, eightOrBetter):
+    ''' Turns a raw value into a low key, applying the qualifier. '''
+    if eightOrBetter and (raw >> HandRanks.KEYSHIFT != 1 or
+                        (raw >> 16) & 0xF > QUALIFIER):
+        return 0
+    return LOWBASE - raw
+
+def lowCategory(key):
+    ''' Returns the rankValue (under the variant's rules) of a low key. '''
+    return (LOWBASE - key) >> HandRanks.KEYSHIFT
+
+#------------------------------------------------------------------------------
+# Table construction. The 5-card rank table is built directly; the 6 and 7
+# card entries are the best of the entries one card smaller, so every rank
+# multiset of 5-7 cards is a single lookup. Variants where straights count
+# also get a table of 5-card flush values indexed by rank mask.
+#------------------------------------------------------------------------------
+
+def getTables(straightsCount, acesLow):
+    ''' Returns the (rank table, flush table) of a variant, building them the
+        first time. The flush table is None if flushes don't count. '''
+    variant = (bool(straightsCount), bool(acesLow))
+    if variant not in TABLES:
+        TABLES[variant] = buildTables(*variant)
+    return TABLES[variant]
+
+def rankValue(rank, acesLow):
+    ''' Returns the value (1-14) of a rank index (0-12) under a variant. '''
+    if acesLow and rank == 12:
+        return 1
+    return rank + 2
+
+def buildTables(straightsCount, acesLow):
+    ''' Builds the rank and flush tables for a variant. '''
+    primes = HandEvaluator.PRIMES
+    ranks = {}
+    for counts in HandEvaluator.rankCounts(5):
+        product = 1
+        for r in range(13):
+            product *= primes[r] ** counts[r]
+        ranks[product] = rawValue(counts, False, straightsCount, acesLow)
+    for size in (6, 7):
+        for counts in HandEvaluator.rankCounts(size):
+            product = 1
+            for r in range(13):
+                product *= primes[r] ** counts[r]
+            ranks[product] = min(ranks[product // primes[r]]
+                                for r in range(13) if counts[r])
+    flushes = None
+    if straightsCount:
+        flushes = [0] * 8192
+        for mask in range(8192):
+            if bin(mask).count("1") == 5:
+                counts = [(mask >> r) & 1 for r in range(13)]
+                flushes[mask] = rawValue(counts, True, straightsCount, acesLow)
+    return ranks, flushes
+
+def rawValue(counts, flush, straightsCount, acesLow):
+    ''' Returns the raw value of a 5-card hand given its per-rank counts. '''
+    groups = sorted(((counts[r], rankValue(r, acesLow)) for r in range(13)
+                    if counts[r]), reverse = True)
+    values = sorted((v for n, v in groups for i in range(n)), reverse = True)
+    straight = (straightsCount and len(groups) == 5 and
+                values[0] - values[4] == 4)
+    flush = straightsCount and flush
+    shape = [n for n, v in groups]
+    if straight and flush:
+        return HandRanks.packKey(9, values)
+    if shape[0] == 4:
+        return HandRanks.packKey(8, [v for n, v in groups])
+    if shape[:2] == [3, 2]:
+        return HandRanks.packKey(7, [v for n, v in groups])
+    if flush:
+        return HandRanks.packKey(6, values)
+    if straight:
+        return HandRanks.packKey(5, values)
+    if shape[0] == 3:
+        return HandRanks.packKey(4, [v for n, v in groups])
+    if shape[:2] == [2, 2]:
+        return HandRanks.packKey(3, [v for n, v in groups])
+    if shape[0] == 2:
+        return HandRanks.packKey(2, [v for n, v in groups])
+    return HandRanks.packKey(1, values)
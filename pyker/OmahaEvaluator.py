@@ -0,0 +1,119 @@
+#******************************************************************************
+# OmahaEvaluator.py                                 Author: Curtis Smith
+# Written in Python 3.2
+#
+# Omaha (4 card) and 5 card Omaha hand evaluation, high and eight-or-better
+# low, using the HandEvaluator and LowEvaluator tables.
+#******************************************************************************
+
+import itertools
+
+import HandEvaluator
+import LowEvaluator
+
+# Highest low card; (c % 13 + 2) % 14 is a card's rank with the ace as 0.
+LOWQUALIFIER = LowEvaluator.QUALIFIER
+
+#------------------------------------------------------------------------------
+# An Omaha hand must use exactly two hole cards and three board cards. Rather
+# than scoring all C(4,2) x C(5,3) = 60 five card hands, an OmahaBoard works
+# out what it can once per board and shares it between all the players:
+#     - the rank-prime product of every set of three board cards, so the best
+#       non-flush hand for a pair of hole cards is the best of a few rank
+#       table lookups, which is remembered for each distinct pair of ranks.
+#     - the rank masks of the three-card sets in each suit with 3+ board
+#       cards, so flushes are only looked at for suited hole pairs in those
+#       suits.
+# Every score is the HandEvaluator (high) or LowEvaluator (low) key of the
+# best five card hand, so they compare with hold'em scores directly.
+#------------------------------------------------------------------------------
+
+class OmahaBoard:
+    ''' Precomputed summary of a 3 to 5 card board for Omaha showdowns. '''
+    def __init__(self, board):
+        if HandEvaluator.RANK_TABLE is None:
+            HandEvaluator.buildTables()
+        primes = HandEvaluator.CARD_PRIMES
+        self.board = list(board)
+        self.triples = list(set(primes[a] * primes[b] * primes[c] for a, b, c
+                                in itertools.combinations(board, 3)))
+        self.flushTriples = [[], [], [], []]
+        for suit in range(4):
+            cards = [c for c in board if HandEvaluator.CARD_SUITS[c] == suit]
+            for a, b, c in itertools.combinations(cards, 3):
+                self.flushTriples[suit].append(HandEvaluator.CARD_BITS[a] |
+                    HandEvaluator.CARD_BITS[b] | HandEvaluator.CARD_BITS[c])
+        # Only sets of three different ranks no higher than QUALIFIER (aces
+        # low) can be part of an eight-or-better low.
+        lowRanks = [c for c in board if (c % 13 + 2) % 14 <= LOWQUALIFIER]
+        self.lowTriples = list(set(primes[a] * primes[b] * primes[c]
+                                for a, b, c in itertools.combinations(lowRanks, 3)
+                                if (a - b) % 13 and (a - c) % 13 and (b - c) % 13))
+        self.hiPairs = {}   # Hole pair rank product -> best non-flush score.
+        self.lowPairs = {}  # Hole pair rank product -> best raw low value.
+
+    def scoreHi(self, hole):
+        ''' Returns the high score of a 4 or 5 card Omaha hand. '''
+        primes = HandEvaluator.CARD_PRIMES
+        suits = HandEvaluator.CARD_SUITS
+        bits = HandEvaluator.CARD_BITS
+        ranks = HandEvaluator.RANK_TABLE
+        flushes = HandEvaluator.FLUSH_TABLE
+        pairs = self.hiPairs
+        best = 0
+        for a, b in itertools.combinations(hole, 2):
+            product = primes[a] * primes[b]
+            score = pairs.get(product)
+            if score is None:
+                score = max([ranks[product * t] for t in self.triples])
+                pairs[product] = score
+            if suits[a] == suits[b]:
+                mask = bits[a] | bits[b]
+                for triple in self.flushTriples[suits[a]]:
+                    flush = flushes[mask | triple]
+                    if flush > score:
+                        score = flush
+            if score > best:
+                best = score
+        return best
+
+    def scoreLow(self, hole):
+        ''' Returns the ace-to-five eight-or-better low key of a 4 or 5 card
+            Omaha hand, or 0 if it has no qualifying low. '''
+        triples = self.lowTriples
+        if not triples:
+            return 0
+        primes = HandEvaluator.CARD_PRIMES
+        lows = LowEvaluator.getTables(False, True)[0]
+        pairs = self.lowPairs
+        cards = [c for c in hole if (c % 13 + 2) % 14 <= LOWQUALIFIER]
+        best = LowEvaluator.LOWBASE
+        for a, b in itertools.combinations(cards, 2):
+            product = primes[a] * primes[b]
+            raw = pairs.get(product)
+            if raw is None:
+                raw = min([lows[product * t] for t in triples])
+                pairs[product] = raw
+            if raw < best:
+                best = raw
+        if best == LowEvaluator.LOWBASE:
+            return 0
+        return LowEvaluator.lowKey(best, True)
+
+def evaluateOmaha(hole, board):
+    ''' Returns the high score of an Omaha hand (4 or 5 hole cards) on a 3 to
+        5 card board, all compact card ints. '''
+    return OmahaBoard(board).scoreHi(hole)
+
+def evaluateOmahaLow(hole, board):
+    ''' Returns the eight-or-better low key of an Omaha hand, or 0. '''
+    return OmahaBoard(board).scoreLow(hole)
+
+def bestHand(hole, board):
+    ''' Returns the five cards (two hole, three board) that make the best
+        Omaha high hand. '''
+    target = evaluateOmaha(hole, board)
+    for pair in itertools.combinations(hole, 2):
+        for triple in itertools.combinations(board, 3):
+            if HandEvaluator.evaluate(pair + triple) == target:
+                return list(pair + triple)
@@ -7,12 +7,83 @@
 
 import random
 
+#------------------------------------------------------------------------------
+# Compact card encoding: a card can also be represented by a single int from
+# 0-51 laid out in the same order as an unshuffled deck, i.e.
+# (suit - 1) * 13 + (rank - 2), with an ace always encoded as rank 14. A set
+# of cards can be represented as a bitmask with bit n set for card n.
+#------------------------------------------------------------------------------
+
+DECKSIZE = 52 # The number of cards (and card ints) in a deck.
+
+def cardInt(rank, suit):
+    ''' Returns the compact int for a rank (1-14) and suit (1-4). '''
+    return (suit - 1) * 13 + (rank - 2) % 13
+
+def toInt(card):
+    ''' Returns the compact int for a Card object (or a compact int). '''
+    if isinstance(card, int):
+        return card
+    return card.toInt()
+
+def intRank(card):
+    ''' Returns the rank (2-14) of a compact card int. '''
+    return card % 13 + 2
+
+def intSuit(card):
+    ''' Returns the suit (1-4) of a compact card int. '''
+    return card // 13 + 1
+
+def intStr(card):
+    ''' Returns the short description of a compact card int, ie. "Ah". '''
+    return Card.rank_descs[card % 13 + 2] + Card.suit_descs[card // 13 + 1]
+
+def cardMask(cards):
+    ''' Returns the bitmask of a list of compact card ints. '''
+    mask = 0
+    for c in cards:
+        mask |= 1 << c
+    return mask
+
+def maskCards(mask):
+    ''' Returns the list of compact card ints set in a bitmask, lowest first.
+        '''
+    cards = []
+    while mask:
+        low = mask & -mask
+        cards.append(low.bit_length() - 1)
+        mask ^= low
+    return cards
+
 class Deck:
     ''' Represents a deck (array) of card objects. '''
-    def __init__(self, acesLow = False):
-        ''' Initializes the deck of cards with card objects. '''
+    def __init__(self, acesLow = False, compact = False, seed = None,
+                lazy = False):
+        ''' Initializes the deck of cards with card objects. If compact is
+            True the deck holds compact card ints instead, so dealing and
+            ranking never build Card objects. If a seed is given the deck
+            shuffles with its own random generator seeded with it, otherwise
+            it uses the global random module. If lazy is True the deck is never
+            shuffled up front; each card dealt is picked at random from the
+            cards left (a partial Fisher-Yates shuffle), so only as many cards
+            are shuffled as are dealt. Compact card ints always encode the ace
+            as high, so a compact deck can't have low aces. '''
+        if compact and acesLow:
+            raise ValueError("A compact deck can't have low aces.")
         self.deck = []
         self.discards = []
+        self.compact = compact
+        self.lazy = lazy
+        if seed is None:
+            self.rng = random
+        else:
+            self.rng = random.Random(seed)
+        if compact:
+            self.deck = list(range(DECKSIZE))
+            return
+        if not acesLow:
+            self.deck = list(CARDS) # Already in unshuffled deck order.
+            return
         lowAce = 0 # set to 1 if aces are low
         if acesLow:
             lowAce = 1
@@ -26,8 +97,10 @@ class Deck:
             i += 1
     
     def shuffle(self):
-        '''	Shuffles whatever is left in deck '''
-        random.shuffle(self.deck)
+        '''	Shuffles whatever is left in deck. A lazy deck is left as it is
+            since it picks its cards at random as they are dealt. '''
+        if not self.lazy:
+            self.rng.shuffle(self.deck)
     
     def reShuffle(self):
         ''' Shuffles the discards back into the deck '''
@@ -35,15 +108,39 @@ class Deck:
         self.discards = []
         self.shuffle()
     
-    def deal(self):
-        ''' Reshuffles the deck if it's empty, otherwise
-            it returns the first item from the deck '''
-        if len(self.deck) == 0:
+    def deal(self, count = None):
+        ''' Reshuffles the deck if it's empty, otherwise it returns the last
+            item from the deck (False if there are no cards at all). If a
+            count is given, a list of that many cards is returned instead. '''
+        if count is None:
+            return self.dealCard()
+        deck = self.deck
+        if not self.lazy or len(deck) < count:
+            return [self.dealCard() for i in range(count)]
+        rand = self.rng.random # Cheaper than randrange; bias is ~2**-53.
+        cards = []
+        n = len(deck)
+        for i in range(count):
+            j = int(rand() * n)
+            n -= 1
+            card = deck[j]
+            deck[j] = deck[n]
+            cards.append(card)
+        del deck[n:]
+        return cards
+    
+    def dealCard(self):
+        ''' Deals a single card in O(1) by popping it off the end of the deck
+            (after swapping a random card there if the deck is lazy). '''
+        deck = self.deck
+        if len(deck) == 0:
             self.reShuffle()
-        try:
-            return self.deck.pop(0)
-        except IndexError:
+        if len(deck) == 0:
             return False
+        if self.lazy:
+            j = int(self.rng.random() * len(deck))
+            deck[j], deck[-1] = deck[-1], deck[j]
+        return deck.pop()
             
     def reset(self):
         ''' Resets the deck and shuffles it '''
@@ -54,19 +151,58 @@ class Deck:
     def discard(self, card):
         ''' Takes an array of cards and adds them to the discard pile '''
         self.discards.append(card)
+    
+    def remove(self, cards):
+        ''' Takes an array of dead cards (Card objects or compact ints) and
+            removes them from the deck. Cards are matched by their compact
+            int since Card equality only compares suits. '''
+        dead = cardMask([c if isinstance(c, int) else c.toInt() for c in cards])
+        if self.compact:
+            self.deck = [c for c in self.deck if not dead & (1 << c)]
+        else:
+            self.deck = [c for c in self.deck if not dead & (1 << c.toInt())]
+
+#------------------------------------------------------------------------------
+# Cards, ranks and suits never change once they are made, so they are
+# interned: Card(rank, suit), Rank(rank) and Suit(suit) return the one shared
+# object for that value, creating it the first time. Every Deck shares the
+# same 52 Card objects (CARDS, indexed by compact int), and the classes use
+# __slots__ so the objects carry no per-instance dict.
+#------------------------------------------------------------------------------
 
 class Card:
     ''' Create a card object with the card's rank and suit. '''
+    __slots__ = ('rank', 'suit')
     
     rank_descs = {  1:"A",  2:"2",  3:"3",  4:"4",  5:"5",  6:"6",  7:"7",
                     8:"8",  9:"9", 10:"T", 11:"J", 12:"Q", 13:"K", 14:"A"   }
     suit_descs = {  1:"c",  2:"s",  3:"d",  4:"h"   }   
+    interned = {} # (rank, suit) -> Card
+    
+    def __new__(cls, rank, suit):
+        ''' Returns the card object with the rank and suit objects for the
+            values passed.'''
+        card = cls.interned.get((rank, suit))
+        if card is None:
+            card = object.__new__(cls)
+            card.rank = Rank(rank)
+            card.suit = Suit(suit)
+            cls.interned[(rank, suit)] = card
+        return card
+    
+    def __reduce__(self):
+        return (Card, (self.rank.rank, self.suit.suit))
+    
+    @classmethod
+    def fromInt(cls, card, acesLow = False):
+        ''' Returns the card object for a compact card int. '''
+        if acesLow and card % 13 == 12:
+            return cls(1, card // 13 + 1)
+        return CARDS[card]
     
-    def __init__(self, rank, suit):
-        ''' Creates a card object initializing the rank and suit objects
-            with the values passed.'''
-        self.rank = Rank(rank)
-        self.suit = Suit(suit)
+    def toInt(self):
+        ''' Returns the compact int encoding of the card. '''
+        return (self.suit.suit - 1) * 13 + (self.rank.rank - 2) % 13
     
     #--------------------------------------------------------------------------
     # Comparison operators: Defines the special object comparison methods as
@@ -123,13 +259,24 @@ class Rank:
     ''' Represents the rank of a playing card. Holds a number value
         from 1-14 (Corresponding to A23456789TJQKA respectively. '''
     
+    __slots__ = ('rank',)
+    
     descs = {   1: "Ace", 2: "Two", 3: "Three", 4: "Four", 5: "Five",
                 6: "Six", 7: "Seven", 8: "Eight", 9: "Nine", 10: "Ten",
                 11: "Jack", 12: "Queen", 13: "King", 14: "Ace"}
+    interned = {} # rank -> Rank
+    
+    def __new__(cls, rank):
+        ''' Returns the shared object for the rank value. '''
+        obj = cls.interned.get(rank)
+        if obj is None:
+            obj = object.__new__(cls)
+            obj.rank = rank
+            cls.interned[rank] = obj
+        return obj
     
-    def __init__(self, rank):
-        ''' Initializes the object's rank variable '''
-        self.rank = rank
+    def __reduce__(self):
+        return (Rank, (self.rank,))
     
     def __lt__(self, other):
         if self.rank < other.rank:
@@ -162,11 +309,22 @@ class Suit:
     ''' Represents the suit of a playing card with the integer values
         1, 2, 3, 4 representing clubs, spades, diamonds, and hearts
         respectively. '''
+    __slots__ = ('suit',)
+    
     descs = {1: "Clubs", 2: "Spades", 3: "Diamonds", 4: "Hearts"}
+    interned = {} # suit -> Suit
     
-    def __init__(self, suit):
-        ''' Initializes the suit variable to the value passed. '''
-        self.suit = suit
+    def __new__(cls, suit):
+        ''' Returns the shared object for the suit value. '''
+        obj = cls.interned.get(suit)
+        if obj is None:
+            obj = object.__new__(cls)
+            obj.suit = suit
+            cls.interned[suit] = obj
+        return obj
+    
+    def __reduce__(self):
+        return (Suit, (self.suit,))
     
     def __eq__(self, other):
         if self.suit == other.suit:
@@ -181,4 +339,6 @@ class Suit:
             return False
     
     def __str__(self):
-        return self.descs[self.suit]
\ No newline at end of file
+        return self.descs[self.suit]
+
+CARDS = [Card(card % 13 + 2, card // 13 + 1) for card in range(DECKSIZE)]
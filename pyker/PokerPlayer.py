@@ -16,4 +16,4 @@ class PokerPlayer:
         self.name = name
         self.money = money
         self.id = self.counter
-        counter += 1
\ No newline at end of file
+        PokerPlayer.counter += 1
\ No newline at end of file
@@ -5,6 +5,8 @@
 # Represents a player's hand of playing cards.
 #******************************************************************************
 
+import HandEvaluator
+import HandRanking
 import PlayingCards
 
 class Table:
@@ -22,7 +24,7 @@ class Table:
         i = 0
         self.seats = []
         while i < totalSeats:
-            seats.append(Seat(i + 1))
+            self.seats.append(Seat(i + 1))
             i += 1
         self.deck = PlayingCards.Deck()
         self.board = []
@@ -41,11 +43,193 @@ class Table:
         return count
     
     def moveButton(self):
-        ''' Moves the button a position to the right. If the game is a cash
-            game, the button skips seats that are sitting out. '''
-        if self.cashTable:
-            
+        ''' Moves the button a position to the right, skipping empty seats. If
+            the game is a cash game, the button skips seats that are sitting
+            out as well. '''
+        i = self.button
+        for n in range(len(self.seats)):
+            i = (i + 1) % len(self.seats)
+            seat = self.seats[i]
+            if seat.player is not None and not (self.cashTable and
+                                                seat.sittingOut):
+                break
+        self.button = i
+    
     def resetState(self):
+        ''' Returns the board and every seat's cards to the deck and empties
+            the pot, ready for a new hand. Occupied seats that aren't sitting
+            out are dealt back in. '''
+        while len(self.board) > 0:
+            self.deck.discard(self.board.pop())
+        for seat in self.seats:
+            seat.resetState(self.deck)
+            if seat.player is None or seat.sittingOut:
+                seat.folded = True
+        self.pot = 0.0
+    
+    def dealBoard(self, count = 1):
+        ''' Deals count community cards and adds each one to the running hand
+            evaluation of every seat still in the hand. '''
+        for n in range(count):
+            card = self.deck.deal()
+            self.board.append(card)
+            for seat in self.seats:
+                if not seat.folded:
+                    seat.hand.addBoardCard(card)
+    
+    #--------------------------------------------------------------------------
+    # Showdown. Every live seat is scored once (compact card ints, so no
+    # HandRank objects are built), then the pots are built from what each seat
+    # wagered: sorting the seats by their wager, each distinct wager level
+    # adds a pot of (level - previous level) from every seat that put in at
+    # least that much, which only the seats still in the hand can win. Levels
+    # with the same live seats are merged, so usually only all-ins start a new
+    # side pot.
+    #--------------------------------------------------------------------------
+    
+    def buildPots(self):
+        ''' Splits the chips wagered this hand into a main pot and side pots.
+            Returns a list of Pot objects, main pot first. Chips in the pot
+            that no seat's wager accounts for (ie. dead money) go to the main
+            pot. If every seat that wagered has folded, the chips go to the
+            seats still in the hand, or back to the seats that wagered them if
+            there are none (see showdown). '''
+        order = sorted((i for i in range(len(self.seats))
+                        if self.seats[i].wagered > 0),
+                        key = lambda i: self.seats[i].wagered)
+        eligible = [i for i in order if not self.seats[i].folded]
+        live = [i for i in range(len(self.seats)) if not self.seats[i].folded]
+        if not eligible:
+            eligible = list(live) # Nobody still in the hand wagered anything.
+        pots = []
+        previous = 0
+        for n in range(len(order)):
+            level = self.seats[order[n]].wagered
+            if level > previous:
+                amount = (level - previous) * (len(order) - n)
+                if pots and (pots[-1].seats == eligible or not eligible):
+                    pots[-1].amount += amount # Same seats, or an overbet.
+                else:
+                    pots.append(Pot(amount, list(eligible)))
+                previous = level
+            if order[n] in eligible:
+                eligible.remove(order[n])
+        dead = self.pot - sum(seat.wagered for seat in self.seats)
+        if dead > 0:
+            if pots:
+                pots[0].amount += dead
+            else:
+                pots.append(Pot(dead, live))
+        return pots
+    
+    def showdown(self, scoreHi = None, scoreLow = None, chipUnit = 1):
+        ''' Settles the hand: scores every seat still in it, builds the pots
+            (see buildPots) and pays each pot to the seats that can win it.
+            scoreHi(hand, board) and scoreLow(hand, board) take lists of
+            compact card ints and return a score where larger is better; by
+            default hands get their hold'em score. If scoreLow is given the
+            game is hi/lo: each pot is split between the best high hand and
+            the best low (a score of 0 means no low), and the high hand
+            scoops it if nobody has a low. For Omaha, pass the scoreHi and
+            scoreLow methods of an OmahaEvaluator.OmahaBoard wrapped to take
+            (hand, board).
+            Pots are split in units of chipUnit; odd chips go to the high
+            half of a hi/lo pot, and then one each to the winners closest to
+            the left of the button. Winnings are added to the seats' chips
+            and the table's pot is emptied. Returns the list of Pot objects,
+            with their winners filled in. '''
+        pots = self.buildPots()
+        live = [i for i in range(len(self.seats)) if not self.seats[i].folded]
+        hiScores = {}
+        lowScores = {}
+        if len(live) > 1:
+            board = [PlayingCards.toInt(c) for c in self.board]
+            for i in live:
+                hand = self.seats[i].hand
+                cards = [PlayingCards.toInt(c) for c in hand.cards]
+                if scoreHi is None:
+                    score = None
+                    if (hand.state is not None and
+                            hand.state.count == len(cards) + len(board)):
+                        score = hand.currentScore()
+                    if score is None:
+                        score = HandRanking.scoreHandHi(cards, board)
+                    hiScores[i] = score
+                else:
+                    hiScores[i] = scoreHi(cards, board)
+                if scoreLow is not None:
+                    lowScores[i] = scoreLow(cards, board)
+        for pot in pots:
+            # Seats in the order odd chips are handed out.
+            seats = sorted(pot.seats, key = lambda i: (i - self.button - 1) %
+                                                    len(self.seats))
+            if not seats:
+                # Everyone folded; the chips go back to the seats that
+                # wagered them.
+                wagered = sum(seat.wagered for seat in self.seats)
+                for i in range(len(self.seats)):
+                    if wagered and self.seats[i].wagered:
+                        pot.award(i, pot.amount * self.seats[i].wagered /
+                                    wagered)
+                        self.seats[i].chips += pot.winners[i]
+                continue
+            if len(seats) > 1:
+                best = max(hiScores[i] for i in seats)
+                pot.hiWinners = [i for i in seats if hiScores[i] == best]
+                if lowScores:
+                    best = max(lowScores[i] for i in seats)
+                    if best:
+                        pot.lowWinners = [i for i in seats
+                                        if lowScores[i] == best]
+            else:
+                pot.hiWinners = seats
+            units = int(pot.amount / chipUnit + 1e-9)
+            if pot.lowWinners:
+                lowUnits = units // 2
+                pot.splitUnits(pot.hiWinners, units - lowUnits, chipUnit)
+                pot.splitUnits(pot.lowWinners, lowUnits, chipUnit)
+            else:
+                pot.splitUnits(pot.hiWinners, units, chipUnit)
+            # Anything smaller than a chipUnit goes with the first odd chip.
+            pot.award(pot.hiWinners[0], pot.amount - units * chipUnit)
+            for i, amount in pot.winners.items():
+                self.seats[i].chips += amount
+        self.pot = 0.0
+        return pots
+    
+
+class Pot:
+    ''' Represents a main or side pot. Holds the amount in the pot, the
+        indices of the seats that can win it, and once the hand is settled
+        the seats that won it. '''
+    def __init__(self, amount, seats):
+        ''' Variables describing the pot:
+            amount : (double) The chips in the pot.
+            seats : (int[]) Indices of the seats that can win the pot.
+            hiWinners : (int[]) Indices of the seats with the best high hand.
+            lowWinners : (int[]) Indices of the seats with the best low hand.
+            winners : (dict) Seat index -> the chips won from this pot. '''
+        self.amount = amount
+        self.seats = seats
+        self.hiWinners = []
+        self.lowWinners = []
+        self.winners = {}
+    
+    def award(self, seat, amount):
+        ''' Adds amount to what a seat wins from the pot. '''
+        if amount:
+            self.winners[seat] = self.winners.get(seat, 0) + amount
+    
+    def splitUnits(self, seats, units, chipUnit):
+        ''' Splits units chips of chipUnit evenly between seats (in odd-chip
+            order), the first seats taking one each of any left over. '''
+        share, odd = divmod(units, len(seats))
+        for n in range(len(seats)):
+            self.award(seats[n], (share + (n < odd)) * chipUnit)
+    
+    def __str__(self):
+        return ("Pot of " + str(self.amount) + " between seats " +
+                str([i + 1 for i in self.seats]) + ".")
     
 
 class Seat:
@@ -79,16 +263,56 @@ class Seat:
     def resetState(self, deck):
         self.hand.reset(deck)
         self.folded = False
+        self.wagered = 0
     
     
 
 class Hand:
     ''' Represents a hand. Holds cards, and has methods to discard cards from
         the hand as well as a method to reset the hand to an empty array. '''
+    __slots__ = ('cards', 'hiHandRank', 'lowHandRank', 'state')
+    
     def __init__(self):
         self.cards = []
         self.hiHandRank = None
         self.lowHandRank = None
+        self.state = HandEvaluator.HandState() # Hole cards plus the board.
+    
+    def addCard(self, card):
+        ''' Adds a hole card to the hand. '''
+        self.cards.append(card)
+        if len(self.cards) > 2 and self.state is not None and \
+                self.state.count >= len(self.cards):
+            self.state = None # Already has board cards; see addBoardCard.
+        self.addState(card)
+    
+    def addBoardCard(self, card):
+        ''' Adds a community card to the hand's running evaluation. The
+            evaluation may use any of the hand's cards, so with a board it's
+            only kept for hands of up to 2 hole cards (not ie. Omaha, which
+            must use exactly 2). Hands without a board (draw or stud) are
+            evaluated up to 7 cards. '''
+        if len(self.cards) > 2:
+            self.state = None
+        self.addState(card)
+    
+    def addState(self, card):
+        ''' Adds a card to the running evaluation, dropping it past 7 cards.
+            '''
+        if self.state is not None:
+            if self.state.count < 7:
+                self.state.add(PlayingCards.toInt(card))
+            else:
+                self.state = None
+    
+    def currentScore(self):
+        ''' Returns the score (see HandEvaluator) of the best hand that can be
+            made from the hole cards and the board dealt so far, or None
+            before there are 5 cards (or with more than 7, or more than 2
+            hole cards and a board). Costs a single table lookup. '''
+        if self.state is None:
+            return None
+        return self.state.score()
     
     def discard(self, locations, deck):
         ''' Takes a str describing the locations of the cards that the player
@@ -101,7 +325,11 @@ class Hand:
             i = len(locations) - 1
             while i >= 0:
                 discards.append(self.cards.pop(int(locations[i]) - 1))
-            deck.discard(discards)
+                i -= 1
+            for card in discards:
+                deck.discard(card)
+            self.state = HandEvaluator.HandState(
+                                [PlayingCards.toInt(c) for c in self.cards])
     
     def reset(self, deck):
         ''' Discards the hand back into the deck. Resets the handRank
@@ -110,6 +338,7 @@ class Hand:
             deck.discard(self.cards.pop(0))
         self.hiHandRank = None
         self.lowHandRank = None
+        self.state = HandEvaluator.HandState()
     
     #--------------------------------------------------------------------------
     # Comparison methods for comparing two hands.
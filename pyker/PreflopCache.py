@@ -0,0 +1,210 @@
+#******************************************************************************
+# PreflopCache.py                                   Author: Curtis Smith
+# Written in Python 3.2
+#
+# Precomputed preflop all-in equities for the 169 starting hand classes,
+# stored in a compact binary file that is memory-mapped for lookups.
+# Build the file once with: python pyker/PreflopCache.py [--trials N]
+#******************************************************************************
+
+import argparse
+import array
+import mmap
+import os
+import struct
+
+import Equity
+
+#------------------------------------------------------------------------------
+# Hand classes are the cells of the usual 13 x 13 grid, with the ranks from
+# ace (row/column 0) down to deuce: pairs on the diagonal, suited hands above
+# it and offsuit hands below it, so class = row * 13 + column.
+#
+# The file holds a header followed by float32 arrays, both in the byte order
+# of the machine that wrote it (the header's order marker lets a machine with
+# the other order refuse the file):
+#     equity vs class : CLASSES x CLASSES, [a][b] is a's equity against b.
+#     equity vs random : CLASSES x MAXOPPONENTS, [a][n - 1] is a's equity
+#                        against n random hands.
+#------------------------------------------------------------------------------
+
+CLASSES = 169
+MAXOPPONENTS = 8
+MAGIC = b"PYKRPRE1"
+VERSION = 2
+HEADER = struct.Struct("=8sIIIII") # Magic, version, classes, opponents,
+                                    # trials and the byte order marker.
+ORDER = 0x01020304
+RANKS = "AKQJT98765432"
+
+DEFAULTPATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "preflop.dat")
+
+CACHES = {} # Path -> loaded PreflopCache
+
+def handClass(card1, card2):
+    ''' Returns the class (0-168) of two hole cards as compact card ints. '''
+    i = 12 - max(card1 % 13, card2 % 13)
+    j = 12 - min(card1 % 13, card2 % 13)
+    if card1 // 13 == card2 // 13:
+        return i * 13 + j
+    return j * 13 + i
+
+def className(index):
+    ''' Returns the name of a class, ie. "AA", "AKs" or "72o". '''
+    i, j = divmod(index, 13)
+    if i == j:
+        return RANKS[i] * 2
+    if i < j:
+        return RANKS[i] + RANKS[j] + "s"
+    return RANKS[j] + RANKS[i] + "o"
+
+def classCombos(index):
+    ''' Returns every two card combo (as a list of two compact card ints) in a
+        class: 6 for pairs, 4 suited and 12 offsuit. '''
+    i, j = divmod(index, 13)
+    hi = 12 - min(i, j)
+    lo = 12 - max(i, j)
+    combos = []
+    for s1 in range(4):
+        for s2 in range(4):
+            if i == j and s1 >= s2 or i < j and s1 != s2 or \
+                    i > j and s1 == s2:
+                continue
+            combos.append([s1 * 13 + hi, s2 * 13 + lo])
+    return combos
+
+#------------------------------------------------------------------------------
+# Building. Every equity is a Monte Carlo estimate from the ranges of combos,
+# so card removal between the hands is accounted for.
+#------------------------------------------------------------------------------
+
+RANDOMRANGE = [[a, b] for a in range(52) for b in range(a + 1, 52)]
+
+def matchupEquity(a, b, trials, seed = None):
+    ''' Returns a Monte Carlo estimate of class a's equity against class b.
+        '''
+    calculator = Equity.EquityCalculator([classCombos(a), classCombos(b)],
+                                        seed = seed)
+    return calculator.run(trials).equity[0]
+
+def randomEquity(a, opponents, trials, seed = None):
+    ''' Returns a Monte Carlo estimate of class a's equity against a number
+        of random hands. '''
+    calculator = Equity.EquityCalculator([classCombos(a)] +
+                                        [RANDOMRANGE] * opponents, seed = seed)
+    return calculator.run(trials).equity[0]
+
+def build(path = DEFAULTPATH, trials = 5000, seed = 1):
+    ''' Works out every equity with trials runouts each and writes the cache
+        file. Equity vs class is symmetric, so only half the matchups are
+        run. '''
+    matchups = [[0.5] * CLASSES for a in range(CLASSES)]
+    for a in range(CLASSES):
+        for b in range(a + 1, CLASSES):
+            equity = matchupEquity(a, b, trials, seed + a * CLASSES + b)
+            matchups[a][b] = equity
+            matchups[b][a] = 1.0 - equity
+    multiway = [[randomEquity(a, n, trials, seed + a * 100 + n)
+                for n in range(1, MAXOPPONENTS + 1)] for a in range(CLASSES)]
+    write(path, matchups, multiway, trials)
+
+def write(path, matchups, multiway, trials):
+    ''' Writes a cache file from the CLASSES x CLASSES equities vs class
+        and the CLASSES x MAXOPPONENTS equities vs random hands. '''
+    data = HEADER.pack(MAGIC, VERSION, CLASSES, MAXOPPONENTS, trials, ORDER)
+    values = [e for row in matchups for e in row] + \
+            [e for row in multiway for e in row]
+    data += array.array("f", values).tobytes()
+    temp = path + ".tmp"
+    with open(temp, "wb") as f:
+        f.write(data)
+    os.replace(temp, path) # Readers never see a partly written file.
+
+#------------------------------------------------------------------------------
+# Lookups.
+#------------------------------------------------------------------------------
+
+class PreflopCache:
+    ''' A cache file mapped into memory. The data is only read (and only the
+        pages touched are loaded), and lookups are a single index into the
+        mapped floats. '''
+    def __init__(self, path = DEFAULTPATH):
+        size = HEADER.size + 4 * (CLASSES * CLASSES + CLASSES * MAXOPPONENTS)
+        if os.path.getsize(path) < HEADER.size: # mmap can't map an empty file.
+            raise ValueError("Not a whole preflop cache file of this "
+                            "version and byte order.")
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+        magic, version, classes, opponents, trials, order = \
+                HEADER.unpack_from(self.map)
+        if magic != MAGIC or version != VERSION or classes != CLASSES or \
+                opponents != MAXOPPONENTS or order != ORDER or \
+                len(self.map) != size:
+            self.map.close()
+            raise ValueError("Not a whole preflop cache file of this "
+                            "version and byte order.")
+        self.trials = trials
+        self.values = memoryview(self.map)[HEADER.size:].cast("f")
+        self.matchups = self.values[:CLASSES * CLASSES]
+        self.multiway = self.values[CLASSES * CLASSES:]
+
+    def equity(self, a, b):
+        ''' Returns class a's all-in equity against class b. '''
+        return self.matchups[a * CLASSES + b]
+
+    def vsRandom(self, a, opponents = 1):
+        ''' Returns class a's all-in equity against opponents (1-8) random
+            hands. '''
+        return self.multiway[a * MAXOPPONENTS + opponents - 1]
+
+    def handEquity(self, hand1, hand2):
+        ''' Returns the equity of hole cards hand1 against hand2 (each a list
+            of two compact card ints) from their classes. '''
+        return self.equity(handClass(*hand1), handClass(*hand2))
+
+    def multiwayEquity(self, classes):
+        ''' Approximates the all-in equity of each of several classes against
+            the others: each class's weight is the product of its heads-up
+            equities against the rest, and the weights are scaled to sum to
+            1. '''
+        weights = []
+        for i in range(len(classes)):
+            weight = 1.0
+            for j in range(len(classes)):
+                if i != j:
+                    weight *= self.matchups[classes[i] * CLASSES + classes[j]]
+            weights.append(weight)
+        total = sum(weights)
+        return [w / total for w in weights]
+
+    def close(self):
+        ''' Unmaps the file. '''
+        self.matchups.release()
+        self.multiway.release()
+        self.values.release()
+        self.map.close()
+
+def load(path = DEFAULTPATH):
+    ''' Returns the cache at path, mapping it the first time it's asked for.
+        '''
+    cache = CACHES.get(path)
+    if cache is None:
+        if not os.path.exists(path):
+            raise IOError("No preflop cache at " + path + "; build it with "
+                        "python pyker/PreflopCache.py.")
+        cache = PreflopCache(path)
+        CACHES[path] = cache
+    return cache
+
+def main():
+    parser = argparse.ArgumentParser(description = "Builds the preflop cache.")
+    parser.add_argument("--path", default = DEFAULTPATH)
+    parser.add_argument("--trials", type = int, default = 5000,
+                        help = "runouts per equity")
+    parser.add_argument("--seed", type = int, default = 1)
+    args = parser.parse_args()
+    build(args.path, args.trials, args.seed)
+
+if __name__ == '__main__':
+    main()
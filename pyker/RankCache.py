@@ -0,0 +1,94 @@
+#******************************************************************************
+# RankCache.py                                      Author: Curtis Smith
+# Written in Python 3.2
+#
+# A bounded, thread-safe cache of hand rankings keyed on the set of cards,
+# for replays and simulations that rank the same card sets again and again.
+#******************************************************************************
+
+import collections
+import threading
+
+LRU = "lru"   # Evict the ranking used longest ago.
+FIFO = "fifo" # Evict the ranking added longest ago (hits don't reorder).
+
+#------------------------------------------------------------------------------
+# Keys. Card objects can't be hashed (they compare by rank or suit only), so
+# a set of cards is keyed on a bitmask with one bit per rank (ace low and
+# ace high apart) and suit: bit (suit - 1) * 14 + (rank - 1). The same cards
+# in any order, as Card objects or compact card ints, give the same key.
+#------------------------------------------------------------------------------
+
+def cardKey(cards):
+    ''' Returns the order-independent key of a list of Card objects or
+        compact card ints. '''
+    key = 0
+    for c in cards:
+        if isinstance(c, int):
+            key |= 1 << (c // 13 * 14 + c % 13 + 1)
+        else:
+            key |= 1 << ((c.suit.suit - 1) * 14 + c.rank.rank - 1)
+    return key
+
+class RankCache:
+    ''' Caches the results of a ranking function of a list of cards, such as
+        HandRanking.rankCardsHi. Holds at most maxSize results, evicting by
+        policy (LRU or FIFO) when full. The cached results are shared, so
+        callers mustn't change them. Counters:
+            hits : (int) lookups answered from the cache.
+            misses : (int) lookups that had to rank the cards.
+            evictions : (int) results dropped to make room. '''
+    def __init__(self, rank, maxSize = 65536, policy = LRU):
+        ''' Takes the ranking function, the most results to keep and the
+            eviction policy. '''
+        if maxSize < 1:
+            raise ValueError("A RankCache must hold at least one result.")
+        if policy not in (LRU, FIFO):
+            raise ValueError("Unknown eviction policy: " + str(policy))
+        self.rank = rank
+        self.maxSize = maxSize
+        self.policy = policy
+        self.results = collections.OrderedDict() # Key -> result, oldest first.
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, cards):
+        ''' Returns the ranking of a list of cards, from the cache if it's
+            there. The cards are ranked outside the lock, so two threads
+            missing on the same cards may both rank them. '''
+        key = cardKey(cards)
+        with self.lock:
+            result = self.results.get(key)
+            if result is not None:
+                self.hits += 1
+                if self.policy == LRU:
+                    self.results.move_to_end(key)
+                return result
+            self.misses += 1
+        result = self.rank(cards)
+        with self.lock:
+            self.results[key] = result
+            while len(self.results) > self.maxSize:
+                self.results.popitem(last = False)
+                self.evictions += 1
+        return result
+
+    def __len__(self):
+        return len(self.results)
+
+    def hitRate(self):
+        ''' Returns the share of lookups answered from the cache. '''
+        lookups = self.hits + self.misses
+        if not lookups:
+            return 0.0
+        return self.hits / lookups
+
+    def clear(self):
+        ''' Drops every result and resets the counters. '''
+        with self.lock:
+            self.results.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
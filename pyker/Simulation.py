@@ -0,0 +1,114 @@
+#******************************************************************************
+# Simulation.py                                     Author: Curtis Smith
+# Written in Python 3.2
+#
+# Runs equity and hand distribution jobs across a pool of worker processes.
+#******************************************************************************
+
+import concurrent.futures
+import multiprocessing
+import random
+
+import Equity
+import HandEvaluator
+import PlayingCards
+
+class SimulationRunner:
+    ''' Splits simulation work into chunks, runs them on a process pool and
+        merges the tallies. Every chunk gets its own seed drawn from a master
+        generator seeded with seed, so a run with the same seed and chunk
+        count is reproducible no matter how many workers there are. '''
+    def __init__(self, workers = None, seed = None, chunks = None):
+        ''' workers: (int) processes to use, defaults to the CPU count.
+            seed: master seed for the chunk seeds (None for a random run).
+            chunks: (int) chunks to split each job into, defaults to workers.
+            '''
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        self.workers = workers
+        self.chunks = chunks or workers
+        self.seed = seed
+
+    def chunkSeeds(self):
+        ''' Returns one independent seed for each chunk of a job. '''
+        master = random.Random(self.seed)
+        return [master.getrandbits(64) for i in range(self.chunks)]
+
+    def chunkSizes(self, iterations):
+        ''' Splits an iteration count as evenly as possible across chunks. '''
+        size, extra = divmod(iterations, self.chunks)
+        return [size + (i < extra) for i in range(self.chunks)]
+
+    def run(self, worker, argLists):
+        ''' Runs worker once per argument list on the pool and returns the
+            results in order. A single worker runs in this process. '''
+        if self.workers == 1:
+            return [worker(*args) for args in argLists]
+        with concurrent.futures.ProcessPoolExecutor(self.workers) as pool:
+            futures = [pool.submit(worker, *args) for args in argLists]
+            return [f.result() for f in futures]
+
+    def equity(self, ranges, iterations, board = [], dead = []):
+        ''' Monte Carlo equity (see Equity.EquityCalculator) over iterations
+            trials in total. Returns the merged EquityResult. '''
+        ranges = [[[Equity.toInt(c) for c in combo] for combo in combos]
+                for combos in ranges]
+        board = [Equity.toInt(c) for c in board]
+        dead = [Equity.toInt(c) for c in dead]
+        argLists = [(ranges, board, dead, n, seed) for n, seed in
+                    zip(self.chunkSizes(iterations), self.chunkSeeds())]
+        return mergeResults(self.run(equityWorker, argLists), len(ranges))
+
+    def exactEquity(self, hands, board = [], dead = []):
+        ''' Exact equity (see Equity.exactEquity) with the runouts split
+            across the chunks. Returns the merged EquityResult. '''
+        hands = [[Equity.toInt(c) for c in hand] for hand in hands]
+        board = [Equity.toInt(c) for c in board]
+        dead = [Equity.toInt(c) for c in dead]
+        argLists = [(hands, board, dead, part, self.chunks)
+                    for part in range(self.chunks)]
+        return mergeResults(self.run(Equity.exactEquity, argLists),
+                            len(hands), True)
+
+    def handDistribution(self, cardCount, iterations):
+        ''' Deals iterations random hands of cardCount (5-7) cards and counts
+            how many fall into each hand category. Returns a list of counts
+            indexed by HandRank rankValue (index 0 is unused). '''
+        argLists = [(cardCount, n, seed) for n, seed in
+                    zip(self.chunkSizes(iterations), self.chunkSeeds())]
+        counts = [0] * 10
+        for chunk in self.run(distributionWorker, argLists):
+            for i in range(10):
+                counts[i] += chunk[i]
+        return counts
+
+#------------------------------------------------------------------------------
+# Worker functions - module level so the pool can pickle them.
+#------------------------------------------------------------------------------
+
+def equityWorker(ranges, board, dead, iterations, seed):
+    ''' Runs one chunk of a Monte Carlo equity job. '''
+    calc = Equity.EquityCalculator(ranges, board, dead, seed)
+    result = Equity.EquityResult(len(ranges))
+    if iterations:
+        calc.runTrials(iterations, result)
+    return result
+
+def distributionWorker(cardCount, iterations, seed):
+    ''' Runs one chunk of a hand distribution job on its own deck. '''
+    deck = PlayingCards.Deck(compact = True, seed = seed, lazy = True)
+    counts = [0] * 10
+    evaluate = HandEvaluator.evaluate
+    shift = HandEvaluator.CATEGORY_SHIFT
+    for i in range(iterations):
+        hand = deck.deal(cardCount)
+        counts[evaluate(hand) >> shift] += 1
+        deck.deck += hand
+    return counts
+
+def mergeResults(results, players, exact = False):
+    ''' Merges a list of EquityResults into one. '''
+    merged = Equity.EquityResult(players, exact)
+    for result in results:
+        merged.merge(result)
+    return merged
@@ -0,0 +1,235 @@
+#******************************************************************************
+# TableBatch.py                                     Author: Curtis Smith
+# Written in Python 3.2
+#
+# Struct-of-arrays state for many poker tables at once, so a whole batch of
+# tables can be dealt, bet and scored with vectorized operations. Requires
+# NumPy.
+#******************************************************************************
+
+import numpy
+
+import BatchEvaluator
+import HandEvaluator
+import PlayingCards
+
+BOARDSIZE = 5 # The number of community cards in a complete board.
+NOCARD = -1   # Marks an empty hole card or board slot.
+
+#------------------------------------------------------------------------------
+# Every array is indexed [table, seat] (hole cards [table, seat, card], the
+# board [table, card]). All the tables in a batch have the same number of
+# seats and are on the same street, so advancing a street deals the same
+# number of board cards to each. Cards are dealt by giving every card not in
+# use at a table a random key and taking the cards with the smallest keys,
+# which shuffles every table's deck in one argsort.
+#------------------------------------------------------------------------------
+
+class TableBatch:
+    ''' Holds the state of a batch of tables in NumPy arrays:
+            chips : (float[T, S]) chips at each seat.
+            wagered : (float[T, S]) chips wagered in the current hand.
+            bets : (float[T, S]) chips bet on the current street.
+            folded : (bool[T, S]) True if the seat is out of the hand.
+            sittingOut : (bool[T, S]) True if the player is sitting out.
+            occupied : (bool[T, S]) True if the seat has a player.
+            hole : (int8[T, S, H]) hole cards as compact card ints.
+            board : (int8[T, 5]) community cards as compact card ints.
+            button : (int[T]) index of each table's dealer button.
+            pot : (float[T]) chips in each table's pot.
+        boardSize : (int) the number of board cards dealt at every table. '''
+    def __init__(self, tables, seats, holeCards = 2, seed = None):
+        ''' Creates a batch of tables with empty seats, with its own random
+            generator seeded with seed. '''
+        self.chips = numpy.zeros((tables, seats))
+        self.wagered = numpy.zeros((tables, seats))
+        self.bets = numpy.zeros((tables, seats))
+        self.folded = numpy.ones((tables, seats), dtype = bool)
+        self.sittingOut = numpy.zeros((tables, seats), dtype = bool)
+        self.occupied = numpy.zeros((tables, seats), dtype = bool)
+        self.hole = numpy.full((tables, seats, holeCards), NOCARD,
+                                dtype = numpy.int8)
+        self.board = numpy.full((tables, BOARDSIZE), NOCARD,
+                                dtype = numpy.int8)
+        self.button = numpy.zeros(tables, dtype = numpy.int64)
+        self.pot = numpy.zeros(tables)
+        self.boardSize = 0
+        self.rng = numpy.random.default_rng(seed)
+
+    #--------------------------------------------------------------------------
+    # Converting to and from Table objects.
+    #--------------------------------------------------------------------------
+
+    @classmethod
+    def fromTables(cls, tables, holeCards = 2, seed = None):
+        ''' Builds a batch from a list of Tables, which must all have the
+            same number of seats and board cards. '''
+        seats = len(tables[0].seats)
+        boardSize = len(tables[0].board)
+        for table in tables:
+            if len(table.seats) != seats or len(table.board) != boardSize:
+                raise ValueError("Tables must have the same number of seats "
+                                "and board cards.")
+        batch = cls(len(tables), seats, holeCards, seed)
+        for t, table in enumerate(tables):
+            for s, seat in enumerate(table.seats):
+                batch.chips[t, s] = seat.chips
+                batch.wagered[t, s] = seat.wagered
+                batch.folded[t, s] = seat.folded
+                batch.sittingOut[t, s] = seat.sittingOut
+                batch.occupied[t, s] = seat.player is not None
+                cards = [PlayingCards.toInt(c) for c in seat.hand.cards]
+                if len(cards) > holeCards:
+                    raise ValueError("A hand has more than holeCards cards.")
+                batch.hole[t, s, :len(cards)] = cards
+            batch.board[t, :boardSize] = [PlayingCards.toInt(c)
+                                        for c in table.board]
+            batch.button[t] = table.button
+            batch.pot[t] = table.pot
+        batch.boardSize = boardSize
+        return batch
+
+    def toTables(self, tables):
+        ''' Writes the batch back into a list of Tables with the same number
+            of seats (ie. the ones it was built from). Players stay in their
+            seats and each hand's running evaluation is rebuilt. Each table's
+            deck is rebuilt from the cards not in play, and cards are written
+            as compact card ints or, if the table's deck holds Card objects,
+            as Card objects. '''
+        chips = self.chips.tolist()
+        wagered = self.wagered.tolist()
+        folded = self.folded.tolist()
+        sittingOut = self.sittingOut.tolist()
+        hole = self.hole.tolist()
+        boards = self.board[:, :self.boardSize].tolist()
+        for t, table in enumerate(tables):
+            deck = table.deck
+            if deck.compact:
+                convert = int
+            else:
+                held = deck.deck + deck.discards + table.board
+                for seat in table.seats:
+                    held += seat.hand.cards
+                acesLow = any(c.rank.rank == 1 for c in held)
+                convert = lambda c: PlayingCards.Card.fromInt(c, acesLow)
+            board = [convert(c) for c in boards[t]]
+            used = set(boards[t])
+            table.board = board
+            table.button = int(self.button[t])
+            table.pot = float(self.pot[t])
+            for s, seat in enumerate(table.seats):
+                seat.chips = chips[t][s]
+                seat.wagered = wagered[t][s]
+                seat.folded = folded[t][s]
+                seat.sittingOut = sittingOut[t][s]
+                hand = seat.hand
+                hand.cards = []
+                hand.hiHandRank = None
+                hand.lowHandRank = None
+                hand.state = HandEvaluator.HandState()
+                for c in hole[t][s]:
+                    if c != NOCARD:
+                        used.add(c)
+                        hand.addCard(convert(c))
+                for c in board:
+                    hand.addBoardCard(c)
+            deck.deck = [convert(c) for c in range(PlayingCards.DECKSIZE)
+                        if c not in used]
+            deck.discards = []
+            deck.shuffle()
+        return tables
+
+    #--------------------------------------------------------------------------
+    # Vectorized play.
+    #--------------------------------------------------------------------------
+
+    def dealCards(self, count):
+        ''' Returns a (tables x count) array of cards dealt at random at
+            each table from the cards no one holds and not on the board. '''
+        tables = len(self.pot)
+        # NOCARD (-1) indexes the extra last column, which is dropped.
+        used = numpy.zeros((tables, PlayingCards.DECKSIZE + 1), dtype = bool)
+        rows = numpy.arange(tables)[:, None]
+        used[rows, self.hole.reshape(tables, -1)] = True
+        used[rows, self.board] = True
+        keys = self.rng.random((tables, PlayingCards.DECKSIZE))
+        keys[used[:, :PlayingCards.DECKSIZE]] = 2.0 # Sorts after free cards.
+        return numpy.argsort(keys, axis = 1)[:, :count]
+
+    def newHand(self):
+        ''' Starts a new hand at every table: clears the board, bets and
+            pot, folds empty, sitting out and busted seats and deals hole
+            cards to everyone else. '''
+        tables, seats, holeCards = self.hole.shape
+        self.board[:] = NOCARD
+        self.boardSize = 0
+        self.hole[:] = NOCARD
+        self.bets[:] = 0
+        self.wagered[:] = 0
+        self.pot[:] = 0
+        self.folded = ~self.occupied | self.sittingOut | (self.chips <= 0)
+        cards = self.dealCards(seats * holeCards).reshape(tables, seats,
+                                                        holeCards)
+        self.hole[:] = numpy.where(self.folded[:, :, None], NOCARD, cards)
+
+    def advanceStreet(self):
+        ''' Moves every table on to the next street: the street's bets are
+            cleared and the flop (3 cards), turn or river (1 card) is dealt to
+            every board. Returns the (tables x cards) array of cards dealt. '''
+        if self.boardSize >= BOARDSIZE:
+            raise ValueError("The board is already complete.")
+        count = 3 if self.boardSize == 0 else 1
+        cards = self.dealCards(count)
+        self.board[:, self.boardSize:self.boardSize + count] = cards
+        self.boardSize += count
+        self.bets[:] = 0
+        return cards
+
+    def post(self, amounts):
+        ''' Moves up to amounts (a tables x seats array, or a number for
+            every seat) from each live seat's chips into the pot, capped at
+            what the seat has. Returns the amounts actually posted. '''
+        amounts = numpy.minimum(numpy.broadcast_to(amounts, self.chips.shape),
+                                self.chips)
+        amounts = numpy.where(self.folded, 0, amounts)
+        self.chips -= amounts
+        self.bets += amounts
+        self.wagered += amounts
+        self.pot += amounts.sum(axis = 1)
+        return amounts
+
+    def call(self, mask = None):
+        ''' Has every live seat (or those where mask is True) call the
+            largest bet at its table, or go all-in if it can't. '''
+        amounts = self.bets.max(axis = 1, keepdims = True) - self.bets
+        if mask is not None:
+            amounts = numpy.where(mask, amounts, 0)
+        return self.post(amounts)
+
+    def fold(self, mask):
+        ''' Folds every seat where mask (tables x seats) is True. '''
+        self.folded |= mask
+
+    def scores(self):
+        ''' Returns a (tables x seats) array of the hold'em high score (see
+            HandEvaluator) of every live seat's hole cards and the board, and
+            0 for folded seats. Needs at least the flop and at most 2 hole
+            cards. '''
+        if self.boardSize < 3:
+            raise ValueError("Hands can't be scored before the flop.")
+        tables, seats, holeCards = self.hole.shape
+        board = numpy.broadcast_to(self.board[:, None, :self.boardSize],
+                                    (tables, seats, self.boardSize))
+        cards = numpy.concatenate((self.hole, board), axis = 2)
+        live = ~self.folded
+        scores = numpy.zeros((tables, seats), dtype = numpy.int64)
+        if live.any():
+            scores[live] = BatchEvaluator.evaluate(cards[live])[0]
+        return scores
+
+    def winners(self):
+        ''' Returns a (tables x seats) bool array marking the live seats at
+            each table with the best hand. '''
+        scores = self.scores()
+        best = scores.max(axis = 1, keepdims = True)
+        return (scores == best) & ~self.folded
@@ -0,0 +1,239 @@
+#******************************************************************************
+# TableServer.py                                    Author: Curtis Smith
+# Written in Python 3.2
+#
+# Runs many poker tables as tasks on one asyncio event loop, with players
+# acting through per-seat action queues.
+#******************************************************************************
+
+import asyncio
+
+import GameEngine
+
+#------------------------------------------------------------------------------
+# Each table is a GameEngine played by its own task. Seats that a player has
+# joined act through a bounded asyncio.Queue: when it's the seat's turn the
+# player's onTurn callback is told what to call, and the table task waits (up
+# to actionTimeout seconds) for the player to put an action (see GameEngine
+# for actions) on the queue. A player that doesn't act in time checks if it
+# can and folds otherwise. Other seats act with the engine's policies without
+# waiting. A task with too few players to deal waits on an event rather than
+# polling, so idle tables cost nothing but memory.
+#
+# Each turn a seat is asked to act for is numbered, and onTurn is given the
+# number. Actions are queued as (turn, action), with the turn passed to submit
+# (or the seat's latest turn if none is). Only actions for the current turn
+# are used, so an action that answers a turn that has timed out is dropped
+# rather than played at the seat's next turn.
+#
+# Backpressure: a seat's queue holds at most queueSize actions. submit waits
+# for room and trySubmit refuses the action when the queue is full, so a
+# player (or a connection handler reading from one) can't queue up work faster
+# than the table plays it.
+#------------------------------------------------------------------------------
+
+class TableManager:
+    ''' Runs the tables added to it as tasks on the event loop. '''
+    def __init__(self, actionTimeout = 30.0, queueSize = 1, handDelay = 0):
+        ''' Takes the seconds a player has to act, the most actions a seat
+            can have queued and the seconds to wait between hands. '''
+        self.actionTimeout = actionTimeout
+        self.queueSize = queueSize
+        self.handDelay = handDelay
+        self.engines = {}   # tableNum -> GameEngine
+        self.queues = {}    # tableNum -> {seat index: action queue}
+        self.onTurns = {}   # tableNum -> {seat index: onTurn callback}
+        self.turns = {}     # tableNum -> {seat index: latest turn number}
+        self.seated = {}    # tableNum -> Event set when players sit down
+        self.tasks = {}     # tableNum -> the task playing the table
+        self.leaving = {}   # tableNum -> seats to empty after the hand
+        self.playing = set() # tableNums with a hand in progress
+        self.timeouts = 0   # Actions that timed out.
+        self.running = False
+
+    def addTable(self, engine):
+        ''' Adds a GameEngine's table, keyed by its tableNum, and starts
+            playing it if the manager is running. '''
+        tableNum = engine.table.tableNum
+        if tableNum in self.engines:
+            raise ValueError("A table with that number was already added.")
+        self.engines[tableNum] = engine
+        self.queues[tableNum] = {}
+        self.onTurns[tableNum] = {}
+        self.turns[tableNum] = {}
+        self.seated[tableNum] = asyncio.Event()
+        self.seated[tableNum].set()
+        self.leaving[tableNum] = set()
+        if self.running:
+            self.startTable(tableNum)
+        return tableNum
+
+    def removeTable(self, tableNum):
+        ''' Stops playing a table and forgets it. '''
+        task = self.tasks.pop(tableNum, None)
+        if task is not None:
+            task.cancel()
+        self.playing.discard(tableNum)
+        for table in (self.engines, self.queues, self.onTurns, self.turns,
+                        self.seated, self.leaving):
+            del table[tableNum]
+
+    #--------------------------------------------------------------------------
+    # Players.
+    #--------------------------------------------------------------------------
+
+    def sitDown(self, tableNum, seat, player, chips, onTurn = None):
+        ''' Seats a player with chips at a table. If onTurn is given the seat
+            is played through its action queue, which is returned; onTurn is
+            called as onTurn(tableNum, seat, toCall, minRaise, turn) when the
+            seat must act; the queue holds (turn number, action) pairs (see
+            above). Otherwise the seat plays with the engine's policy. Raises
+            ValueError if the seat is taken (or its player is still leaving).
+            '''
+        engine = self.engines[tableNum]
+        if engine.table.seats[seat].player is not None:
+            raise ValueError("That seat is taken.")
+        engine.table.seats[seat].addPlayer(player, chips)
+        engine.table.seats[seat].sittingOut = False
+        queue = None
+        if onTurn is not None:
+            queue = asyncio.Queue(self.queueSize)
+            self.queues[tableNum][seat] = queue
+            self.onTurns[tableNum][seat] = onTurn
+            self.turns[tableNum][seat] = 0
+        self.seated[tableNum].set()
+        return queue
+
+    def standUp(self, tableNum, seat):
+        ''' Removes the player (and their chips) from a seat, straight away
+            between hands or once the current hand is over (they fold if they
+            have to act before then). '''
+        self.queues[tableNum].pop(seat, None)
+        self.onTurns[tableNum].pop(seat, None)
+        self.engines[tableNum].table.seats[seat].sittingOut = True
+        if tableNum in self.playing:
+            self.leaving[tableNum].add(seat)
+        else:
+            self.emptySeat(tableNum, seat)
+
+    def emptySeat(self, tableNum, seat):
+        ''' Clears a seat that has been stood up from. '''
+        seat = self.engines[tableNum].table.seats[seat]
+        seat.player = None
+        seat.chips = 0
+        seat.sittingOut = False
+
+    async def submit(self, tableNum, seat, action, turn = None):
+        ''' Queues an action for a seat's turn (by default its latest),
+            waiting while its queue is full. '''
+        if turn is None:
+            turn = self.turns[tableNum][seat]
+        await self.queues[tableNum][seat].put((turn, action))
+
+    def trySubmit(self, tableNum, seat, action, turn = None):
+        ''' Queues an action for a seat's turn (by default its latest).
+            Returns False (and drops the action) if the seat's queue is full.
+            '''
+        if turn is None:
+            turn = self.turns[tableNum][seat]
+        try:
+            self.queues[tableNum][seat].put_nowait((turn, action))
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    #--------------------------------------------------------------------------
+    # Running.
+    #--------------------------------------------------------------------------
+
+    def start(self):
+        ''' Starts playing every table. Must be called with the event loop
+            running. '''
+        self.running = True
+        for tableNum in self.engines:
+            if tableNum not in self.tasks:
+                self.startTable(tableNum)
+
+    async def stop(self):
+        ''' Stops every table and waits for their tasks to finish. '''
+        self.running = False
+        tasks = list(self.tasks.values())
+        self.tasks = {}
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions = True)
+
+    def startTable(self, tableNum):
+        ''' Starts the task playing a table. '''
+        self.tasks[tableNum] = asyncio.ensure_future(self.runTable(tableNum))
+
+    async def runTable(self, tableNum):
+        ''' Plays hands at a table until it is stopped. '''
+        engine = self.engines[tableNum]
+        seated = self.seated[tableNum]
+        # Checked as well as cancelling the task, since wait_for can swallow
+        # a cancel that arrives just as an action does.
+        while self.running and tableNum in self.tasks:
+            await seated.wait()
+            self.playing.add(tableNum)
+            try:
+                pots = await self.playHand(tableNum, engine)
+            finally:
+                # Also run if the table is stopped mid-hand.
+                self.playing.discard(tableNum)
+                leaving = self.leaving.get(tableNum, ())
+                while leaving:
+                    self.emptySeat(tableNum, leaving.pop())
+            if pots is None:
+                seated.clear() # Wait for more players to sit down.
+            for seat in engine.table.seats:
+                if seat.player is None or seat.sittingOut:
+                    self.queues[tableNum].pop(seat.seatNumber - 1, None)
+                    self.onTurns[tableNum].pop(seat.seatNumber - 1, None)
+            await asyncio.sleep(self.handDelay)
+
+    async def playHand(self, tableNum, engine):
+        ''' Plays one hand with engine.handSteps, waiting for the actions of
+            seats played through queues. Returns the showdown's Pots, or None
+            if there weren't enough players. '''
+        queues = self.queues[tableNum]
+        policies = engine.policies
+        steps = engine.handSteps()
+        try:
+            request = next(steps)
+            while True:
+                seat, toCall, minRaise = request
+                if seat in queues:
+                    action = await self.waitForAction(tableNum, seat, toCall,
+                                                    minRaise)
+                elif engine.table.seats[seat].sittingOut:
+                    action = GameEngine.FOLD # Stood up mid-hand; a real fold.
+                else:
+                    action = policies[seat](engine, seat, toCall, minRaise)
+                request = steps.send(action)
+        except StopIteration as done:
+            return done.value
+
+    async def waitForAction(self, tableNum, seat, toCall, minRaise):
+        ''' Tells a seat it's their turn and waits for their action, dropping
+            any action meant for an earlier turn. '''
+        queue = self.queues[tableNum][seat]
+        while not queue.empty():
+            queue.get_nowait() # Stale, and would take up room.
+        turn = self.turns[tableNum][seat] + 1
+        self.turns[tableNum][seat] = turn
+        self.onTurns[tableNum][seat](tableNum, seat, toCall, minRaise, turn)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.actionTimeout
+        while True:
+            if not queue.empty():
+                actionTurn, action = queue.get_nowait() # No timer needed.
+            else:
+                try:
+                    actionTurn, action = await asyncio.wait_for(queue.get(),
+                                                    deadline - loop.time())
+                except asyncio.TimeoutError:
+                    self.timeouts += 1
+                    return GameEngine.FOLD # A check if there's nothing to call.
+            if actionTurn == turn:
+                return action
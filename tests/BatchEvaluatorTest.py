@@ -0,0 +1,37 @@
+#******************************************************************************
+# BatchEvaluatorTest.py                                 Author: Curtis Smith
+# Written in Python 3.2
+#
+# Unit test class for BatchEvaluator.
+#******************************************************************************
+
+import HandEvaluator
+import HandRanking
+import random
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class KnownValues(unittest.TestCase):
+
+    def test_matches_scalar(self):
+        ''' scoreHandsHi should agree with scoreHandHi for 5, 6 and 7 cards.'''
+        rng = random.Random(3)
+        for size in (5, 6, 7):
+            hands = [rng.sample(range(52), size) for i in range(5000)]
+            scores, categories = HandRanking.scoreHandsHi(numpy.array(hands))
+            for i, hand in enumerate(hands):
+                expected = HandRanking.scoreHandHi(hand[:2], hand[2:])
+                self.assertEqual(scores[i], expected)
+                self.assertEqual(categories[i], HandEvaluator.category(expected))
+
+    def test_bad_shape(self):
+        ''' scoreHandsHi should reject arrays that aren't N x 5-7.'''
+        self.assertRaises(ValueError, HandRanking.scoreHandsHi, numpy.zeros((3, 4)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+#******************************************************************************
+# EquityTest.py                                         Author: Curtis Smith
+# Written in Python 3.2
+#
+# Unit test class for Equity.
+#******************************************************************************
+
+import Equity
+import HandEvaluator
+import HandRange
+import HandRanking
+import itertools
+import unittest
+
+class KnownValues(unittest.TestCase):
+    aces = [[12, 25]]   # AcAs
+    kings = [[11, 24]]  # KcKs
+
+    def test_aces_vs_kings(self):
+        ''' Aces should hold about 82% against kings preflop.'''
+        calc = Equity.EquityCalculator([self.aces, self.kings], seed = 1)
+        result = calc.run(iterations = 20000)
+        self.assertEqual(result.trials, 20000)
+        self.assertAlmostEqual(result.equity[0], 0.82, delta = 0.015)
+        self.assertAlmostEqual(sum(result.equity), 1.0)
+        self.assertEqual(result.wins[0] + result.ties[0] + result.losses[0], 20000)
+
+    def test_seeded_runs_repeat(self):
+        ''' Two calculators with the same seed should give the same tallies.'''
+        first = Equity.EquityCalculator([self.aces, self.kings], seed = 7)
+        second = Equity.EquityCalculator([self.aces, self.kings], seed = 7)
+        self.assertEqual(first.run(iterations = 500).wins,
+                        second.run(iterations = 500).wins)
+
+    def test_target_error(self):
+        ''' run should stop once the standard error reaches the target.'''
+        calc = Equity.EquityCalculator([self.aces, self.kings], seed = 2)
+        result = calc.run(targetError = 0.01, checkEvery = 100)
+        self.assertLessEqual(max(result.stdErr), 0.01)
+
+    def test_dead_cards(self):
+        ''' Combos using dead or board cards should be dropped from a range.'''
+        calc = Equity.EquityCalculator([[[12, 25], [12, 38]], self.kings],
+                                    board = [51, 50, 49], dead = [38])
+        self.assertEqual(len(calc.ranges[0]), 1)
+        self.assertNotIn(38, calc.stock)
+        self.assertNotIn(51, calc.stock)
+        self.assertRaises(ValueError, Equity.EquityCalculator, [[[12, 25]]],
+                        dead = [25])
+
+    def test_exact_matches_brute_force(self):
+        ''' exactEquity should count every runout the same as ranking each.'''
+        hands = [[12, 25], [11, 24]]
+        board = [26, 44, 33]
+        wins = [0, 0]
+        ties = 0
+        stock = [c for c in range(52) if c not in hands[0] + hands[1] + board]
+        for runout in itertools.combinations(stock, 2):
+            scores = [HandRanking.scoreHandHi(h, board + list(runout)) for h in hands]
+            if scores[0] == scores[1]:
+                ties += 1
+            else:
+                wins[scores.index(max(scores))] += 1
+        result = Equity.exactEquity(hands, board)
+        self.assertEqual(result.trials, 990)
+        self.assertEqual(result.wins, wins)
+        self.assertEqual(result.ties, [ties, ties])
+        self.assertEqual(result.stdErr, [0.0, 0.0])
+
+    def test_suit_symmetries(self):
+        ''' Swapping suits that play the same part should be a symmetry.'''
+        self.assertEqual(len(Equity.suitSymmetries([self.aces[0], self.kings[0]])), 4)
+        self.assertEqual(len(Equity.suitSymmetries([[12, 37], [49, 9]])), 1)
+        self.assertEqual(len(Equity.suitSymmetries([])), 24)
+
+    def test_exact_preflop(self):
+        ''' Aces should have 82.64% exact equity against kings of the same suits.'''
+        result = Equity.exactEquity([self.aces[0], self.kings[0]])
+        self.assertEqual(result.trials, 1712304)
+        self.assertAlmostEqual(result.equity[0], 0.8264, places = 4)
+
+    def test_range_matches_brute_force(self):
+        ''' Range equity on a river should match scoring every matchup.'''
+        range1 = HandRange.parse("99+, AJs+, KQo, T9s:0.5")
+        range2 = HandRange.parse("TT+, AK, 87s-65s:0.25")
+        board = [0, 14, 28, 42, 9] # 2c 3s 4d 5h Jc
+        wins = ties = matchups = 0.0
+        for c1, w1 in range1:
+            for c2, w2 in range2:
+                hand1 = list(HandRange.comboCards(c1))
+                hand2 = list(HandRange.comboCards(c2))
+                if len(set(hand1 + hand2 + board)) != 9:
+                    continue
+                score1 = HandEvaluator.evaluate(hand1 + board)
+                score2 = HandEvaluator.evaluate(hand2 + board)
+                matchups += w1 * w2
+                wins += w1 * w2 * (score1 > score2)
+                ties += w1 * w2 * (score1 == score2)
+        result = Equity.rangeEquity(range1, range2, board)
+        self.assertAlmostEqual(result.trials, matchups)
+        self.assertAlmostEqual(result.wins[0], wins)
+        self.assertAlmostEqual(result.ties[0], ties)
+        self.assertAlmostEqual(result.losses[1], wins)
+        self.assertAlmostEqual(sum(result.equity), 1.0)
+
+    def test_range_matches_exact(self):
+        ''' Single combo ranges should match exactEquity over every runout.'''
+        board = [0, 14, 48]
+        expected = Equity.exactEquity([self.aces[0], self.kings[0]], board)
+        result = Equity.rangeEquity("AcAs", "KcKs", board)
+        self.assertEqual(result.trials, expected.trials)
+        self.assertEqual(result.wins, expected.wins)
+        self.assertEqual(result.ties, expected.ties)
+        sampled = Equity.rangeEquity("AcAs", "KcKs", board, runouts = 300,
+                                    seed = 1)
+        # Runouts that hit the players' cards don't count.
+        self.assertGreater(sampled.trials, 200)
+        self.assertLessEqual(sampled.trials, 300)
+        self.assertAlmostEqual(sampled.equity[0], expected.equity[0],
+                                delta = 0.05)
+
+if __name__ == '__main__':
+    unittest.main()
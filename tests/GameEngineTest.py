@@ -0,0 +1,105 @@
+#******************************************************************************
+# GameEngineTest.py                                     Author: Curtis Smith
+# Written in Python 3.2
+#
+# Unit test class for GameEngine.
+#******************************************************************************
+
+import BlindLevel
+import GameEngine
+import Levels
+import PokerPlayer
+import PokerTable
+import unittest
+
+class KnownValues(unittest.TestCase):
+
+    def setUpEngine(self, stacks, policies = None, seed = 1):
+        ''' Seats a player with each stack at a table and returns an engine
+            for it with 1/2 blinds.'''
+        table = PokerTable.Table(len(stacks))
+        for seat, chips in zip(table.seats, stacks):
+            seat.addPlayer(PokerPlayer.PokerPlayer("player"), chips)
+        levels = Levels.Levels(20, False)
+        levels.addLevel(BlindLevel.BlindLevel(2, 1, 0, 0))
+        levels.addLevel(BlindLevel.BlindLevel(4, 2, 1, 0))
+        return GameEngine.GameEngine(table, levels, policies, seed)
+
+    def test_chips_conserved(self):
+        ''' No chips should be created or lost, even with short stacks going
+            all-in into side pots.'''
+        stacks = [200, 15, 60, 200, 8, 120]
+        policies = [GameEngine.randomPolicy(i, 0.2, 0.3) for i in range(6)]
+        engine = self.setUpEngine(stacks, policies)
+        played = engine.playHands(500)
+        self.assertGreater(played, 0)
+        seats = engine.table.seats
+        self.assertEqual(sum(seat.chips for seat in seats), sum(stacks))
+        for seat in seats:
+            self.assertGreaterEqual(seat.chips, 0)
+            if seat.player is None:
+                self.assertEqual(seat.chips, 0)
+
+    def test_heads_up_blinds(self):
+        ''' Heads up the button should post the small blind and act first
+            before the flop.'''
+        order = []
+        def fold(engine, seat, toCall, minRaise):
+            order.append(seat)
+            return GameEngine.FOLD
+        engine = self.setUpEngine([100, 100], [fold, fold])
+        engine.playHand()
+        button = engine.table.button
+        self.assertEqual(order, [button])
+        self.assertEqual(engine.table.seats[button].chips, 99)
+        self.assertEqual(engine.table.seats[1 - button].chips, 101)
+
+    def test_incomplete_raise(self):
+        ''' An all-in short of a full raise shouldn't let the seats that
+            already acted raise again.'''
+        engine = self.setUpEngine([100, 100, 13])
+        table = engine.table
+        table.button = 2 # Moves to seat 0: seat 1 posts 1, seat 2 posts 2.
+        steps = engine.handSteps()
+        actions = []
+        request = next(steps)
+        # Seat 0 raises to 8, seat 1 calls, seat 2 is all-in for 13 (short of
+        # a full raise to 14), and seat 0's raise to 30 is only a call.
+        for action in (8, GameEngine.CALL, 13, 30, GameEngine.CALL):
+            actions.append(request[:2])
+            request = steps.send(action)
+        self.assertEqual(actions, [(0, 2), (1, 7), (2, 6), (0, 5), (1, 5)])
+        self.assertEqual(table.pot, 39)
+        self.assertEqual(request[0], 1) # On to the flop.
+
+    def test_heads_up_dead_button(self):
+        ''' Heads up, the nearest seat to the right of a button that isn't
+            dealt in should post the small blind.'''
+        engine = self.setUpEngine([100, 100, 100])
+        table = engine.table
+        table.seats[0].chips = 0 # Still seated, so the button can land here.
+        table.button = 2
+        request = next(engine.handSteps())
+        self.assertEqual(table.button, 0)
+        self.assertEqual(engine.bets[:3], [0, 2, 1])
+        self.assertEqual(request[0], 2)
+
+    def test_levels_advance(self):
+        ''' The blinds should go up as the simulated clock passes each level,
+            and antes should be posted.'''
+        engine = self.setUpEngine([500, 500, 500])
+        engine.secondsPerHand = 600
+        engine.playHands(2)
+        self.assertEqual(engine.levels.currentLevel, 1)
+        self.assertEqual(engine.blindLevel().ante, 1)
+        engine.playHands(1)
+        self.assertEqual(sum(s.chips for s in engine.table.seats), 1500)
+
+    def test_player_ids(self):
+        ''' Each new PokerPlayer should get the next id.'''
+        first = PokerPlayer.PokerPlayer("first")
+        second = PokerPlayer.PokerPlayer("second")
+        self.assertEqual(second.id, first.id + 1)
+
+if __name__ == '__main__':
+    unittest.main()
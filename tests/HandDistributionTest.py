@@ -0,0 +1,53 @@
+#******************************************************************************
+# HandDistributionTest.py                               Author: Curtis Smith
+# Written in Python 3.2
+#
+# Unit test class for HandDistribution.
+#******************************************************************************
+
+import HandDistribution
+import HandRange
+import HandRanking
+import PlayingCards
+import random
+import unittest
+
+class KnownValues(unittest.TestCase):
+
+    def test_broadway_flop(self):
+        ''' AcKcQc should have the known count of each category.'''
+        dist = HandDistribution.HandDistribution([12, 11, 10])
+        self.assertEqual(dist.total, 1176)
+        self.assertEqual(dist.counts[9], 1)    # JcTc
+        self.assertEqual(dist.counts[6], 44)   # Two other clubs.
+        self.assertEqual(dist.counts[5], 15)   # JT otherwise.
+        self.assertEqual(dist.counts[4], 9)    # Pairs of A, K or Q.
+        self.assertEqual(sum(dist.counts), 1176)
+        self.assertEqual(dist.combos(9), [HandRange.comboIndex(8, 9)])
+
+    def test_matches_hand_ranking(self):
+        ''' Each combo's category should be the one rankHandHi gives.'''
+        rng = random.Random(5)
+        board = rng.sample(range(52), 5)
+        dist = HandDistribution.HandDistribution(board)
+        self.assertEqual(dist.total, 1081)
+        cards = [PlayingCards.Card.fromInt(c) for c in board]
+        for c in rng.sample(range(1326), 100):
+            a, b = HandRange.comboCards(c)
+            if a in board or b in board:
+                self.assertEqual(dist.scores[c], 0)
+                continue
+            hand = [PlayingCards.Card.fromInt(a), PlayingCards.Card.fromInt(b)]
+            rank = HandRanking.rankHandHi(hand, cards)
+            self.assertEqual(dist.scores[c], rank.key)
+
+    def test_range(self):
+        ''' A range should only count its own live combos, by weight.'''
+        dist = HandDistribution.HandDistribution([12, 11, 10],
+                                            dead = [51], hands = "QQ+, AK:0.5")
+        self.assertEqual(dist.counts[4], 7)
+        self.assertEqual(dist.counts[3], 3)
+        self.assertAlmostEqual(dist.fraction(4), 0.7)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+#******************************************************************************
+# HandEvaluatorTest.py                                  Author: Curtis Smith
+# Written in Python 3.2
+#
+# Unit test class for HandEvaluator.
+#******************************************************************************
+
+import HandEvaluator
+import HandRanking
+import HandRanks
+import PlayingCards
+import itertools
+import os
+import random
+import tempfile
+import unittest
+
+class KnownValues(unittest.TestCase):
+    deck = PlayingCards.Deck() # Set up an unshuffled deck.
+
+    def test_categories(self):
+        ''' evaluate should score each hand with the matching HandRanks class.'''
+        known_values = (([8, 9, 10, 11, 12, 25, 38], HandRanks.StraightFlush),
+                        ([12, 0, 1, 2, 3, 45, 27], HandRanks.StraightFlush),
+                        ([12, 38, 10, 26, 51, 25, 50], HandRanks.Quads),
+                        ([6, 19, 10, 32, 51, 23, 50], HandRanks.FullHouse),
+                        ([2, 5, 6, 32, 51, 8, 12], HandRanks.Flush),
+                        ([10, 24, 9, 51, 8, 13, 44], HandRanks.Straight),
+                        ([51, 28, 0, 1, 3, 15, 44], HandRanks.Straight),
+                        ([12, 25, 51, 19, 17, 3, 50], HandRanks.Trips),
+                        ([11, 25, 51, 37, 17, 3, 48], HandRanks.TwoPair),
+                        ([11, 25, 50, 33, 17, 3, 49], HandRanks.Pair),
+                        ([11, 25, 33, 17, 2, 0, 5], HandRanks.HighCard))
+        for cards, rankClass in known_values:
+            score = HandEvaluator.evaluate(cards)
+            self.assertIs(HandEvaluator.rankClass(score), rankClass)
+
+    def test_wheel_loses_to_six_high(self):
+        ''' The ace-low straight should be the lowest straight.'''
+        wheel = HandEvaluator.evaluate([12, 13, 27, 41, 3])
+        sixHigh = HandEvaluator.evaluate([13, 27, 41, 3, 4])
+        self.assertLess(wheel, sixHigh)
+
+    def test_matches_rank_hand_hi(self):
+        ''' evaluate should agree with rankHandHi on random 5, 6 and 7 card sets.'''
+        rng = random.Random(1)
+        for size in (5, 6, 7):
+            for i in range(3000):
+                indices = rng.sample(range(52), size)
+                cards = [self.deck.deck[n] for n in indices]
+                expected = HandRanking.rankHandHi(cards[:2], cards[2:])
+                self.assertEqual(HandEvaluator.evaluate(indices),
+                                HandEvaluator.scoreHandRank(expected))
+
+    def test_card_index(self):
+        ''' cardIndex should match the position of the card in a new deck.'''
+        for i, card in enumerate(self.deck.deck):
+            self.assertEqual(HandEvaluator.cardIndex(card), i)
+
+    def test_table_file(self):
+        ''' Tables loaded from a table file should match the built ones, and
+            a file for another version should be ignored.'''
+        HandEvaluator.evaluate(range(7))
+        flushes, ranks = HandEvaluator.computeTables()
+        oldFlushes = HandEvaluator.FLUSH_TABLE
+        oldRanks = HandEvaluator.RANK_TABLE
+        path = os.path.join(tempfile.mkdtemp(), "evaluator.dat")
+        HandEvaluator.writeTables(path)
+        try:
+            self.assertTrue(HandEvaluator.loadTables(path))
+            self.assertEqual(list(HandEvaluator.FLUSH_TABLE), flushes)
+            table = HandEvaluator.RANK_TABLE
+            self.assertIsInstance(table, HandEvaluator.RankTable)
+            for product, score in ranks.items():
+                self.assertEqual(table[product], score)
+            self.assertRaises(KeyError, table.__getitem__, 2 ** 7)
+            version = HandEvaluator.TABLE_VERSION
+            HandEvaluator.TABLE_VERSION = version + 1
+            try:
+                self.assertFalse(HandEvaluator.loadTables(path))
+            finally:
+                HandEvaluator.TABLE_VERSION = version
+            self.assertFalse(HandEvaluator.loadTables(path + ".missing"))
+            open(path, "wb").close()
+            self.assertFalse(HandEvaluator.loadTables(path))
+            with open(path, "wb") as f:
+                f.write(b"PYKREVAL")
+            self.assertFalse(HandEvaluator.loadTables(path))
+        finally:
+            HandEvaluator.FLUSH_TABLE = oldFlushes
+            HandEvaluator.RANK_TABLE = oldRanks
+
+    @unittest.skipUnless(os.environ.get("PYKER_EXHAUSTIVE"),
+                        "set PYKER_EXHAUSTIVE=1 to check all 7-card sets")
+    def test_exhaustive(self):
+        ''' evaluate should agree with rankHandHi on every 7-card set.'''
+        for indices in itertools.combinations(range(52), 7):
+            cards = [self.deck.deck[n] for n in indices]
+            expected = HandRanking.rankHandHi(cards[:2], cards[2:])
+            self.assertEqual(HandEvaluator.evaluate(indices),
+                            HandEvaluator.scoreHandRank(expected))
+
+if __name__ == '__main__':
+    unittest.main()
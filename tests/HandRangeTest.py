@@ -0,0 +1,70 @@
+#******************************************************************************
+# HandRangeTest.py                                      Author: Curtis Smith
+# Written in Python 3.2
+#
+# Unit test class for HandRange.
+#******************************************************************************
+
+import HandRange
+import PlayingCards
+import unittest
+
+class KnownValues(unittest.TestCase):
+
+    def test_combo_index(self):
+        ''' Every combo should have its own index, in either card order.'''
+        seen = set()
+        for a in range(52):
+            for b in range(a + 1, 52):
+                index = HandRange.comboIndex(a, b)
+                self.assertEqual(HandRange.comboIndex(b, a), index)
+                self.assertEqual(HandRange.comboCards(index), (a, b))
+                seen.add(index)
+        self.assertEqual(seen, set(range(1326)))
+        ace = PlayingCards.Card(14, 4)
+        king = PlayingCards.Card(13, 4)
+        self.assertEqual(HandRange.comboStr(HandRange.comboIndex(ace, king)),
+                        "AhKh")
+        self.assertEqual(HandRange.comboStr(HandRange.comboIndex(12, 24)),
+                        "AcKs")
+        self.assertEqual(HandRange.comboStr(HandRange.comboIndex(0, 13)),
+                        "2s2c")
+
+    def test_parse_counts(self):
+        ''' Each kind of range part should expand to the right combos.'''
+        known = {   "QQ": 6, "QQ+": 18, "QQ-99": 24, "99-QQ": 24,
+                    "AKs": 4, "AKo": 12, "AK": 16, "ak": 16, "ATs+": 16,
+                    "KTs-K8s": 12, "76s-54s": 12, "AhKh": 1,
+                    "QQ+, AKs, 76s-54s": 34, "AA, AA": 6   }
+        for text, count in known.items():
+            self.assertEqual(len(HandRange.parse(text)), count, text)
+        hands = HandRange.parse("76s-54s")
+        self.assertEqual(set(HandRange.comboStr(c)[0::2] for c in
+                        hands.combos), set(["76", "65", "54"]))
+        for text in ("QQs", "AK-Q9", "AKs-KQo", "A", "AhAh", "AK:2", "1K"):
+            self.assertRaises(ValueError, HandRange.expand, text)
+
+    def test_weights(self):
+        ''' Later weights should replace earlier ones; 0 drops combos.'''
+        hands = HandRange.parse("QQ+, KK:0.5, AA:0")
+        self.assertEqual(len(hands), 12)
+        self.assertAlmostEqual(hands.total(), 9.0)
+        self.assertEqual(list(hands.combos), sorted(hands.combos))
+
+    def test_dead_cards(self):
+        ''' Removing dead cards should drop only combos holding them.'''
+        hands = HandRange.parse("AA, KK, AKs")
+        live = hands.removeDead([PlayingCards.Card(14, 4), 11])
+        self.assertEqual(len(hands), 16)
+        self.assertEqual(len(live), 3 + 3 + 2)
+        for a, b in live.hands():
+            self.assertNotIn(a, (11, 51))
+            self.assertNotIn(b, (11, 51))
+
+    def test_cache(self):
+        ''' Parsing the same text again should reuse the range.'''
+        self.assertIs(HandRange.parse("JJ+, AQs+"),
+                        HandRange.parse("JJ+, AQs+"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,8 +6,10 @@
 #******************************************************************************
 
 import HandRanking
-import Pyker.HandRanks
-import Pyker.PlayingCards
+import HandRanks
+import LowEvaluator
+import PlayingCards
+import random
 import unittest
 
 class KnownValues(unittest.TestCase):
@@ -128,7 +130,10 @@ class KnownValues(unittest.TestCase):
                             HandRanks.Straight([self.deck.deck[26], self.deck.deck[27], self.deck.deck[2], self.deck.deck[42], self.deck.deck[43]])),
                         (   [self.deck.deck[4], self.deck.deck[25]], # One card from hand participates.
                             [self.deck.deck[44], self.deck.deck[32], self.deck.deck[7], self.deck.deck[34], self.deck.deck[23]],
-                            HandRanks.Straight([self.deck.deck[4], self.deck.deck[44], self.deck.deck[32], self.deck.deck[7], self.deck.deck[34]])) )
+                            HandRanks.Straight([self.deck.deck[4], self.deck.deck[44], self.deck.deck[32], self.deck.deck[7], self.deck.deck[34]])),
+                        (   [self.deck.deck[44], self.deck.deck[31]], # Paired card inside the straight.
+                            [self.deck.deck[45], self.deck.deck[30], self.deck.deck[2], self.deck.deck[46], self.deck.deck[16]],
+                            HandRanks.Straight([self.deck.deck[16], self.deck.deck[30], self.deck.deck[44], self.deck.deck[45], self.deck.deck[46]])) )
         for hand, board, ranking in known_values:
             result = HandRanking.rankHandHi(hand, board)
             self.assertIsInstance(result, HandRanks.Straight) # Verify that the correct object was returned.
@@ -162,7 +167,10 @@ class KnownValues(unittest.TestCase):
                             HandRanks.Trips([self.deck.deck[3], self.deck.deck[16], self.deck.deck[42], self.deck.deck[51], self.deck.deck[49]])),
                         (   [self.deck.deck[4], self.deck.deck[26]], # One card from hand participates.
                             [self.deck.deck[0], self.deck.deck[13], self.deck.deck[22], self.deck.deck[25], self.deck.deck[41]],
-                            HandRanks.Trips([self.deck.deck[0], self.deck.deck[13], self.deck.deck[26], self.deck.deck[25], self.deck.deck[22]])) )
+                            HandRanks.Trips([self.deck.deck[0], self.deck.deck[13], self.deck.deck[26], self.deck.deck[25], self.deck.deck[22]])),
+                        (   [self.deck.deck[7], self.deck.deck[20]], # Only one kicker above the trips.
+                            [self.deck.deck[46], self.deck.deck[11], self.deck.deck[2], self.deck.deck[29], self.deck.deck[26]],
+                            HandRanks.Trips([self.deck.deck[7], self.deck.deck[20], self.deck.deck[46], self.deck.deck[11], self.deck.deck[29]])) )
         for hand, board, ranking in known_values:
             result = HandRanking.rankHandHi(hand, board)
             self.assertIsInstance(result, HandRanks.Trips) # Verify that the correct object was returned.
@@ -219,5 +227,74 @@ class KnownValues(unittest.TestCase):
             self.assertIsInstance(result, HandRanks.HighCard) # Verify that the correct object was returned.
             self.assertEqual(result, ranking)
 
+    def test_compact_cards(self):
+        ''' rankHandHi and scoreHandHi should accept compact card ints.'''
+        hand, board = [11, 25], [51, 37, 17, 3, 48]
+        cards = [self.deck.deck[n] for n in hand + board]
+        expected = HandRanking.rankHandHi(cards[:2], cards[2:])
+        result = HandRanking.rankHandHi(hand, board)
+        self.assertIsInstance(result, HandRanks.TwoPair)
+        self.assertEqual(result, expected)
+        self.assertEqual(HandRanking.scoreHandHi(hand, board) >> 20, 3)
+
+    def test_keys(self):
+        ''' HandRanks should compare, hash and sort by their integer key.'''
+        pair = HandRanking.rankHandHi([11, 25], [50, 33, 17, 3, 49])
+        samePair = HandRanking.rankHandHi([24, 38], [11, 46, 17, 29, 49])
+        twoPair = HandRanking.rankHandHi([11, 25], [51, 37, 17, 3, 48])
+        self.assertEqual(pair, samePair)
+        self.assertEqual(hash(pair), hash(samePair))
+        self.assertEqual(len(set([pair, samePair, twoPair])), 2)
+        self.assertEqual(sorted([twoPair, pair]), [pair, twoPair])
+        self.assertTrue(pair <= samePair and twoPair >= pair)
+        self.assertEqual(twoPair.key >> HandRanks.KEYSHIFT, twoPair.rankValue)
+
+    def test_low(self):
+        ''' rankHandLow should find the best low for each set of low rules.'''
+        # (hand, board, straightsCount, eightOrBetter, acesLow, expected low)
+        known_values = (([51, 0], [14, 28, 3, 37, 11], False, True, True, "5-4-3-2-A low."),
+                        ([51, 0], [14, 28, 7, 37, 11], False, True, True, None),
+                        ([51, 0], [14, 28, 7, 37, 11], False, False, True, "9-4-3-2-A low."),
+                        ([51, 0], [14, 28, 41, 15], False, False, True, "Paired 4-4-3-2-A low."),
+                        ([44, 3], [28, 14, 39], True, False, False, "7-5-4-3-2 low."),
+                        ([51, 0], [27, 15, 42], True, False, False, "A-5-4-3-2 low."),
+                        ([43, 42], [41, 40, 39, 6], True, False, False, "8-5-4-3-2 low."),
+                        ([51, 0], [27, 15, 42, 4], True, False, True, "6-4-3-2-A low."))
+        for hand, board, straights, eight, acesLow, expected in known_values:
+            result = HandRanking.rankHandLow(hand, board, straights, eight, acesLow)
+            if expected is None:
+                self.assertIsNone(result)
+                self.assertEqual(HandRanking.scoreHandLow(hand, board, straights, eight, acesLow), 0)
+            else:
+                self.assertEqual(str(result), expected)
+                self.assertEqual(result.key, HandRanking.scoreHandLow(hand, board, straights, eight, acesLow))
+
+    def test_low_ordering(self):
+        ''' Better lows should have larger keys.'''
+        wheel = HandRanking.rankHandLow([51, 0], [14, 28, 3], False, False, True)
+        sixLow = HandRanking.rankHandLow([51, 0], [14, 28, 4], False, False, True)
+        paired = HandRanking.rankHandLow([51, 0], [14, 28, 13], False, False, True)
+        self.assertEqual(sorted([paired, wheel, sixLow]), [paired, sixLow, wheel])
+
+    def test_low_tables(self):
+        ''' The 6 and 7 card low tables should match checking every 5 cards.'''
+        rng = random.Random(4)
+        for straights, acesLow in ((False, True), (True, False), (True, True)):
+            ranks, flushes = LowEvaluator.getTables(straights, acesLow)
+            for i in range(2000):
+                cards = rng.sample(range(52), rng.choice((5, 6, 7)))
+                raw = LowEvaluator.bestSubset(cards, ranks, flushes)[0]
+                self.assertEqual(LowEvaluator.evaluateLow(cards, straights, acesLow),
+                                LowEvaluator.LOWBASE - raw)
+
+    def test_card_int_round_trip(self):
+        ''' Card.fromInt should invert Card.toInt for every card in the deck.'''
+        for i, card in enumerate(self.deck.deck):
+            self.assertEqual(card.toInt(), i)
+            self.assertEqual(str(PlayingCards.Card.fromInt(i)), str(card))
+            self.assertEqual(PlayingCards.intStr(i), str(card))
+        self.assertEqual(PlayingCards.maskCards(PlayingCards.cardMask([3, 40, 7])), [3, 7, 40])
+        self.assertEqual(PlayingCards.Deck(compact = True).deck, list(range(52)))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
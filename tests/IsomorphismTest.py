@@ -0,0 +1,57 @@
+#******************************************************************************
+# IsomorphismTest.py                                    Author: Curtis Smith
+# Written in Python 3.2
+#
+# Unit test class for Isomorphism.
+#******************************************************************************
+
+import Isomorphism
+import PlayingCards
+import itertools
+import unittest
+
+class KnownValues(unittest.TestCase):
+
+    def test_class_counts(self):
+        ''' Flops and turns should have the known number of classes, and the
+            multiplicities should add up to every board.'''
+        for size, classes, boards in ((1, 13, 52), (2, 169, 1326),
+                                      (3, 1755, 22100), (4, 16432, 270725)):
+            canonical = Isomorphism.canonicalBoards(size)
+            self.assertEqual(len(canonical), classes)
+            self.assertEqual(sum(m for b, m in canonical), boards)
+
+    def test_every_flop(self):
+        ''' Every flop should index to a class holding as many flops as its
+            multiplicity, and isomorphic flops to the same class.'''
+        counts = {}
+        for flop in itertools.combinations(range(52), 3):
+            index, count = Isomorphism.boardIndex(flop)
+            counts[index] = counts.get(index, 0) + 1
+        flops = Isomorphism.canonicalBoards(3)
+        self.assertEqual(len(counts), 1755)
+        for index, count in counts.items():
+            self.assertEqual(flops[index][1], count)
+            self.assertEqual(Isomorphism.canonical(flops[index][0]),
+                            flops[index][0])
+
+    def test_canonical(self):
+        ''' Relabelled boards and hands should have the same canonical form.'''
+        cards = [PlayingCards.Card(14, 4), PlayingCards.Card(13, 4),
+                PlayingCards.Card(2, 2)]
+        self.assertEqual(Isomorphism.canonical(cards), (11, 12, 13)) # KcAc2s
+        self.assertEqual(Isomorphism.canonical(cards),
+                        Isomorphism.canonical([24, 25, 39]))
+        self.assertEqual(Isomorphism.multiplicity(cards), 12)
+        self.assertEqual(Isomorphism.multiplicity([0, 14, 28]), 24)
+        # AcKc with 2s3s in the hole differs from AcKc with 2c3c.
+        self.assertNotEqual(Isomorphism.canonicalKey([12, 11], [13, 14]),
+                            Isomorphism.canonicalKey([12, 11], [0, 1]))
+        self.assertEqual(Isomorphism.canonicalKey([12, 11], [13, 14]),
+                        Isomorphism.canonicalKey([51, 50], [26, 27]))
+        self.assertEqual(Isomorphism.canonical([12, 11], [13, 14]),
+                        ((11, 12), (13, 14)))
+        self.assertEqual(Isomorphism.multiplicity([12, 11], [13, 14]), 12)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+#******************************************************************************
+# LevelsTest.py                                         Author: Curtis Smith
+# Written in Python 3.2
+#
+# Unit test class for Levels.
+#******************************************************************************
+
+import asyncio
+import BlindLevel
+import Levels
+import unittest
+
+class KnownValues(unittest.TestCase):
+
+    def setUpLevels(self, levelTime = 20):
+        ''' Three levels with a break after the first; the second level runs
+            for twice the usual time.'''
+        levels = Levels.Levels(levelTime, False)
+        levels.addLevel(BlindLevel.BlindLevel(2, 1, 0, 0))
+        levels.addBreak(levelTime / 2)
+        levels.addLevel(BlindLevel.BlindLevel(4, 2, 0, 0), levelTime * 2)
+        levels.addLevel(BlindLevel.BlindLevel(8, 4, 1, 0))
+        return levels
+
+    def test_schedule(self):
+        ''' Levels and breaks should start at the right times.'''
+        levels = self.setUpLevels()
+        # Level 1 0-20 mins, break 20-30, level 2 30-70, level 3 from 70.
+        for minutes, level, onBreak in [(0, 0, False), (19.9, 0, False),
+                                        (20, 1, True), (29, 1, True),
+                                        (30, 1, False), (69, 1, False),
+                                        (70, 2, False), (500, 2, False)]:
+            self.assertEqual(levels.levelAt(minutes * 60), level)
+            self.assertEqual(levels.onBreak(minutes * 60), onBreak)
+        self.assertEqual(levels.nextChange(25 * 60), 30 * 60)
+        self.assertIsNone(levels.nextChange(80 * 60))
+        self.assertEqual(levels.blindLevel(75 * 60).bigBlind, 8)
+        levels.setLevel(75 * 60)
+        self.assertEqual(levels.currentLevel, 2)
+        self.assertEqual(levels.blindLevel().ante, 1)
+
+    def test_break_edges(self):
+        ''' A break can't come before the first level, and one after the
+            last level should be played before the last level carries on.'''
+        levels = Levels.Levels(20, False)
+        self.assertRaises(ValueError, levels.addBreak, 10)
+        levels = self.setUpLevels()
+        levels.addBreak(15)
+        # Level 3 70-90 mins, break 90-105, level 3 again from 105.
+        for minutes, onBreak in [(89, False), (90, True), (104, True),
+                                (105, False), (500, False)]:
+            self.assertEqual(levels.levelAt(minutes * 60), 2)
+            self.assertEqual(levels.onBreak(minutes * 60), onBreak)
+        self.assertEqual(levels.nextChange(95 * 60), 105 * 60)
+        self.assertIsNone(levels.nextChange(105 * 60))
+
+    def test_pause(self):
+        ''' Time spent paused shouldn't count towards the levels.'''
+        now = [0.0]
+        clock = Levels.TournamentClock(self.setUpLevels(), lambda: now[0])
+        clock.start()
+        now[0] = 600.0
+        clock.pause()
+        now[0] = 5000.0
+        self.assertEqual(clock.elapsed(), 600)
+        clock.resume()
+        now[0] = 5700.0
+        self.assertEqual(clock.elapsed(), 1300)
+        self.assertTrue(clock.onBreak())
+        self.assertEqual(clock.timeLeft(), 500)
+
+    def test_callbacks(self):
+        ''' Listeners should hear about every level and break as it starts.
+            '''
+        levels = self.setUpLevels(0.0005) # 30ms levels.
+        events = []
+        async def run():
+            clock = Levels.TournamentClock(levels)
+            clock.addListener(lambda clock, level, onBreak:
+                                events.append((level, onBreak)))
+            clock.schedule()
+            clock.start()
+            await asyncio.sleep(0.3)
+            clock.cancel()
+        asyncio.run(run())
+        self.assertEqual(events, [(1, True), (1, False), (2, False)])
+        self.assertEqual(levels.currentLevel, 2)
+
+if __name__ == '__main__':
+    unittest.main()
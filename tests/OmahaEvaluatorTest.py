@@ -0,0 +1,49 @@
+#******************************************************************************
+# OmahaEvaluatorTest.py                                 Author: Curtis Smith
+# Written in Python 3.2
+#
+# Unit test class for OmahaEvaluator.
+#******************************************************************************
+
+import HandEvaluator
+import HandRanking
+import HandRanks
+import LowEvaluator
+import OmahaEvaluator
+import itertools
+import random
+import unittest
+
+class KnownValues(unittest.TestCase):
+
+    def test_must_use_two_hole_cards(self):
+        ''' A four card flush on the board with one suited hole card is no
+            flush in Omaha.'''
+        hole = [51, 0, 13, 26]              # Ah 2c 2s 2d
+        board = [40, 42, 44, 46, 27]        # 3h 5h 7h 9h 3d
+        result = HandRanking.rankOmahaHi(hole, board)
+        self.assertIsInstance(result, HandRanks.TwoPair)
+        self.assertEqual(HandRanking.scoreOmahaHi(hole, board), result.key)
+        # A2 with 357 on the board still makes a seven low.
+        self.assertEqual(HandRanking.scoreOmahaLow(hole, board),
+                        LowEvaluator.evaluateLow([51, 0, 40, 42, 44], False, True, True))
+        self.assertEqual(HandRanking.scoreOmahaLow([50, 49, 48, 47], board), 0)
+
+    def test_matches_brute_force(self):
+        ''' OmahaBoard should agree with scoring all 2 + 3 card hands.'''
+        rng = random.Random(6)
+        for i in range(1500):
+            size = rng.choice((4, 5))
+            cards = rng.sample(range(52), size + 5)
+            hole, board = cards[:size], cards[size:]
+            omaha = OmahaEvaluator.OmahaBoard(board)
+            hands = [list(p + t) for p in itertools.combinations(hole, 2)
+                    for t in itertools.combinations(board, 3)]
+            self.assertEqual(omaha.scoreHi(hole),
+                            max(HandEvaluator.evaluate(h) for h in hands))
+            self.assertEqual(omaha.scoreLow(hole),
+                            max(LowEvaluator.evaluateLow(h, False, True, True)
+                                for h in hands))
+
+if __name__ == '__main__':
+    unittest.main()
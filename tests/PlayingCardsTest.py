@@ -0,0 +1,52 @@
+#******************************************************************************
+# PlayingCardsTest.py                                   Author: Curtis Smith
+# Written in Python 3.2
+#
+# Unit test class for PlayingCards.
+#******************************************************************************
+
+import PlayingCards
+import unittest
+
+class KnownValues(unittest.TestCase):
+
+    def test_seeded_decks_repeat(self):
+        ''' Decks with the same seed should deal the same cards.'''
+        for lazy in (False, True):
+            first = PlayingCards.Deck(compact = True, seed = 9, lazy = lazy)
+            second = PlayingCards.Deck(compact = True, seed = 9, lazy = lazy)
+            first.shuffle()
+            second.shuffle()
+            self.assertEqual(first.deal(20), second.deal(20))
+            self.assertEqual(first.deal(), second.deal())
+
+    def test_bulk_deal(self):
+        ''' deal(n) should deal n different cards and leave the rest.'''
+        deck = PlayingCards.Deck(compact = True, seed = 4, lazy = True)
+        cards = deck.deal(23)
+        self.assertEqual(len(cards), 23)
+        self.assertEqual(len(deck.deck), 29)
+        self.assertEqual(sorted(cards + deck.deck), list(range(52)))
+
+    def test_compact_aces_low(self):
+        ''' A compact deck can't have low aces.'''
+        self.assertRaises(ValueError, PlayingCards.Deck, acesLow = True,
+                        compact = True)
+
+    def test_deal_from_end(self):
+        ''' An unshuffled deck should deal from the end of the deck.'''
+        deck = PlayingCards.Deck()
+        self.assertEqual(str(deck.deal()), "Ah")
+        self.assertEqual([str(c) for c in deck.deal(2)], ["Kh", "Qh"])
+
+    def test_deal_reshuffles_discards(self):
+        ''' Dealing from an empty deck should shuffle the discards back in.'''
+        deck = PlayingCards.Deck(compact = True, seed = 2, lazy = True)
+        cards = deck.deal(52)
+        self.assertEqual(deck.deck, [])
+        deck.discard(cards[0])
+        self.assertEqual(deck.deal(), cards[0])
+        self.assertIs(deck.deal(), False)
+
+if __name__ == '__main__':
+    unittest.main()
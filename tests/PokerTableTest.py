@@ -0,0 +1,152 @@
+#******************************************************************************
+# PokerTableTest.py                                     Author: Curtis Smith
+# Written in Python 3.2
+#
+# Unit test class for PokerTable.
+#******************************************************************************
+
+import HandEvaluator
+import HandRanking
+import OmahaEvaluator
+import PlayingCards
+import PokerTable
+import unittest
+
+class KnownValues(unittest.TestCase):
+
+    def test_incremental_score(self):
+        ''' A hand's running score should match ranking all of its cards on
+            each street.'''
+        table = PokerTable.Table(3)
+        table.deck = PlayingCards.Deck(seed = 11)
+        table.deck.shuffle()
+        for seat in table.seats:
+            seat.player = "player"
+        table.resetState()
+        for seat in table.seats:
+            seat.hand.addCard(table.deck.deal())
+            seat.hand.addCard(table.deck.deal())
+            self.assertIsNone(seat.hand.currentScore())
+        for street in (3, 1, 1):
+            table.dealBoard(street)
+            for seat in table.seats:
+                expected = HandRanking.rankHandHi(seat.hand.cards, table.board)
+                self.assertEqual(seat.hand.currentScore(), expected.key)
+
+    def test_no_running_score_for_omaha(self):
+        ''' Hands of more than 2 hole cards shouldn't keep a running score
+            once there is a board, but should without one (ie. draw).'''
+        hand = PokerTable.Hand()
+        for c in (12, 25, 0, 14):
+            hand.addCard(c)
+        for c in (38, 51, 1):
+            hand.addBoardCard(c)
+        self.assertIsNone(hand.state)
+        self.assertIsNone(hand.currentScore())
+        draw = PokerTable.Hand()
+        for c in (12, 25, 38, 0, 1):
+            draw.addCard(c)
+        self.assertEqual(HandEvaluator.category(draw.currentScore()), 4)
+
+    def test_hand_state_copy(self):
+        ''' Copies of a HandState should be independent.'''
+        state = HandEvaluator.HandState([12, 11, 10, 9])
+        other = state.copy()
+        other.add(8)
+        self.assertIsNone(state.score())
+        self.assertEqual(HandEvaluator.category(other.score()), 9)
+
+    def test_move_button(self):
+        ''' moveButton should skip empty seats and, in cash games, seats that
+            are sitting out.'''
+        table = PokerTable.Table(4, cashTable = True)
+        for i in (0, 2, 3):
+            table.seats[i].addPlayer("player", 100)
+        table.seats[2].sittingOut = True
+        table.moveButton()
+        self.assertEqual(table.button, 3)
+        table.moveButton()
+        self.assertEqual(table.button, 0)
+
+    def setUpShowdown(self, hands, board, wagers, folded = ()):
+        ''' Builds a table with the given hole cards (compact card ints),
+            board and wagers, ready for a showdown.'''
+        table = PokerTable.Table(len(hands))
+        for i in range(len(hands)):
+            seat = table.seats[i]
+            seat.addPlayer("player", 0)
+            seat.folded = i in folded
+            seat.wagered = wagers[i]
+            for card in hands[i]:
+                seat.hand.addCard(card)
+        table.board = list(board)
+        table.pot = float(sum(wagers))
+        return table
+
+    def test_side_pots(self):
+        ''' Side pots should be built from the wagers, with folded chips
+            going into the pots but not winning them.'''
+        # Seat 1 is all-in for 10, seat 2 for 30, seat 4 folded after 20.
+        table = self.setUpShowdown([[12, 25], [11, 24], [0, 13], [5, 6]],
+                                    [2, 16, 30, 44, 8], [10, 30, 50, 20],
+                                    folded = (3,))
+        pots = table.buildPots()
+        self.assertEqual([p.amount for p in pots], [40, 50, 20])
+        self.assertEqual([p.seats for p in pots], [[0, 1, 2], [1, 2], [2]])
+        table.showdown()
+        # Seat 1 (aces) wins the main pot, seat 2 (kings) the side pot and
+        # seat 3 gets its unmatched 20 back.
+        self.assertEqual([s.chips for s in table.seats], [40, 50, 20, 0])
+        self.assertEqual(table.pot, 0.0)
+
+    def test_everyone_folded(self):
+        ''' Chips wagered only by folded seats should go to the seats still in
+            the hand, or back to the seats that wagered them.'''
+        table = self.setUpShowdown([[12, 25], [11, 24], [0, 13]],
+                                    [2, 16, 30, 44, 8], [0, 10, 20],
+                                    folded = (1, 2))
+        pots = table.buildPots()
+        self.assertEqual([(p.amount, p.seats) for p in pots], [(30, [0])])
+        table.showdown()
+        self.assertEqual([s.chips for s in table.seats], [30, 0, 0])
+        table = self.setUpShowdown([[12, 25], [11, 24]], [2, 16, 30, 44, 8],
+                                    [10, 30], folded = (0, 1))
+        table.pot += 4 # Dead money.
+        table.showdown()
+        self.assertEqual([s.chips for s in table.seats], [11, 33])
+        self.assertEqual(table.pot, 0.0)
+
+    def test_split_odd_chip(self):
+        ''' A split pot's odd chip should go to the first winner left of the
+            button.'''
+        # Both play the board's straight; seat 3 folded a single chip.
+        table = self.setUpShowdown([[0, 13], [1, 14], [6, 19]],
+                                    [8, 22, 36, 50, 25], [10, 10, 1],
+                                    folded = (2,))
+        table.button = 0
+        pots = table.showdown()
+        self.assertEqual(pots[0].hiWinners, [1, 0])
+        self.assertEqual([s.chips for s in table.seats], [10, 11, 0])
+
+    def test_hi_lo_split(self):
+        ''' Omaha hi/lo pots should be split between the best high and the
+            best low, with the high scooping if there is no low.'''
+        hands = [[12, 25, 1, 2], [11, 24, 10, 23], [0, 14, 3, 4]]
+        board = [38, 29, 5, 9, 36]
+        table = self.setUpShowdown(hands, board, [20, 20, 21])
+        omaha = OmahaEvaluator.OmahaBoard(board)
+        pots = table.showdown(lambda h, b: omaha.scoreHi(h),
+                            lambda h, b: omaha.scoreLow(h))
+        self.assertEqual(pots[0].hiWinners, [0])
+        self.assertEqual(pots[0].lowWinners, [2])
+        self.assertEqual([s.chips for s in table.seats], [30, 0, 31])
+        board = [38, 9, 48, 49, 47] # Only one low card.
+        table = self.setUpShowdown(hands, board, [20, 20, 20])
+        omaha = OmahaEvaluator.OmahaBoard(board)
+        pots = table.showdown(lambda h, b: omaha.scoreHi(h),
+                            lambda h, b: omaha.scoreLow(h))
+        self.assertEqual(pots[0].lowWinners, [])
+        self.assertEqual([s.chips for s in table.seats], [60, 0, 0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#******************************************************************************
+# PreflopCacheTest.py                                   Author: Curtis Smith
+# Written in Python 3.2
+#
+# Unit test class for PreflopCache.
+#******************************************************************************
+
+import os
+import PreflopCache
+import tempfile
+import unittest
+
+class KnownValues(unittest.TestCase):
+
+    def test_classes(self):
+        ''' Every combo should belong to exactly one class, named as usual.'''
+        counts = [0] * PreflopCache.CLASSES
+        for a in range(52):
+            for b in range(a + 1, 52):
+                counts[PreflopCache.handClass(a, b)] += 1
+        for index in range(PreflopCache.CLASSES):
+            combos = PreflopCache.classCombos(index)
+            self.assertEqual(len(combos), counts[index])
+            for combo in combos:
+                self.assertEqual(PreflopCache.handClass(*combo), index)
+        self.assertEqual(PreflopCache.className(0), "AA")
+        self.assertEqual(PreflopCache.className(1), "AKs")
+        self.assertEqual(PreflopCache.className(13), "AKo")
+        self.assertEqual(PreflopCache.className(168), "22")
+        self.assertEqual(PreflopCache.handClass(12, 25), 0)  # AcAs
+        self.assertEqual(PreflopCache.handClass(5, 43), 111) # 7c6h
+        self.assertEqual(PreflopCache.className(111), "76o")
+
+    def test_equities(self):
+        ''' Estimated equities should be close to the known values.'''
+        # AA vs KK is about 82%, AA vs a random hand about 85%.
+        self.assertAlmostEqual(PreflopCache.matchupEquity(0, 14, 4000, 1),
+                                0.82, delta = 0.03)
+        self.assertAlmostEqual(PreflopCache.randomEquity(0, 1, 4000, 1),
+                                0.85, delta = 0.03)
+
+    def test_file(self):
+        ''' A written cache should map back to the same values.'''
+        matchups = [[(a * 7 + b) % 100 / 100.0 for b in range(169)]
+                    for a in range(169)]
+        multiway = [[1.0 / (n + 1) for n in range(1, 9)] for a in range(169)]
+        path = os.path.join(tempfile.mkdtemp(), "preflop.dat")
+        PreflopCache.write(path, matchups, multiway, 10)
+        self.assertEqual(os.path.getsize(path), PreflopCache.HEADER.size +
+                        4 * 169 * (169 + 8))
+        cache = PreflopCache.load(path)
+        self.assertIs(PreflopCache.load(path), cache)
+        self.assertEqual(cache.trials, 10)
+        self.assertAlmostEqual(cache.equity(3, 5), 0.26, places = 6)
+        self.assertAlmostEqual(cache.handEquity([12, 25], [11, 24]),
+                                matchups[0][14], places = 6)
+        self.assertAlmostEqual(cache.vsRandom(40, 3), 0.25, places = 6)
+        shares = cache.multiwayEquity([0, 14, 14])
+        self.assertAlmostEqual(sum(shares), 1.0)
+        self.assertAlmostEqual(shares[1], shares[2])
+        cache.close()
+        del PreflopCache.CACHES[path]
+        os.remove(path)
+
+    def test_byte_order(self):
+        ''' A cache written with the other byte order should be refused.'''
+        path = os.path.join(tempfile.mkdtemp(), "preflop.dat")
+        PreflopCache.write(path, [[0.5] * 169] * 169, [[0.5] * 8] * 169, 1)
+        with open(path, "r+b") as f:
+            f.seek(PreflopCache.HEADER.size - 4)
+            order = f.read(4)
+            f.seek(PreflopCache.HEADER.size - 4)
+            f.write(order[::-1])
+        self.assertRaises(ValueError, PreflopCache.PreflopCache, path)
+        os.remove(path)
+
+    def test_short_file(self):
+        ''' Empty, truncated and padded caches should be refused.'''
+        path = os.path.join(tempfile.mkdtemp(), "preflop.dat")
+        PreflopCache.write(path, [[0.5] * 169] * 169, [[0.5] * 8] * 169, 1)
+        with open(path, "rb") as f:
+            data = f.read()
+        for length in (0, 10, PreflopCache.HEADER.size, len(data) - 4):
+            with open(path, "wb") as f:
+                f.write(data[:length])
+            self.assertRaises(ValueError, PreflopCache.PreflopCache, path)
+        with open(path, "wb") as f:
+            f.write(data + data[-4:])
+        self.assertRaises(ValueError, PreflopCache.PreflopCache, path)
+        os.remove(path)
+
+if __name__ == '__main__':
+    unittest.main()
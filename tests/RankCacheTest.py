@@ -0,0 +1,86 @@
+#******************************************************************************
+# RankCacheTest.py                                      Author: Curtis Smith
+# Written in Python 3.2
+#
+# Unit test class for RankCache.
+#******************************************************************************
+
+import HandRanking
+import PlayingCards
+import RankCache
+import random
+import threading
+import unittest
+
+class KnownValues(unittest.TestCase):
+
+    def test_card_key(self):
+        ''' Keys should ignore order and card form but not low aces.'''
+        cards = [PlayingCards.Card(14, 4), PlayingCards.Card(2, 1),
+                PlayingCards.Card(10, 2)]
+        ints = [PlayingCards.toInt(c) for c in cards]
+        self.assertEqual(RankCache.cardKey(cards),
+                        RankCache.cardKey(list(reversed(ints))))
+        self.assertNotEqual(RankCache.cardKey([PlayingCards.Card(1, 4)]),
+                            RankCache.cardKey([PlayingCards.Card(14, 4)]))
+        keys = set(RankCache.cardKey([c]) for c in range(52))
+        self.assertEqual(len(keys), 52)
+
+    def test_counters_and_eviction(self):
+        ''' Hits, misses and evictions should follow the policy.'''
+        for policy, kept in ((RankCache.LRU, [0, 2]), (RankCache.FIFO, [1, 2])):
+            cache = RankCache.RankCache(sum, maxSize = 2, policy = policy)
+            self.assertEqual(cache.get([0]), 0)
+            self.assertEqual(cache.get([1]), 1)
+            cache.get([0])                      # A hit.
+            cache.get([2])                      # Evicts one of them.
+            self.assertEqual((cache.hits, cache.misses, cache.evictions),
+                            (1, 3, 1))
+            hits = cache.hits
+            for c in kept:
+                cache.get([c])
+            self.assertEqual(cache.hits, hits + 2)
+            self.assertAlmostEqual(cache.hitRate(), 3 / 6.0)
+            cache.clear()
+            self.assertEqual((len(cache), cache.hits), (0, 0))
+        self.assertRaises(ValueError, RankCache.RankCache, sum, 0)
+        self.assertRaises(ValueError, RankCache.RankCache, sum, 10, "mru")
+
+    def test_hand_ranking(self):
+        ''' rankHandHi should give the same ranks with the cache enabled.'''
+        rng = random.Random(3)
+        hands = [rng.sample(range(52), 7) for i in range(50)]
+        expected = [HandRanking.rankHandHi(h[:2], h[2:]).key for h in hands]
+        cache = HandRanking.enableCache(maxSize = 100)
+        try:
+            for n in range(2):
+                for hand, key in zip(hands, expected):
+                    self.assertEqual(HandRanking.rankHandHi(hand[2:],
+                                    hand[:2]).key, key)
+            self.assertEqual((cache.misses, cache.hits), (50, 50))
+        finally:
+            HandRanking.disableCache()
+        self.assertIsNone(HandRanking.RANK_CACHE)
+
+    def test_threads(self):
+        ''' Threads sharing a cache should get the right results.'''
+        cache = RankCache.RankCache(sum, maxSize = 16)
+        errors = []
+        def work(seed):
+            rng = random.Random(seed)
+            for i in range(2000):
+                cards = rng.sample(range(40), 3)
+                if cache.get(cards) != sum(cards):
+                    errors.append(cards)
+        threads = [threading.Thread(target = work, args = (n,))
+                    for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(cache.hits + cache.misses, 8000)
+        self.assertLessEqual(len(cache), 16)
+
+if __name__ == '__main__':
+    unittest.main()
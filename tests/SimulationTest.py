@@ -0,0 +1,45 @@
+#******************************************************************************
+# SimulationTest.py                                     Author: Curtis Smith
+# Written in Python 3.2
+#
+# Unit test class for Simulation.
+#******************************************************************************
+
+import Equity
+import Simulation
+import unittest
+
+class KnownValues(unittest.TestCase):
+    ranges = [[[12, 25]], [[11, 24]]] # AcAs vs KcKs
+
+    def test_reproducible_across_workers(self):
+        ''' The same seed and chunk count should give the same tallies with any
+            number of workers.'''
+        single = Simulation.SimulationRunner(1, seed = 3, chunks = 4)
+        pooled = Simulation.SimulationRunner(2, seed = 3, chunks = 4)
+        first = single.equity(self.ranges, 2000)
+        second = pooled.equity(self.ranges, 2000)
+        self.assertEqual(first.trials, 2000)
+        self.assertEqual(first.wins, second.wins)
+        self.assertEqual(first.ties, second.ties)
+
+    def test_exact_parts_merge(self):
+        ''' Splitting exact enumeration should give the unsplit result.'''
+        board = [26, 44, 33]
+        whole = Equity.exactEquity(self.ranges[0] + self.ranges[1], board)
+        runner = Simulation.SimulationRunner(2, chunks = 3)
+        split = runner.exactEquity(self.ranges[0] + self.ranges[1], board)
+        self.assertEqual(split.trials, whole.trials)
+        self.assertEqual(split.wins, whole.wins)
+        self.assertEqual(split.ties, whole.ties)
+
+    def test_hand_distribution(self):
+        ''' handDistribution should count every dealt hand once.'''
+        runner = Simulation.SimulationRunner(1, seed = 1, chunks = 2)
+        counts = runner.handDistribution(5, 1000)
+        self.assertEqual(sum(counts), 1000)
+        self.assertEqual(counts[0], 0)
+        self.assertGreater(counts[2], counts[3])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+#******************************************************************************
+# TableBatchTest.py                                     Author: Curtis Smith
+# Written in Python 3.2
+#
+# Unit test class for TableBatch.
+#******************************************************************************
+
+import HandEvaluator
+import PlayingCards
+import PokerTable
+import unittest
+
+try:
+    import numpy
+    import TableBatch
+except ImportError:
+    numpy = None
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class KnownValues(unittest.TestCase):
+
+    def test_round_trip(self):
+        ''' Tables converted to a batch and back should be unchanged.'''
+        tables = []
+        for n in range(3):
+            table = PokerTable.Table(4)
+            table.deck = PlayingCards.Deck(compact = True, seed = n)
+            table.deck.shuffle()
+            for i, seat in enumerate(table.seats[:3]):
+                seat.addPlayer("player", 100 + i)
+            table.resetState()
+            for seat in table.seats[:3]:
+                seat.hand.addCard(table.deck.deal())
+                seat.hand.addCard(table.deck.deal())
+                seat.wagered = 2
+            table.seats[1].sittingOut = True
+            table.dealBoard(3)
+            table.button = n
+            table.pot = 6.0
+            tables.append(table)
+        before = [[(s.chips, s.wagered, s.folded, s.sittingOut,
+                    list(s.hand.cards), s.hand.currentScore())
+                    for s in t.seats] + [t.board, t.button, t.pot]
+                    for t in tables]
+        batch = TableBatch.TableBatch.fromTables(tables)
+        batch.toTables(tables)
+        after = [[(s.chips, s.wagered, s.folded, s.sittingOut,
+                    list(s.hand.cards), s.hand.currentScore())
+                    for s in t.seats] + [t.board, t.button, t.pot]
+                    for t in tables]
+        self.assertEqual(before, after)
+
+    def test_decks_rebuilt(self):
+        ''' Cards dealt by a batch should leave the tables' decks, and be
+            written back as Card objects to tables whose decks hold them.'''
+        tables = []
+        for compact in (True, False):
+            table = PokerTable.Table(3)
+            table.deck = PlayingCards.Deck(compact = compact, seed = 1)
+            for seat in table.seats:
+                seat.addPlayer("player", 100)
+            table.resetState()
+            tables.append(table)
+        batch = TableBatch.TableBatch.fromTables(tables, seed = 2)
+        batch.newHand()
+        for street in range(3):
+            batch.advanceStreet()
+        batch.toTables(tables)
+        for table, cardType in zip(tables, (int, PlayingCards.Card)):
+            held = list(table.board)
+            for seat in table.seats:
+                held += seat.hand.cards
+            self.assertEqual(len(held), 11)
+            cards = [PlayingCards.toInt(c) for c in held + table.deck.deck]
+            self.assertEqual(sorted(cards), list(range(52)))
+            for c in held + table.deck.deck:
+                self.assertIsInstance(c, cardType)
+            self.assertEqual(table.seats[0].hand.currentScore(),
+                            HandEvaluator.evaluate(
+                            [PlayingCards.toInt(c) for c in
+                            table.seats[0].hand.cards + table.board]))
+
+    def test_vectorized_hand(self):
+        ''' A batch should deal distinct cards at every table, keep the chips
+            in play and score hands like HandEvaluator.'''
+        batch = TableBatch.TableBatch(200, 9, seed = 4)
+        batch.occupied[:] = True
+        batch.occupied[:, 8] = False
+        batch.chips[:] = 50
+        batch.chips[:, 0] = 1
+        batch.newHand()
+        batch.post(2)
+        batch.fold(numpy.arange(9) == 3)
+        for street in range(3):
+            batch.advanceStreet()
+            batch.call()
+        self.assertEqual(batch.boardSize, 5)
+        self.assertTrue((batch.hole[:, 8] == TableBatch.NOCARD).all())
+        self.assertTrue(numpy.allclose(batch.chips.sum(axis = 1) + batch.pot,
+                                        8 * 50 + 1))
+        self.assertEqual(batch.chips[0, 0], 0)
+        scores = batch.scores()
+        for t in range(200):
+            cards = batch.hole[t].ravel().tolist() + batch.board[t].tolist()
+            cards = [c for c in cards if c != TableBatch.NOCARD]
+            self.assertEqual(len(set(cards)), len(cards))
+            for s in range(9):
+                if batch.folded[t, s]:
+                    self.assertEqual(scores[t, s], 0)
+                else:
+                    self.assertEqual(scores[t, s], HandEvaluator.evaluate(
+                        batch.hole[t, s].tolist() + batch.board[t].tolist()))
+
+if __name__ == '__main__':
+    unittest.main()
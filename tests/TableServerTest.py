@@ -0,0 +1,183 @@
+#******************************************************************************
+# TableServerTest.py                                    Author: Curtis Smith
+# Written in Python 3.2
+#
+# Unit test class for TableServer.
+#******************************************************************************
+
+import asyncio
+import BlindLevel
+import GameEngine
+import Levels
+import PokerTable
+import TableServer
+import unittest
+
+class KnownValues(unittest.TestCase):
+
+    def makeEngine(self, tableNum, seats = 2):
+        ''' Returns an engine for an empty table with 1/2 blinds.'''
+        levels = Levels.Levels(20, True)
+        levels.addLevel(BlindLevel.BlindLevel(2, 1, 0, 0))
+        table = PokerTable.Table(seats, tableNum, cashTable = True)
+        return GameEngine.GameEngine(table, levels, seed = tableNum)
+
+    def test_queued_actions(self):
+        ''' Seats with queues should act through them, alongside seats
+            played by policies.'''
+        turns = []
+        async def run():
+            manager = TableServer.TableManager(actionTimeout = 1.0)
+            engine = self.makeEngine(1)
+            manager.addTable(engine)
+            def onTurn(tableNum, seat, toCall, minRaise, turn):
+                turns.append((tableNum, seat))
+                manager.trySubmit(tableNum, seat, GameEngine.CALL)
+            manager.sitDown(1, 0, "remote", 100, onTurn)
+            manager.sitDown(1, 1, "bot", 100)
+            manager.start()
+            while engine.hands < 5:
+                await asyncio.sleep(0.001)
+            await manager.stop()
+            return manager, engine
+        manager, engine = asyncio.run(run())
+        self.assertTrue(turns)
+        self.assertEqual(set(turns), set([(1, 0)]))
+        self.assertEqual(manager.timeouts, 0)
+        self.assertEqual(sum(s.chips for s in engine.table.seats), 200)
+
+    def test_timeout(self):
+        ''' A seat that doesn't act in time should fold to a bet.'''
+        async def run():
+            manager = TableServer.TableManager(actionTimeout = 0.01)
+            engine = self.makeEngine(1)
+            manager.addTable(engine)
+            manager.sitDown(1, 0, "asleep", 100, lambda *args: None)
+            manager.sitDown(1, 1, "bot", 100)
+            manager.start()
+            while engine.hands < 1:
+                await asyncio.sleep(0.005)
+            await manager.stop()
+            return manager, engine
+        manager, engine = asyncio.run(run())
+        self.assertGreaterEqual(manager.timeouts, 1)
+        self.assertLess(engine.table.seats[0].chips, 100)
+
+    def test_stale_action(self):
+        ''' An action sent after a turn timed out shouldn't be used for the
+            seat's next turn.'''
+        async def run():
+            manager = TableServer.TableManager(actionTimeout = 0.01)
+            engine = self.makeEngine(1)
+            manager.addTable(engine)
+            def onTurn(tableNum, seat, toCall, minRaise, turn):
+                # Answers each turn too late (during the next), with a raise.
+                loop = asyncio.get_running_loop()
+                loop.call_later(0.015, manager.trySubmit, tableNum, seat, 50,
+                                turn)
+            manager.sitDown(1, 0, "slow", 100, onTurn)
+            manager.sitDown(1, 1, "bot", 100)
+            manager.start()
+            while engine.hands < 3:
+                await asyncio.sleep(0.005)
+            await manager.stop()
+            return manager, engine
+        manager, engine = asyncio.run(run())
+        # Every late raise was dropped, so the seat only ever checked or
+        # folded and lost at most a blind a hand.
+        self.assertGreaterEqual(manager.timeouts, 3)
+        self.assertEqual(sum(s.chips for s in engine.table.seats) +
+                        engine.table.pot, 200) # Stopped mid-hand.
+        self.assertGreaterEqual(engine.table.seats[0].chips, 94)
+
+    def test_reuse_seat(self):
+        ''' A seat stood up from should be emptied after the hand and dealt
+            in again once someone else sits down.'''
+        async def run():
+            manager = TableServer.TableManager()
+            engine = self.makeEngine(1)
+            manager.addTable(engine)
+            manager.sitDown(1, 0, "a", 100)
+            manager.sitDown(1, 1, "b", 100)
+            manager.start()
+            while engine.hands < 2:
+                await asyncio.sleep(0.001)
+            manager.standUp(1, 0)
+            hands = engine.hands
+            while engine.table.seats[0].player is not None:
+                await asyncio.sleep(0.001)
+            self.assertRaises(ValueError, manager.sitDown, 1, 1, "d", 100)
+            self.assertEqual(engine.table.seats[0].chips, 0)
+            manager.sitDown(1, 0, "c", 100)
+            while engine.hands < hands + 3:
+                await asyncio.sleep(0.001)
+            await manager.stop()
+            return engine
+        engine = asyncio.run(run())
+        seat = engine.table.seats[0]
+        self.assertEqual(seat.player, "c")
+        self.assertFalse(seat.sittingOut)
+
+    def test_stand_up_on_check(self):
+        ''' A seat that stands up with nothing to call should fold, leaving
+            the pot to the others.'''
+        left = []
+        async def run():
+            manager = TableServer.TableManager(actionTimeout = 0.01)
+            engine = self.makeEngine(7)
+            manager.addTable(engine)
+            def onTurn(tableNum, seat, toCall, minRaise, turn):
+                if toCall:
+                    manager.trySubmit(tableNum, seat, GameEngine.CALL)
+                elif not left:
+                    left.append(engine.table.seats[seat].chips)
+                    manager.standUp(tableNum, seat)
+            manager.sitDown(7, 0, "leaving", 100, onTurn)
+            manager.sitDown(7, 1, "bot", 100)
+            manager.start()
+            while engine.hands < 1:
+                await asyncio.sleep(0.001)
+            await manager.stop()
+            return engine
+        engine = asyncio.run(run())
+        seats = engine.table.seats
+        self.assertIsNone(seats[0].player)
+        self.assertEqual(seats[1].chips, 200 - left[0])
+
+    def test_backpressure(self):
+        ''' A full action queue should refuse more actions, and submit
+            should wait until there is room.'''
+        async def run():
+            manager = TableServer.TableManager(queueSize = 1)
+            manager.addTable(self.makeEngine(1))
+            queue = manager.sitDown(1, 0, "remote", 100, lambda *args: None)
+            self.assertTrue(manager.trySubmit(1, 0, GameEngine.CALL))
+            self.assertFalse(manager.trySubmit(1, 0, GameEngine.CALL))
+            waiting = asyncio.ensure_future(manager.submit(1, 0, 10))
+            await asyncio.sleep(0)
+            self.assertFalse(waiting.done())
+            self.assertEqual(queue.get_nowait(), (0, GameEngine.CALL))
+            await waiting
+            self.assertEqual(queue.get_nowait(), (0, 10))
+        asyncio.run(run())
+
+    def test_idle_tables(self):
+        ''' Tables without enough players should wait without dealing.'''
+        async def run():
+            manager = TableServer.TableManager()
+            engines = [self.makeEngine(n) for n in range(1, 501)]
+            for engine in engines:
+                manager.addTable(engine)
+            manager.start()
+            await asyncio.sleep(0.05)
+            manager.sitDown(7, 0, "bot", 100)
+            manager.sitDown(7, 1, "bot", 100)
+            while engines[6].hands < 3:
+                await asyncio.sleep(0.001)
+            await manager.stop()
+            return engines
+        engines = asyncio.run(run())
+        self.assertEqual(sum(1 for e in engines if e.hands), 1)
+
+if __name__ == '__main__':
+    unittest.main()